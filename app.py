@@ -3,6 +3,7 @@ import sqlite3
 from flask import Flask, jsonify, request # type: ignore
 from flask_cors import CORS   # type: ignore
 from dotenv import load_dotenv
+from bookmark_import import TooManyBookmarks, import_bookmarks, parse_bulk_request
 
 # Load environment variables from .env file
 load_dotenv()
@@ -54,6 +55,25 @@ def handle_bookmarks():
     
     conn.close()
 
+@app.route('/api/bookmarks/bulk', methods=['POST'])
+def import_bookmarks_bulk():
+    """Save many bookmarks at once: a JSON array or NDJSON of {url, title}, in one transaction."""
+    try:
+        entries = parse_bulk_request(request)
+    except TooManyBookmarks as e:
+        return jsonify({'error': str(e)}), 413
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    conn = sqlite3.connect('bookmarks.db')
+    try:
+        results, counts = import_bookmarks(conn, entries, require_title=False)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        conn.close()
+    return jsonify({**counts, 'results': results}), 201 if counts['created'] else 200
+
 if __name__ == '__main__':
     init_db()
     app.run(debug=True)
\ No newline at end of file
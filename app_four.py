@@ -1,11 +1,16 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 import sqlite3
 import requests
+from requests.adapters import HTTPAdapter
+import concurrent.futures
+import threading
 import os
 from dotenv import load_dotenv
 import json
 import re
+from serp_cache import SerpQueryCache
+from job_queue import JobQueue
 
 load_dotenv()
 
@@ -14,6 +19,17 @@ if not SERP_API_KEY:
     print("[ERROR] SERP_API_KEY not set in .env file")
     exit(1)
 
+SERPAPI_URL = os.getenv("SERPAPI_URL", "https://serpapi.com/search")
+SERPAPI_CONCURRENCY = 8  # SerpAPI requests in flight at once during bulk enrichment
+SERPAPI_TIMEOUT = 20  # Seconds
+SERP_CACHE_DB = os.getenv("SERP_CACHE_DB", "serp_cache.db")
+SERP_CACHE_TTL = 24 * 60 * 60  # Seconds a response is served without revalidating
+SERP_CACHE_STALE_TTL = 7 * 24 * 60 * 60  # Further seconds it is served while refreshing in the background
+SERP_CACHE_MAX_ENTRIES = 5000
+SERP_CACHE_REFRESH_WORKERS = 2  # Background refreshes of stale entries at once (within SERPAPI_CONCURRENCY)
+JOB_QUEUE_DB = os.getenv("JOB_QUEUE_DB", "job_queue.db")
+JOB_WORKERS = 2  # Background jobs run at once
+
 app = Flask(__name__)
 CORS(app, resources={r"/*": {
     "origins": ["http://localhost:5173", "http://127.0.0.1:5173"],
@@ -66,17 +82,47 @@ def clean_title(raw_title):
     title = re.sub(r'\s+', ' ', title).strip()
     return title.title()
 
+_serpapi_session = None
+_serpapi_session_lock = threading.Lock()
+
+def get_serpapi_session():
+    """Shared requests session, pooled so concurrent SerpAPI calls reuse their connections."""
+    global _serpapi_session
+    with _serpapi_session_lock:
+        if _serpapi_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=SERPAPI_CONCURRENCY)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _serpapi_session = session
+        return _serpapi_session
+
+SERP_CACHE = SerpQueryCache(SERP_CACHE_DB, SERP_CACHE_TTL, SERP_CACHE_STALE_TTL, SERP_CACHE_MAX_ENTRIES,
+                            SERP_CACHE_REFRESH_WORKERS)
+
+# Every upstream call takes a slot: enrichment jobs, request handlers and the
+# cache's background refreshes together stay within SERPAPI_CONCURRENCY
+_serpapi_slots = threading.BoundedSemaphore(SERPAPI_CONCURRENCY)
+
+def serpapi_search(params):
+    """Run one SerpAPI search (through SERP_CACHE) and return the decoded JSON."""
+    return SERP_CACHE.get_or_fetch(params, _serpapi_request)
+
+def _serpapi_request(params):
+    with _serpapi_slots:
+        response = get_serpapi_session().get(SERPAPI_URL, params={**params, "api_key": SERP_API_KEY},
+                                             timeout=SERPAPI_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
 def fetch_links_for_job(job_title):
     try:
         query = f"{job_title} site:leetcode.com OR site:theforage.com"
         print(f"[INFO] Querying LeetCode/Forage: {query}")
-        response = requests.get("https://serpapi.com/search", params={
+        results = serpapi_search({
             "q": query,
-            "api_key": SERP_API_KEY,
             "num": 5
         })
-        response.raise_for_status()
-        results = response.json()
         links = results.get("organic_results", [])
         print(f"[INFO] Found {len(links)} results for {job_title}")
         leetcode_links = []
@@ -101,14 +147,11 @@ def fetch_learning_resources(job_title):
     try:
         query = f"{job_title} marketing resources OR courses OR certifications"
         print(f"[INFO] Querying learning resources: {query}")
-        response = requests.get("https://serpapi.com/search", params={
+        results = serpapi_search({
             "engine": "google",
             "q": query,
-            "api_key": SERP_API_KEY,
             "num": 10
         })
-        response.raise_for_status()
-        results = response.json()
         organic_results = results.get("organic_results", [])
         resources = [
             {
@@ -131,14 +174,11 @@ def fetch_skill_resources(skill_or_role):
         # Try a broader query first
         query = f"learn {skill_or_role} site:udemy.com OR site:coursera.org OR site:edx.org"
         print(f"[INFO] Querying skill resources: {query}")
-        response = requests.get("https://serpapi.com/search", params={
+        results = serpapi_search({
             "engine": "google",
             "q": query,
-            "api_key": SERP_API_KEY,
             "num": 5
         })
-        response.raise_for_status()
-        results = response.json()
         organic_results = results.get("organic_results", [])
         
         if not organic_results:
@@ -146,14 +186,11 @@ def fetch_skill_resources(skill_or_role):
             # Fallback to a less restrictive query
             query = f"{skill_or_role} online course"
             print(f"[INFO] Querying fallback: {query}")
-            response = requests.get("https://serpapi.com/search", params={
+            results = serpapi_search({
                 "engine": "google",
                 "q": query,
-                "api_key": SERP_API_KEY,
                 "num": 5
             })
-            response.raise_for_status()
-            results = response.json()
             organic_results = results.get("organic_results", [])
         
         if not organic_results:
@@ -209,6 +246,86 @@ def save_resources_to_db(title, resources_dict):
     finally:
         conn.close()
 
+def save_all_resources_to_db(resources_by_title):
+    """Store {raw title: resources dict} for many bookmarks in a single transaction."""
+    conn = None
+    try:
+        conn = init_db()
+        with conn:
+            conn.executemany(
+                "UPDATE bookmarks SET resources = ? WHERE title = ?",
+                [(json.dumps(resources), title) for title, resources in resources_by_title.items()]
+            )
+        print(f"[INFO] Saved resources for {len(resources_by_title)} titles")
+    except sqlite3.Error as e:
+        print(f"[ERROR] Failed to save resources: {e}")
+    finally:
+        if conn is not None:
+            conn.close()
+
+def iter_enriched_titles(clean_titles, max_workers=SERPAPI_CONCURRENCY):
+    """
+    Fetch LeetCode/Forage links and learning resources for each distinct cleaned
+    title, yielding (title, resources) in order as each title completes.
+    
+    Both queries for every title go through one thread pool, so at most
+    max_workers SerpAPI requests are in flight.
+    """
+    unique_titles = list(dict.fromkeys(clean_titles))
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            (title, executor.submit(fetch_links_for_job, title), executor.submit(fetch_learning_resources, title))
+            for title in unique_titles
+        ]
+        for title, links, general in futures:
+            leet_forage = links.result()
+            yield title, {
+                "leetcode": leet_forage["leetcode"],
+                "forage": leet_forage["forage"],
+                "General": general.result()
+            }
+    finally:
+        # Only reached early if the consumer stopped; drop the queries nobody will read
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def enrich_titles(clean_titles, max_workers=SERPAPI_CONCURRENCY):
+    """Returns {clean title: resources} for each distinct cleaned title (see iter_enriched_titles)."""
+    return dict(iter_enriched_titles(clean_titles, max_workers))
+
+def enrich_bookmarks_job(job):
+    """
+    Job handler for "enrich_bookmarks": enrich every bookmark, storing and
+    reporting one result per distinct cleaned title. Titles finished by an
+    earlier, interrupted run are skipped.
+    """
+    raw_titles = {}
+    for raw_title in get_all_bookmark_titles():
+        raw_titles.setdefault(clean_title(raw_title), []).append(raw_title)
+    job.set_total(len(raw_titles))
+    pending = [title for title in raw_titles if title not in job.done]
+    print(f"[INFO] Enriching {len(pending)} of {len(raw_titles)} distinct bookmark titles")
+    for title, resources in iter_enriched_titles(pending):
+        save_all_resources_to_db({raw_title: resources for raw_title in raw_titles[title]})
+        job.add_result(title, {"job_title": title, "titles": raw_titles[title], "resources": resources})
+        if job.stopping:
+            return
+
+def scrape_bookmarks_job(job):
+    """Job handler for "scrape_bookmarks" (see main_script.scrape_bookmarks_job)."""
+    from main_script import scrape_bookmarks_job as run  # Selenium and spaCy load only when a scrape runs
+    run(job)
+
+JOB_QUEUE = JobQueue(JOB_QUEUE_DB, JOB_WORKERS)
+JOB_QUEUE.register("enrich_bookmarks", enrich_bookmarks_job)
+JOB_QUEUE.register("scrape_bookmarks", scrape_bookmarks_job)
+
+@app.before_request
+def start_job_workers():
+    # Started on the first request so that only the process serving requests
+    # (not the debug reloader's parent) runs jobs; interrupted jobs resume here
+    JOB_QUEUE.start()
+
 @app.route("/resources_from_db", methods=["GET"])
 def get_resources_from_db():
     print("[INFO] Fetching resources from DB")
@@ -239,28 +356,68 @@ def get_resources_from_db():
 def fetch_resources_for_all_bookmarks():
     try:
         titles = get_all_bookmark_titles()
-        enriched_data = []
-        print(f"[INFO] Fetching resources for {len(titles)} bookmarks")
-        for raw_title in titles:
-            title = clean_title(raw_title)
-            leet_forage = fetch_links_for_job(title)
-            general = fetch_learning_resources(title)
-            combined_resources = {
-                "leetcode": leet_forage["leetcode"],
-                "forage": leet_forage["forage"],
-                "General": general
+        clean_titles = {raw_title: clean_title(raw_title) for raw_title in titles}
+        print(f"[INFO] Fetching resources for {len(titles)} bookmarks "
+              f"({len(set(clean_titles.values()))} distinct titles)")
+        resources = enrich_titles(clean_titles.values())
+
+        # Fan the results back out to every bookmark and store them together
+        save_all_resources_to_db({raw_title: resources[title] for raw_title, title in clean_titles.items()})
+        enriched_data = [
+            {
+                "job_title": clean_titles[raw_title],
+                "resources": resources[clean_titles[raw_title]]
             }
-            save_resources_to_db(raw_title, combined_resources)
-            enriched_data.append({
-                "job_title": title,
-                "resources": combined_resources
-            })
+            for raw_title in titles
+        ]
         print(f"[INFO] Returning {len(enriched_data)} enriched bookmark resources")
         return jsonify(enriched_data)
     except Exception as e:
         print(f"[ERROR] In /resources_for_all_bookmarks: {e}")
         return jsonify({"error": str(e)}), 500
 
+@app.route("/jobs/<kind>", methods=["POST"])
+def submit_job(kind):
+    try:
+        job_id = JOB_QUEUE.submit(kind, request.get_json(silent=True) or {})
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return jsonify({"error": str(e)}), 404
+    print(f"[INFO] Queued {kind} job {job_id}")
+    return jsonify({
+        "job_id": job_id,
+        "status_url": f"/jobs/{job_id}",
+        "events_url": f"/jobs/{job_id}/events"
+    }), 202
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    return jsonify(JOB_QUEUE.list_jobs(request.args.get("limit", 50, type=int)))
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = JOB_QUEUE.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
+
+@app.route("/jobs/<job_id>/results", methods=["GET"])
+def job_results(job_id):
+    if JOB_QUEUE.get(job_id) is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(JOB_QUEUE.results(job_id, request.args.get("after", 0, type=int)))
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id):
+    """Server-Sent Events stream of a job's results and progress; reconnecting clients resume via Last-Event-ID."""
+    after = request.headers.get("Last-Event-ID", request.args.get("after", 0), type=int)
+    return Response(stream_with_context(JOB_QUEUE.events(job_id, after)), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route("/serp_cache/stats", methods=["GET"])
+def serp_cache_stats():
+    return jsonify(SERP_CACHE.stats())
+
 @app.route("/fetch_resources", methods=["GET"])
 def fetch_resources():
     skill_or_role = request.args.get("q")
@@ -1,39 +1,46 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Request, jsonify, request
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 import os
+from io import BytesIO
 from datetime import datetime
 import traceback
-import re
-import PyPDF2  # For PDF parsing
-import docx  # For DOCX parsing
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-nltk.download('punkt_tab')
-
-# Download NLTK resources (run once)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
-app = Flask(__name__)
-CORS(app, supports_credentials=True, resources={
-    r"/*": {"origins": "*"}  # Open CORS for all routes
-})
+from doc_extraction import ExtractionPool, ExtractionTimeout, PoolSaturated, TooManyPages, extract_document_text
+from skill_matcher import SkillIndex
+from skill_gap import load_engine
+from resume_cache import ResumeResultCache, upload_key
 
 # Constants
-DOWNLOAD_FOLDER = "downloads"
 MAX_RESUME_SIZE = 5 * 1024 * 1024  # 5MB
+UPLOAD_OVERHEAD = 64 * 1024  # Room for the multipart framing and other form fields
+UPLOAD_CHUNK_SIZE = 64 * 1024
 ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx'}
 MIN_SKILLS_THRESHOLD = 3  # Minimum number of skills to consider extraction successful
+RESUME_CACHE_SIZE = 256  # Analysis results kept in memory
+RESUME_CACHE_DB = os.getenv("RESUME_CACHE_DB")  # Set to a SQLite path to also keep results on disk
+MAX_RESUME_PAGES = 20
+EXTRACTION_WORKERS = 2  # Processes parsing documents; 0 parses on the request thread
+EXTRACTION_QUEUE_DEPTH = 8  # Documents parsing or waiting before uploads get a 503
+EXTRACTION_TIMEOUT = 20  # Seconds
+JOBS_DB_PATH = "bookmarks.db"  # Scraped job skills (main_script.py)
+MATCH_THRESHOLD = 50.0  # Match percentage at which a job counts as matched
+DEFAULT_SKILL_GAP_LIMIT = 50  # Ranked jobs returned by /skill_gap
 
-# Ensure download folder exists
-os.makedirs(DOWNLOAD_FOLDER, exist_ok=True)
+class InMemoryUploadRequest(Request):
+    """Request whose uploaded files are buffered in memory instead of spooled to temp files."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # MAX_CONTENT_LENGTH bounds the body, so the buffer can't exceed it
+        return BytesIO()
+
+app = Flask(__name__)
+app.request_class = InMemoryUploadRequest
+# Werkzeug rejects larger bodies from Content-Length up front, and stops reading
+# chunked bodies as soon as they pass the limit
+app.config['MAX_CONTENT_LENGTH'] = MAX_RESUME_SIZE + UPLOAD_OVERHEAD
+CORS(app, supports_credentials=True, resources={
+    r"/*": {"origins": "*"}  # Open CORS for all routes
+})
 
 # Technical skills database (expand as needed)
 TECHNICAL_SKILLS = {
@@ -76,47 +83,68 @@ CERTIFICATIONS = [
     'salesforce certified', 'microsoft certified', 'cka', 'google analytics'
 ]
 
-def extract_text_from_pdf(file_path):
-    """Extract text from PDF file"""
-    text = ""
-    try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + " "
-    except Exception as e:
-        app.logger.error(f"Error extracting text from PDF: {str(e)}")
-    return text
+# Which result section each taxonomy category is reported under
+SKILL_SECTIONS = {category: "Technical Skills" for category in TECHNICAL_SKILLS}
+SKILL_SECTIONS.update(soft_skills="Soft Skills", certifications="Certifications")
 
-def extract_text_from_docx(file_path):
-    """Extract text from DOCX file"""
-    text = ""
-    try:
-        doc = docx.Document(file_path)
-        for para in doc.paragraphs:
-            text += para.text + " "
-    except Exception as e:
-        app.logger.error(f"Error extracting text from DOCX: {str(e)}")
-    return text
+# Every skill compiled into one matcher, once at startup
+SKILL_INDEX = SkillIndex(
+    [(skill, category) for category, skill_list in TECHNICAL_SKILLS.items() for skill in skill_list]
+    + [(skill, "soft_skills") for skill in SOFT_SKILLS]
+    + [(cert, "certifications") for cert in CERTIFICATIONS]
+)
+
+# Results by upload hash and SKILL_INDEX.version; editing the taxonomy changes the version
+RESUME_CACHE = ResumeResultCache(RESUME_CACHE_SIZE, RESUME_CACHE_DB)
 
-def extract_text_from_resume(file_path):
-    """Extract text from resume file based on extension"""
-    file_ext = os.path.splitext(file_path)[1].lower()
+# PDF/DOCX parsing is CPU-bound, so it runs in worker processes off the request thread
+EXTRACTION_POOL = ExtractionPool(EXTRACTION_WORKERS, EXTRACTION_QUEUE_DEPTH, EXTRACTION_TIMEOUT)
+
+def extract_text_from_resume(source, file_ext=None):
+    """Extract text from a resume file path, or a binary stream with its extension"""
+    if file_ext is None:
+        file_ext = os.path.splitext(source)[1].lower()
+    if file_ext not in ALLOWED_EXTENSIONS:
+        raise ValueError(f"Unsupported file type: {file_ext}")
     
-    if file_ext == '.pdf':
-        return extract_text_from_pdf(file_path)
-    elif file_ext in ['.doc', '.docx']:
-        return extract_text_from_docx(file_path)
+    if hasattr(source, "getvalue"):
+        data = source.getvalue()
     else:
-        raise ValueError(f"Unsupported file type: {file_ext}")
+        with open(source, 'rb') as file:
+            data = file.read()
+    
+    try:
+        return EXTRACTION_POOL.run(extract_document_text, data, file_ext, MAX_RESUME_PAGES)
+    except (TooManyPages, PoolSaturated, ExtractionTimeout):
+        raise
+    except Exception as e:
+        app.logger.error(f"Error extracting text from {file_ext}: {str(e)}")
+        return ""
+
+def read_upload(file, limit=MAX_RESUME_SIZE):
+    """
+    Copy an uploaded file into a BytesIO in chunks, giving up as soon as it
+    passes `limit` bytes. Returns None for oversized files.
+    """
+    buffer = BytesIO()
+    while True:
+        chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        if buffer.tell() + len(chunk) > limit:
+            return None
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+def file_too_large():
+    return jsonify({
+        "error": "File too large",
+        "max_size": f"{MAX_RESUME_SIZE/1024/1024}MB"
+    }), 413
 
 def extract_skills_from_text(text):
     """Extract skills from text"""
-    text = text.lower()
-    words = word_tokenize(text)
-    stop_words = set(stopwords.words('english'))
-    filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
-    
     # Initialize skills dictionary
     skills = {
         "Technical Skills": [],
@@ -124,32 +152,17 @@ def extract_skills_from_text(text):
         "Certifications": []
     }
     
-    # Find technical skills
-    for category, skill_list in TECHNICAL_SKILLS.items():
-        for skill in skill_list:
-            # Look for exact matches or matches with word boundaries
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                skills["Technical Skills"].append(skill.title())
-    
-    # Find soft skills
-    for skill in SOFT_SKILLS:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text, re.IGNORECASE):
-            skills["Soft Skills"].append(skill.title())
-    
-    # Find certifications
-    for cert in CERTIFICATIONS:
-        if cert.lower() in text:
-            skills["Certifications"].append(cert.title())
+    # One scan over the text finds every skill in the taxonomy
+    for skill, category in SKILL_INDEX.matched_entries(text):
+        skills[SKILL_SECTIONS[category]].append(skill.title())
     
     return skills
 
-def extract_skills_from_resume(resume_path):
-    """Extract skills from resume"""
+def extract_skills_from_resume(source, file_ext=None):
+    """Extract skills from a resume file path, or a binary stream with its extension"""
     try:
         # Extract text from resume
-        resume_text = extract_text_from_resume(resume_path)
+        resume_text = extract_text_from_resume(source, file_ext)
         if not resume_text.strip():
             raise ValueError("Failed to extract text from resume")
         
@@ -175,6 +188,8 @@ def extract_skills_from_resume(resume_path):
                 
         return skills
         
+    except (PoolSaturated, ExtractionTimeout, TooManyPages):
+        raise  # Answered by the route with their own status codes
     except Exception as e:
         app.logger.error(f"Skill extraction failed: {str(e)}")
         app.logger.error(traceback.format_exc())
@@ -186,10 +201,15 @@ def home():
         "status": "running",
         "endpoints": {
             "/analyze_resume": "POST with resume file",
-            "/skill_gap": "POST with resumeSkills"
+            "/skill_gap": "POST with resumeSkills",
+            "/resume_cache/stats": "GET resume analysis cache statistics"
         }
     })
 
+@app.route("/resume_cache/stats")
+def resume_cache_stats():
+    return jsonify(RESUME_CACHE.stats())
+
 @app.route("/analyze_resume", methods=["POST"])
 def analyze_resume():
     """Endpoint for resume file uploads"""
@@ -209,21 +229,17 @@ def analyze_resume():
             }), 400
             
         try:
-            # Save temporarily
-            filename = f"upload_{datetime.now().timestamp()}{file_ext}"
-            filepath = os.path.join(DOWNLOAD_FOLDER, filename)
-            file.save(filepath)
+            # Parse straight from memory; nothing touches the disk
+            upload = read_upload(file)
+            if upload is None:
+                return file_too_large()
             
-            # Check file size
-            if os.path.getsize(filepath) > MAX_RESUME_SIZE:
-                os.remove(filepath)
-                return jsonify({
-                    "error": "File too large",
-                    "max_size": f"{MAX_RESUME_SIZE/1024/1024}MB"
-                }), 413
-            
-            # Analyze
-            skills_data = extract_skills_from_resume(filepath)
+            # Analyze, unless this exact file was already analyzed with this taxonomy
+            cache_key = upload_key(upload.getbuffer(), SKILL_INDEX.version)
+            skills_data = RESUME_CACHE.get(cache_key)
+            if skills_data is None:
+                skills_data = extract_skills_from_resume(upload, file_ext)
+                RESUME_CACHE.put(cache_key, skills_data)
             
             # Flatten the skills for the overall skills list
             all_skills = set()
@@ -236,25 +252,36 @@ def analyze_resume():
                 "skills_by_section": {k: list(v) for k, v in skills_data.items()}
             })
             
+        except PoolSaturated:
+            return jsonify({"error": "Server busy, please retry shortly"}), 503, {"Retry-After": "5"}
+        except ExtractionTimeout:
+            return jsonify({"error": "Resume took too long to process"}), 503
+        except TooManyPages:
+            return jsonify({
+                "error": "Too many pages",
+                "max_pages": MAX_RESUME_PAGES
+            }), 413
         except Exception as e:
             return jsonify({
                 "error": "Processing failed",
                 "details": str(e)
             }), 400
-            
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
                 
+    except RequestEntityTooLarge:
+        return file_too_large()
     except Exception as e:
         return jsonify({
             "error": "Internal server error",
             "details": str(e)
         }), 500
 
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    return file_too_large()
+
 @app.route("/skill_gap", methods=["POST"])
 def get_skill_gap():
-    """Mock skill gap analysis"""
+    """Rank stored jobs by how well the resume skills cover them"""
     try:
         data = request.get_json()
         if not data:
@@ -270,52 +297,55 @@ def get_skill_gap():
                 "error": f"Not enough skills provided (minimum {MIN_SKILLS_THRESHOLD} required)",
                 "provided_skills": resume_skills
             }), 400
+        
+        limit = data.get('limit', DEFAULT_SKILL_GAP_LIMIT)
+        if not isinstance(limit, int) or limit < 1:
+            return jsonify({"error": "limit must be a positive integer"}), 400
+        
+        skill_gaps = {}
+        match_stats = {}
+        recommendations = []
+        total_jobs = total_matched = 0
+        
+        engine = load_engine(JOBS_DB_PATH) if os.path.exists(JOBS_DB_PATH) else None
+        if engine is not None and engine.urls:
+            # Every job is scored at once; only the best `limit` are reported in detail
+            ranked, percentages, missing, have = engine.analyze(resume_skills, limit)
+            for row in ranked:
+                url = engine.urls[row]
+                skill_gaps.setdefault(engine.source_of(row), []).append({
+                    "url": url,
+                    "title": engine.titles.get(url) or url,
+                    "required_skills": engine.row_skills(engine.jobs, row),
+                    "your_skills": engine.row_skills(have, row),
+                    "missing_skills": engine.row_skills(missing, row),
+                    "match_percentage": round(float(percentages[row]), 1)
+                })
             
-        # Enhanced mock data with all required fields
-        demo_skill_gaps = {
-            "LinkedIn": [
-                {
-                    "title": "Senior Python Developer at TechCorp",
-                    "required_skills": ["Python", "Django", "AWS", "React"],
-                    "your_skills": [skill for skill in ["Python", "React", "AWS"] if skill in resume_skills],
-                    "missing_skills": [skill for skill in ["Django"] if skill not in resume_skills],
-                    "match_percentage": 75.0,
-                    "resume_skills": resume_skills
-                },
-                {
-                    "title": "Frontend Developer at WebSolutions",
-                    "required_skills": ["JavaScript", "React", "CSS", "HTML5"],
-                    "your_skills": [skill for skill in ["JavaScript", "React"] if skill in resume_skills],
-                    "missing_skills": [skill for skill in ["CSS", "HTML5"] if skill not in resume_skills],
-                    "match_percentage": 50.0,
-                    "resume_skills": resume_skills
+            # Per-source totals over all jobs, not just the reported ones
+            for source, (source_total, source_matched) in engine.source_stats(percentages, MATCH_THRESHOLD).items():
+                match_stats[source] = {
+                    "total_jobs": source_total,
+                    "matched_jobs": source_matched,
+                    "match_rate": round(100.0 * source_matched / source_total, 1)
                 }
-            ]
-        }
-        
-        match_stats = {
-            "LinkedIn": {
-                "total_jobs": 2,
-                "matched_jobs": 0,
-                "match_rate": 0.0
-            }
-        }
+                total_jobs += source_total
+                total_matched += source_matched
+            
+            for skill, count in engine.common_missing(missing, ranked):
+                recommendations.append(f"Learn {skill}: required by {count} of your {len(ranked)} closest matches")
         
         return jsonify({
             "success": True,
-            "skill_gaps": demo_skill_gaps,
+            "skill_gaps": skill_gaps,
             "match_stats": match_stats,
             "summary": {
-                "total_jobs": 2,
-                "total_matched": 0,
-                "overall_match_rate": 0.0,
+                "total_jobs": total_jobs,
+                "total_matched": total_matched,
+                "overall_match_rate": round(100.0 * total_matched / total_jobs, 1) if total_jobs else 0.0,
                 "resume_skills": resume_skills,
                 "analyzed_at": datetime.now().isoformat(),
-                "recommendations": [
-                    "Focus on learning the missing skills highlighted above",
-                    "Check our resources section for learning materials",
-                    "Consider taking online courses for the skills you're missing"
-                ]
+                "recommendations": recommendations
             }
         })
             
@@ -2,6 +2,8 @@ from flask import Flask, jsonify, request # type: ignore
 from flask_cors import CORS # type: ignore
 import sqlite3
 import urllib.parse
+from itertools import groupby
+from bookmark_import import TooManyBookmarks, import_bookmarks, parse_bulk_request
 
 app = Flask(__name__)
 CORS(app)
@@ -11,36 +13,69 @@ def get_db_connection():
     conn.row_factory = sqlite3.Row  # This enables column access by name
     return conn
 
+def normalize_domain(url):
+    """Grouping key for a bookmark URL: its host, lowercased. Bare domains ("example.com/jobs") work too."""
+    parsed = urllib.parse.urlparse(url.strip())
+    if not parsed.netloc:
+        parsed = urllib.parse.urlparse("//" + url.strip())
+    return parsed.netloc.lower()
+
 def init_db():
     conn = get_db_connection()
     conn.execute('''
         CREATE TABLE IF NOT EXISTS bookmarks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             title TEXT NOT NULL,
-            url TEXT NOT NULL UNIQUE
+            url TEXT NOT NULL UNIQUE,
+            domain TEXT
         )
     ''')
+    # Older databases (and the ones app.py / app_four.py create) have no domain column yet
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(bookmarks)")]
+    if "domain" not in columns:
+        conn.execute("ALTER TABLE bookmarks ADD COLUMN domain TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_bookmarks_domain ON bookmarks (domain)")
+    backfilled = backfill_domains(conn)
+    if backfilled:
+        print(f"Backfilled domain for {backfilled} bookmarks")
     conn.commit()
     conn.close()
 
-def get_bookmarks():
+def backfill_domains(conn):
+    """
+    Fill in the domain of bookmarks that have none: the whole table on first
+    migration, afterwards only rows added by writers that don't set it (app.py).
+    The IS NULL lookup uses the domain index, so this is cheap when nothing is missing.
+    """
+    rows = conn.execute("SELECT rowid AS row_id, url FROM bookmarks WHERE domain IS NULL").fetchall()
+    if rows:
+        conn.executemany("UPDATE bookmarks SET domain = ? WHERE rowid = ?",
+                         [(normalize_domain(row["url"] or ""), row["row_id"]) for row in rows])
+        conn.commit()
+    return len(rows)
+
+def get_bookmarks(domain=None):
+    """Bookmarks grouped by domain, read in (domain, id) order off the domain index."""
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT title, url FROM bookmarks")
-    bookmarks = cursor.fetchall()
+    backfill_domains(conn)
+    if domain is None:
+        rows = conn.execute("SELECT domain, title, url FROM bookmarks ORDER BY domain, rowid").fetchall()
+    else:
+        rows = conn.execute("SELECT domain, title, url FROM bookmarks WHERE domain = ? ORDER BY rowid",
+                            (normalize_domain(domain),)).fetchall()
     conn.close()
-    
-    categorized_bookmarks = {}
 
-    for title, url in bookmarks:
-        domain = urllib.parse.urlparse(url).netloc  # Extract website domain
+    return {
+        domain: [{"title": row["title"], "url": row["url"]} for row in group]
+        for domain, group in groupby(rows, key=lambda row: row["domain"])
+    }
 
-        if domain not in categorized_bookmarks:
-            categorized_bookmarks[domain] = []
-
-        categorized_bookmarks[domain].append({"title": title, "url": url})
-
-    return categorized_bookmarks
+def get_domain_counts():
+    conn = get_db_connection()
+    backfill_domains(conn)
+    rows = conn.execute("SELECT domain, COUNT(*) AS count FROM bookmarks GROUP BY domain ORDER BY domain").fetchall()
+    conn.close()
+    return [{"domain": row["domain"], "count": row["count"]} for row in rows]
 
 @app.route("/")
 def home():
@@ -48,7 +83,11 @@ def home():
 
 @app.route("/bookmarks", methods=["GET"])
 def fetch_bookmarks():
-    return jsonify(get_bookmarks())
+    return jsonify(get_bookmarks(request.args.get("domain")))
+
+@app.route("/bookmarks/domains", methods=["GET"])
+def fetch_domain_counts():
+    return jsonify(get_domain_counts())
 
 @app.route("/bookmarks", methods=["POST"])
 def add_bookmark():
@@ -59,17 +98,40 @@ def add_bookmark():
     if not title or not url:
         return jsonify({"error": "Title and URL are required"}), 400
 
+    conn = get_db_connection()
     try:
-        conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("INSERT INTO bookmarks (title, url) VALUES (?, ?)", (title, url))
+        cursor.execute("INSERT INTO bookmarks (title, url, domain) VALUES (?, ?, ?)",
+                       (title, url, normalize_domain(url)))
         conn.commit()
-        conn.close()
         return jsonify({"message": "Bookmark added successfully"}), 201
     except sqlite3.IntegrityError:
         return jsonify({"error": "Bookmark with this URL already exists"}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    finally:
+        # Closing also rolls back a failed insert, which would otherwise hold the write lock
+        conn.close()
+
+@app.route("/bookmarks/bulk", methods=["POST"])
+def add_bookmarks_bulk():
+    """Import many bookmarks at once: a JSON array or NDJSON of {title, url}, inserted in one transaction."""
+    try:
+        entries = parse_bulk_request(request)
+    except TooManyBookmarks as e:
+        return jsonify({"error": str(e)}), 413
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    conn = get_db_connection()
+    try:
+        results, counts = import_bookmarks(conn, entries, derived_columns={"domain": normalize_domain})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    finally:
+        conn.close()
+    print(f"Bulk import: {counts['created']} created, {counts['duplicate']} duplicates, {counts['invalid']} invalid")
+    return jsonify({**counts, "results": results}), 201 if counts["created"] else 200
 
 @app.route('/bookmarks', methods=['DELETE'])
 def delete_bookmark():
@@ -78,26 +140,24 @@ def delete_bookmark():
     if not url_to_delete:
         return jsonify({"error": "No URL provided"}), 400
 
-    domain = urllib.parse.urlparse(url_to_delete).netloc.lower() or url_to_delete.lower()
+    delete_all = bool(data.get('all'))  # Delete every bookmark from the domain, not just the first
+    domain = normalize_domain(url_to_delete)
     print(f"Trying to delete domain: {domain}")
 
     conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # Find all bookmarks matching this domain
-    cursor.execute("SELECT * FROM bookmarks")
-    bookmarks = cursor.fetchall()
-
-    deleted = False
-    for bookmark in bookmarks:
-        stored_url = bookmark["url"]
-        stored_domain = urllib.parse.urlparse(stored_url).netloc.lower().rstrip('/')
-
-        if stored_domain == domain:
-            cursor.execute("DELETE FROM bookmarks WHERE url = ?", (stored_url,))
-            deleted = True
-            print(f"Deleted: {stored_url}")
-            break  # Remove this line if you want to delete **all** from that domain
+    backfill_domains(conn)
+
+    if delete_all:
+        deleted = conn.execute("DELETE FROM bookmarks WHERE domain = ?", (domain,)).rowcount
+        print(f"Deleted {deleted} bookmarks from {domain}")
+    else:
+        bookmark = conn.execute(
+            "SELECT rowid AS row_id, url FROM bookmarks WHERE domain = ? ORDER BY rowid LIMIT 1", (domain,)
+        ).fetchone()
+        deleted = 0
+        if bookmark is not None:
+            deleted = conn.execute("DELETE FROM bookmarks WHERE rowid = ?", (bookmark["row_id"],)).rowcount
+            print(f"Deleted: {bookmark['url']}")
 
     conn.commit()
     conn.close()
@@ -105,6 +165,8 @@ def delete_bookmark():
     if not deleted:
         return jsonify({"error": "Bookmark not found"}), 404
 
+    if delete_all:
+        return jsonify({"message": f"Deleted {deleted} bookmarks", "deleted": deleted}), 200
     return jsonify({"message": "Bookmark deleted successfully"}), 200
 
 
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sqlite3
+
+# Indexes backing the GROUP BY / ORDER BY queries below. The dashboard pages
+# through applications on PAGE_SORT_KEY (a missing date sorts as ''), so the
+# status and company indexes carry it too and filtered pages stay range scans.
+PAGE_SORT_KEY = "COALESCE(date_received, '')"
+STATS_INDEXES = {
+    "idx_job_applications_status_page": f"status, {PAGE_SORT_KEY}",
+    "idx_job_applications_company_page": f"company, {PAGE_SORT_KEY}",
+    "idx_job_applications_page": PAGE_SORT_KEY,
+    "idx_job_applications_date_received": "date_received",
+}
+# Superseded by the *_page indexes above
+DROPPED_INDEXES = ("idx_job_applications_status_date", "idx_job_applications_company_date")
+
+# Databases already indexed in this process
+_indexed_paths = set()
+
+
+def ensure_indexes(conn):
+    """Create the stats indexes if they don't exist."""
+    for name, columns in STATS_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON job_applications ({columns})")
+    for name in DROPPED_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    conn.commit()
+
+
+def connect(db_path):
+    """Open a stats connection, creating the indexes once per process."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    if db_path not in _indexed_paths:
+        ensure_indexes(conn)
+        _indexed_paths.add(db_path)
+    return conn
+
+
+def total_applications(conn):
+    """Number of stored applications."""
+    return conn.execute("SELECT COUNT(*) FROM job_applications").fetchone()[0]
+
+
+def status_counts(conn):
+    """Map of status -> number of applications."""
+    cursor = conn.execute('''
+    SELECT status, COUNT(*) as count
+    FROM job_applications
+    GROUP BY status
+    ''')
+    return {row['status']: row['count'] for row in cursor}
+
+
+def company_counts(conn, limit=10):
+    """Map of the `limit` companies with the most applications -> count, largest first."""
+    cursor = conn.execute('''
+    SELECT company, COUNT(*) as count
+    FROM job_applications
+    GROUP BY company
+    ORDER BY count DESC, company
+    LIMIT ?
+    ''', (limit,))
+    return {row['company']: row['count'] for row in cursor}
+
+
+def latest_applications(conn, limit=10):
+    """The `limit` most recently received applications, newest first."""
+    cursor = conn.execute('''
+    SELECT email_id, role, company, status, date_received, subject, sender, last_updated, message_id
+    FROM job_applications
+    ORDER BY date_received DESC
+    LIMIT ?
+    ''', (limit,))
+    applications = []
+    for row in cursor:
+        app = dict(row)
+        app['message_link'] = f"https://mail.google.com/mail/u/0/#inbox/{row['message_id']}"  # Add Gmail link
+        applications.append(app)
+    return applications
+
+
+def get_application_stats(db_path, top_companies=5, latest=10):
+    """Get statistics about job applications, aggregated in SQLite."""
+    conn = connect(db_path)
+    try:
+        return {
+            "status_counts": status_counts(conn),
+            "top_companies": company_counts(conn, top_companies),
+            "latest_applications": latest_applications(conn, latest),
+            "total_applications": total_applications(conn)
+        }
+    finally:
+        conn.close()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ApplicationWriter crash safety: a trigger aborts the INSERT partway through a
+batch, so the flush fails after some of its rows were already written. The
+batch must be rolled back as a whole, its rows must go back on the buffer, and
+once the fault is gone the next flush must write every row exactly once.
+
+Covers an explicit flush, a flush started by add() when the batch fills up
+(which must not interrupt ingestion), the background flusher, the buffer cap,
+and a whole extract_applications sync through transient and permanent write
+failures. Also times batched writes against one commit per row. Runs in a
+temporary directory with its own database.
+
+Usage: python benchmarks/bench_application_writer.py [--rows 5000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_sync_pipeline import FakeGmail  # noqa: E402
+from job_tracker import INSERT_APPLICATION_SQL, ApplicationWriter, JobApplicationTracker, SyncFailed  # noqa: E402
+
+POISON_TRIGGER = '''
+CREATE TRIGGER poison_row BEFORE INSERT ON job_applications
+WHEN NEW.email_id LIKE 'poison-%'
+BEGIN
+    SELECT RAISE(ABORT, 'injected failure');
+END
+'''
+
+# Fails every write while injected_fault has a row, the way a locked database would
+FAULT_TRIGGER = '''
+CREATE TRIGGER injected_fault BEFORE INSERT ON job_applications
+WHEN EXISTS (SELECT 1 FROM injected_fault)
+BEGIN
+    SELECT RAISE(ABORT, 'database is locked');
+END
+'''
+
+
+def make_tracker(path):
+    tracker = JobApplicationTracker.__new__(JobApplicationTracker)  # Skips the Gmail login
+    tracker.db_path = path
+    tracker.applications = []
+    tracker.batch_size = 20
+    tracker.flush_interval = 0.05
+    tracker.pipeline_options = {"fetch_workers": 4, "parse_workers": 0, "ref_queue_size": 100,
+                                "parse_queue_size": 16}
+    tracker._initialize_database()
+    return tracker
+
+
+def make_database(path):
+    make_tracker(path)
+
+
+def make_application(i, email_id=None):
+    return {
+        'email_id': email_id or f"msg-{i}",
+        'role': "Software Engineer",
+        'company': f"Company {i % 50}",
+        'status': "Applied",
+        'date_received': "2024-05-01 10:00:00",
+        'subject': f"Your application {i}",
+        'sender': "jobs@example.com",
+        'last_updated': "2024-05-01 10:00:00",
+    }
+
+
+def stored_ids(path):
+    conn = sqlite3.connect(path)
+    ids = [row[0] for row in conn.execute("SELECT email_id FROM job_applications ORDER BY id")]
+    conn.close()
+    return ids
+
+
+def set_poison(path, enabled):
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TRIGGER IF EXISTS poison_row")
+    if enabled:
+        conn.execute(POISON_TRIGGER)
+    conn.commit()
+    conn.close()
+
+
+def batch(start, count, poison_at):
+    """count applications; the one at poison_at is rejected while the trigger exists."""
+    return [make_application(i, f"poison-{i}" if i == start + poison_at else None) for i in range(start, start + count)]
+
+
+def check_explicit_flush(path):
+    set_poison(path, True)
+    writer = ApplicationWriter(path, batch_size=1000, flush_interval=60)
+    applications = batch(0, 50, poison_at=30)
+    for application in applications:
+        writer.add(application, application['email_id'])
+    try:
+        writer.flush()
+        raised = False
+    except sqlite3.Error as e:
+        raised = True
+        print(f"Explicit flush: failed with {type(e).__name__}: {e}")
+    ok = raised and stored_ids(path) == [] and len(writer._pending) == 50 and writer.rows_written == 0
+    print(f"  after the failure: {len(stored_ids(path))} rows stored, {len(writer._pending)} requeued")
+
+    set_poison(path, False)
+    written = writer.flush()
+    writer.close()
+    ok &= written == 50 and stored_ids(path) == [a['email_id'] for a in applications]
+    print(f"  after removing the fault: flush wrote {written}, {len(stored_ids(path))} rows stored")
+    return ok
+
+
+def check_full_batch(path):
+    before = stored_ids(path)
+    set_poison(path, True)
+    writer = ApplicationWriter(path, batch_size=20, flush_interval=30)
+    applications = batch(100, 50, poison_at=15)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for application in applications[:30]:  # The 20th add() flushes and fails; ingestion goes on
+            writer.add(application, application['email_id'])
+    ok = stored_ids(path) == before and len(writer._pending) == 30 and writer.failures == 1
+    print(f"Flush from add(): {writer.failures} failed flush, {len(stored_ids(path)) - len(before)} rows stored, "
+          f"{len(writer._pending)} buffered, add() kept accepting rows")
+
+    set_poison(path, False)
+    writer._retry_at = 0.0  # Skip the rest of the backoff
+    for application in applications[30:40]:  # The next add() retries
+        writer.add(application, application['email_id'])
+    ok &= stored_ids(path) == before + [a['email_id'] for a in applications[:31]] and writer.failures == 0
+    print(f"  after the backoff: retry wrote {len(stored_ids(path)) - len(before)} rows")
+    for application in applications[40:]:
+        writer.add(application, application['email_id'])
+    writer.close()
+    ok &= stored_ids(path) == before + [a['email_id'] for a in applications]
+    print(f"  after close(): {len(stored_ids(path)) - len(before)} rows stored")
+    return ok
+
+
+def check_buffer_cap(path):
+    before = stored_ids(path)
+    set_poison(path, True)
+    writer = ApplicationWriter(path, batch_size=10, flush_interval=0.01, max_failures=100, max_pending=45)
+    applications = batch(300, 100, poison_at=0)
+    added = 0
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for application in applications:
+                writer.add(application, application['email_id'])
+                added += 1
+        gave_up = False
+    except SyncFailed as e:
+        gave_up = True
+        print(f"Buffer cap: gave up after {added + 1} rows with {e}")
+    set_poison(path, False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        writer.close()
+    return gave_up and added == 45 and stored_ids(path) == before + [a['email_id'] for a in applications[:46]]
+
+
+def sync(tracker, fault_for):
+    """Run extract_applications over a fake mailbox, with writes failing for the first fault_for seconds."""
+    gmail = FakeGmail(300, latency=0.01)
+    tracker.gmail = type("Gmail", (), {"service": None})()
+    tracker._local = threading.local()
+    tracker._iter_new_ref_pages = lambda query, incremental: gmail.list_pages()
+    tracker._fetch_message = gmail.fetch
+    conn = sqlite3.connect(tracker.db_path)
+    conn.execute("DELETE FROM job_applications")
+    conn.execute("DELETE FROM sync_checkpoints")
+    conn.execute("CREATE TABLE IF NOT EXISTS injected_fault (x)")
+    conn.execute("DROP TRIGGER IF EXISTS injected_fault")
+    conn.execute(FAULT_TRIGGER)
+    conn.execute("INSERT INTO injected_fault VALUES (1)")
+    conn.commit()
+    conn.close()
+
+    def heal():
+        conn = sqlite3.connect(tracker.db_path)
+        conn.execute("DELETE FROM injected_fault")
+        conn.commit()
+        conn.close()
+    healer = threading.Timer(fault_for, heal)
+    healer.start()
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            applications = tracker.extract_applications(incremental=False)
+        error = None
+    except SyncFailed as e:
+        applications, error = None, e
+    failed_flushes = output.getvalue().count("Error flushing applications")
+    healer.cancel()
+    heal()
+    conn = sqlite3.connect(tracker.db_path)
+    stored = conn.execute("SELECT COUNT(*) FROM job_applications").fetchone()[0]
+    checkpoints = conn.execute("SELECT COUNT(*) FROM sync_checkpoints").fetchone()[0]
+    conn.close()
+    return applications, error, failed_flushes, stored, checkpoints
+
+
+def check_sync_survives_faults(path):
+    tracker = make_tracker(path)
+    applications, error, failed_flushes, stored, checkpoints = sync(tracker, fault_for=0.3)
+    ok = error is None and failed_flushes > 0 and len(applications) == stored > 0 and checkpoints == 1
+    print(f"Sync with writes failing for 0.3s: {failed_flushes} failed flushes, "
+          f"{len(applications or [])} applications parsed, {stored} stored, checkpoint saved: {checkpoints == 1}")
+
+    applications, error, failed_flushes, stored, checkpoints = sync(tracker, fault_for=30)
+    ok &= error is not None and stored == 0 and checkpoints == 0
+    print(f"Sync with writes failing throughout: raised SyncFailed after {failed_flushes} failed flushes "
+          f"({error}), checkpoint saved: {checkpoints == 1}")
+    return ok
+
+
+def check_background_flush(path):
+    before = stored_ids(path)
+    set_poison(path, True)
+    writer = ApplicationWriter(path, batch_size=1000, flush_interval=0.05)
+    applications = batch(200, 40, poison_at=10)
+    for application in applications:
+        writer.add(application, application['email_id'])
+    time.sleep(0.5)  # Several failed background flushes
+    ok = stored_ids(path) == before and len(writer._pending) == 40
+    print(f"Background flush: {len(stored_ids(path)) - len(before)} rows stored, "
+          f"{len(writer._pending)} still buffered while failing")
+
+    set_poison(path, False)
+    deadline = time.time() + 5
+    while writer.rows_written < 40 and time.time() < deadline:
+        time.sleep(0.05)
+    writer.close()
+    ok &= stored_ids(path) == before + [a['email_id'] for a in applications]
+    print(f"  after removing the fault: {writer.rows_written} rows written by the flusher")
+    return ok
+
+
+def time_writes(path, rows):
+    applications = [make_application(i) for i in range(1000, 1000 + rows)]
+
+    start = time.perf_counter()
+    conn = sqlite3.connect(path)
+    for application in applications:  # One commit per row, as before the writer
+        conn.execute(INSERT_APPLICATION_SQL, (
+            application['email_id'], application['role'], application['company'], application['status'],
+            application['date_received'], application['subject'], application['sender'],
+            application['last_updated'], application['email_id']
+        ))
+        conn.commit()
+    conn.close()
+    per_row = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ApplicationWriter(path, batch_size=500, flush_interval=60) as writer:
+        for application in applications:
+            writer.add(application, application['email_id'])
+    batched = time.perf_counter() - start
+    print(f"{rows} rows: one commit per row {per_row:.2f}s, ApplicationWriter {batched:.2f}s "
+          f"({per_row / batched:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ApplicationWriter crash-safety check")
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp())
+    path = os.path.join(os.getcwd(), "job_applications.db")
+    make_database(path)
+
+    ok = check_explicit_flush(path)
+    ok &= check_full_batch(path)
+    ok &= check_background_flush(path)
+    ok &= check_buffer_cap(path)
+    ok &= check_sync_survives_faults(path)
+    time_writes(path, args.rows)
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+app_two bookmark grouping and deletion: the old urlparse-every-row versions vs.
+the indexed domain column, at growing table sizes.
+
+Each size starts from a database in the old schema (no domain column), so the
+one-time backfill is timed too. Also checks that both versions group the same
+way and delete the same bookmark.
+
+Runs in a temporary directory with its own bookmarks.db.
+
+Usage: python benchmarks/bench_bookmark_domains.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import urllib.parse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app_two  # noqa: E402
+
+
+def old_get_bookmarks():
+    conn = app_two.get_db_connection()
+    bookmarks = conn.execute("SELECT title, url FROM bookmarks").fetchall()
+    conn.close()
+    categorized_bookmarks = {}
+    for title, url in bookmarks:
+        domain = urllib.parse.urlparse(url).netloc
+        categorized_bookmarks.setdefault(domain, []).append({"title": title, "url": url})
+    return categorized_bookmarks
+
+
+def old_delete(url_to_delete):
+    domain = urllib.parse.urlparse(url_to_delete).netloc.lower() or url_to_delete.lower()
+    conn = app_two.get_db_connection()
+    deleted = None
+    for bookmark in conn.execute("SELECT * FROM bookmarks").fetchall():
+        if urllib.parse.urlparse(bookmark["url"]).netloc.lower().rstrip('/') == domain:
+            conn.execute("DELETE FROM bookmarks WHERE url = ?", (bookmark["url"],))
+            deleted = bookmark["url"]
+            break
+    conn.commit()
+    conn.close()
+    return deleted
+
+
+def build_old_db(count, seed=11):
+    if os.path.exists("bookmarks.db"):
+        os.remove("bookmarks.db")
+    rng = random.Random(seed)
+    domains = [f"jobs{i}.example.com" for i in range(200)] + ["www.linkedin.com", "in.indeed.com"]
+    conn = sqlite3.connect("bookmarks.db")
+    conn.execute('''
+        CREATE TABLE bookmarks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL UNIQUE
+        )
+    ''')
+    rows = [(f"Job {i}", f"https://{rng.choice(domains)}/view/{i}") for i in range(count)]
+    rows.append(("Last", "https://rare-board.example.org/view/last"))  # Worst case for the old linear delete
+    conn.executemany("INSERT INTO bookmarks (title, url) VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def timed(func, *args, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app_two domain index benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp())
+    client = app_two.app.test_client()
+    ok = True
+    print(f"{'bookmarks':>10} {'backfill':>9} {'list old':>9} {'list new':>9} "
+          f"{'one domain':>11} {'delete old':>11} {'delete new':>11}")
+    for size in args.sizes:
+        build_old_db(size)
+        list_old, grouped_old = timed(old_get_bookmarks, repeat=3)
+        delete_old, deleted_old = timed(old_delete, "https://rare-board.example.org/")
+
+        build_old_db(size)
+        with contextlib.redirect_stdout(io.StringIO()):
+            backfill, _ = timed(app_two.init_db)
+            list_new, grouped_new = timed(app_two.get_bookmarks, repeat=3)
+            one_domain, _ = timed(lambda: client.get("/bookmarks", query_string={"domain": "in.indeed.com"}),
+                                  repeat=20)
+            delete_new, response = timed(
+                lambda: client.delete("/bookmarks", json={"url": "https://rare-board.example.org/"})
+            )
+        ok &= grouped_new == grouped_old and response.status_code == 200 and deleted_old is not None
+        conn = app_two.get_db_connection()
+        ok &= conn.execute("SELECT COUNT(*) FROM bookmarks WHERE url = ?", (deleted_old,)).fetchone()[0] == 0
+        conn.close()
+        print(f"{size:>10} {backfill * 1000:>7.1f}ms {list_old * 1000:>7.1f}ms {list_new * 1000:>7.1f}ms "
+              f"{one_domain * 1000:>9.2f}ms {delete_old * 1000:>9.2f}ms {delete_new * 1000:>9.2f}ms")
+
+    # Rows written by app.py carry no domain; they are picked up on the next read
+    conn = app_two.get_db_connection()
+    conn.execute("INSERT INTO bookmarks (url, title) VALUES (?, ?)", ("https://New-Board.example.net/1", "New"))
+    conn.commit()
+    conn.close()
+    ok &= "new-board.example.net" in app_two.get_bookmarks()
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = client.delete("/bookmarks", json={"url": "www.linkedin.com", "all": True})
+    ok &= response.status_code == 200 and "www.linkedin.com" not in app_two.get_bookmarks()
+    print(f"Delete all for www.linkedin.com: {response.get_json()['message']}")
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Importing bookmarks into app_two over HTTP (threaded Werkzeug server): one POST
+/bookmarks per bookmark vs. a single POST /bookmarks/bulk as a JSON array and as
+a streamed NDJSON body.
+
+The import includes repeats and URLs already in the database, so every mode
+has to report the same created / duplicate split. Also checks that app.py's
+/api/bookmarks/bulk accepts the same payload, and that both bulk endpoints
+answer a database error with a JSON 500.
+
+Runs in a temporary directory with its own bookmarks.db.
+
+Usage: python benchmarks/bench_bookmark_import.py [--bookmarks 10000]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import requests  # type: ignore
+from werkzeug.serving import make_server  # type: ignore
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+import app_two  # noqa: E402
+
+BOARDS = ["www.linkedin.com", "in.indeed.com", "www.naukri.com", "wellfound.com", "unstop.com"]
+
+
+def make_bookmarks(count, seed=13):
+    rng = random.Random(seed)
+    bookmarks = [{"title": f"Job {i}", "url": f"https://{rng.choice(BOARDS)}/jobs/{i}"} for i in range(count)]
+    for i in rng.sample(range(count), count // 20):  # Saved twice in the same import
+        bookmarks[i] = dict(bookmarks[i - 1])
+    return bookmarks
+
+
+def fresh_db(preexisting):
+    if os.path.exists("bookmarks.db"):
+        os.remove("bookmarks.db")
+    with contextlib.redirect_stdout(io.StringIO()):
+        app_two.init_db()
+    conn = sqlite3.connect("bookmarks.db")
+    conn.executemany("INSERT INTO bookmarks (title, url, domain) VALUES (?, ?, ?)",
+                     [(b["title"], b["url"], app_two.normalize_domain(b["url"])) for b in preexisting])
+    conn.commit()
+    conn.close()
+
+
+def one_by_one(base, bookmarks):
+    session = requests.Session()
+    counts = {"created": 0, "duplicate": 0}
+    for bookmark in bookmarks:
+        response = session.post(f"{base}/bookmarks", json=bookmark)
+        counts["created" if response.status_code == 201 else "duplicate"] += 1
+    return counts
+
+
+def bulk_json(base, bookmarks):
+    body = requests.post(f"{base}/bookmarks/bulk", json=bookmarks).json()
+    return {"created": body["created"], "duplicate": body["duplicate"]}
+
+
+def bulk_ndjson(base, bookmarks):
+    lines = (json.dumps(bookmark).encode() + b"\n" for bookmark in bookmarks)  # Sent chunked as generated
+    body = requests.post(f"{base}/bookmarks/bulk", data=lines,
+                         headers={"Content-Type": "application/x-ndjson"}).json()
+    return {"created": body["created"], "duplicate": body["duplicate"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk bookmark import benchmark")
+    parser.add_argument("--bookmarks", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    os.chdir(tempfile.mkdtemp())
+    bookmarks = make_bookmarks(args.bookmarks)
+    preexisting = bookmarks[::50]
+
+    server = make_server("127.0.0.1", 0, app_two.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    ok = True
+    outcomes = []
+    for label, run in [("one POST per bookmark", one_by_one), ("bulk, JSON array", bulk_json),
+                       ("bulk, NDJSON stream", bulk_ndjson)]:
+        fresh_db(preexisting)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            counts = run(base, bookmarks)
+            elapsed = time.perf_counter() - start
+        stored = sqlite3.connect("bookmarks.db").execute("SELECT COUNT(*) FROM bookmarks").fetchone()[0]
+        outcomes.append((counts, stored))
+        print(f"{label:<22} {elapsed:7.2f}s  {len(bookmarks) / elapsed:9.0f} bookmarks/s  "
+              f"created {counts['created']}, duplicates {counts['duplicate']}, rows {stored}")
+    ok &= all(outcome == outcomes[0] for outcome in outcomes)
+
+    # Per-item results, validation and app.py's endpoint
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = app_two.app.test_client().post("/bookmarks/bulk", json=[
+            {"title": "New", "url": "https://example.com/new"}, {"title": "", "url": "https://example.com/x"},
+            "not an object", {"title": "New again", "url": "https://example.com/new"}
+        ])
+    statuses = [result["status"] for result in response.get_json()["results"]]
+    ok &= statuses == ["created", "invalid", "invalid", "duplicate"]
+    with app.app.test_client() as client:
+        response = client.post("/api/bookmarks/bulk", data=b'{"url": "https://example.com/ext"}\n{oops\n',
+                               headers={"Content-Type": "application/x-ndjson"})
+    statuses = [result["status"] for result in response.get_json()["results"]]
+    ok &= statuses == ["created", "invalid"]
+
+    # A database error fails the import the same way on both endpoints
+    conn = sqlite3.connect("bookmarks.db")
+    conn.execute("DROP TABLE bookmarks")
+    conn.close()
+    payload = [{"title": "Lost", "url": "https://example.com/lost"}]
+    errors = []
+    for flask_app, path in [(app_two.app, "/bookmarks/bulk"), (app.app, "/api/bookmarks/bulk")]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            response = flask_app.test_client().post(path, json=payload)
+        errors.append((response.status_code, (response.get_json(silent=True) or {}).get("error")))
+    ok &= all(status == 500 and error for status, error in errors)
+    print("Database error: " + ", ".join(f"{status} {error!r}" for status, error in errors))
+    server.shutdown()
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
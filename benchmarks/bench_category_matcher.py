@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Differential check and timing for job_Des.is_job_related and
+job_Des.matches_category: the category trie (with its LRU) against the
+original substring scans over JOB_RELATED_CATEGORIES.
+
+Exits non-zero if the two disagree on any generated term.
+
+Usage: python benchmarks/bench_category_matcher.py [--terms 200000] [--seed 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    import job_Des  # noqa: E402
+
+WORDS = [
+    "python", "engineer", "analyst", "team", "customer", "pipeline", "dashboard", "budget",
+    "report", "stakeholder", "product", "campaign", "growth", "platform", "quality", "ui", "UX",
+]
+
+
+def legacy_is_job_related(term):
+    term = term.lower()
+    return any(category in term for category in job_Des.JOB_RELATED_CATEGORIES)
+
+
+def legacy_matches_category(term):
+    """The keyword filter before the trie: the lowercased scan, then a case-sensitive one."""
+    return legacy_is_job_related(term) or any(category in term for category in job_Des.JOB_RELATED_CATEGORIES)
+
+
+def build_terms(count, seed):
+    """Categories, fragments and mutations of them, random words and noise, in mixed case."""
+    rng = random.Random(seed)
+    categories = sorted(job_Des.JOB_RELATED_CATEGORIES)
+    alphabet = string.ascii_letters + " -'é"
+    terms = ["", " ", "UI", "ui", "gui", "UX", "build", "GUIDE", "UIDesign", "İUI"]
+    while len(terms) < count:
+        kind = rng.randrange(6)
+        category = rng.choice(categories)
+        if kind == 0:
+            term = category
+        elif kind == 1:
+            start = rng.randrange(len(category))
+            term = category[start:rng.randrange(start, len(category) + 1)]
+        elif kind == 2:
+            term = rng.choice(WORDS) + category + rng.choice(WORDS)
+        elif kind == 3:
+            position = rng.randrange(len(category))
+            term = category[:position] + rng.choice(alphabet) + category[position + 1:]
+        elif kind == 4:
+            term = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+        else:
+            term = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+        if rng.random() < 0.3:
+            term = "".join(c.upper() if rng.random() < 0.5 else c for c in term)
+        terms.append(term)
+    return terms
+
+
+def timed(func, terms):
+    start = time.perf_counter()
+    for term in terms:
+        func(term)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Category matcher differential check")
+    parser.add_argument("--terms", type=int, default=200000, help="Number of generated terms")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    terms = build_terms(args.terms, args.seed)
+    mismatches = [
+        term for term in terms
+        if legacy_is_job_related(term) != job_Des.is_job_related(term)
+        or legacy_matches_category(term) != job_Des.matches_category(term)
+    ]
+
+    # Lemma streams repeat heavily; sample with a skew so the LRU sees realistic reuse
+    rng = random.Random(args.seed)
+    vocabulary = terms[:5000]
+    stream = [vocabulary[min(int(rng.paretovariate(1.2)) - 1, len(vocabulary) - 1)] for _ in range(args.terms)]
+
+    legacy_time = timed(legacy_is_job_related, stream)
+    job_Des.matches_category.cache_clear()
+    trie_time = timed(job_Des.is_job_related, stream)
+    job_Des.matches_category.cache_clear()
+    unique_time = timed(job_Des.is_job_related, list(dict.fromkeys(terms)))
+    unique_legacy_time = timed(legacy_is_job_related, list(dict.fromkeys(terms)))
+
+    print(f"Terms checked: {len(terms)}, mismatches: {len(mismatches)}")
+    for term in mismatches[:10]:
+        print(f"  {term!r}")
+    print(f"Skewed stream:  substring scan {legacy_time:.2f}s, trie+LRU {trie_time:.2f}s "
+          f"({legacy_time / trie_time:.1f}x)")
+    print(f"Unique terms:   substring scan {unique_legacy_time:.2f}s, trie {unique_time:.2f}s "
+          f"({unique_legacy_time / unique_time:.1f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cold-start time of the CLI and Flask entry points, each in a fresh interpreter,
+compared with a bare `python -c pass`.
+
+Usage: python benchmarks/bench_cold_start.py [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    "bare interpreter": ["-c", "pass"],
+    "import job_Des": ["-c", "import job_Des"],
+    "main_script.py --help": ["main_script.py", "--help"],
+    "app_three boot + GET /": ["-c", "import app_three; app_three.app.test_client().get('/')"],
+}
+
+
+def time_command(args, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per command")
+    args = parser.parse_args()
+
+    for label, command in COMMANDS.items():
+        timings = time_command(command, args.runs)
+        print(f"{label:<26} median {statistics.median(timings):.2f}s  min {min(timings):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-URL scrape latency with a Chrome per URL vs. a shared WebDriverPool.
+
+Serves a fixture job page from a local HTTP server so only browser startup and
+page handling are measured. Needs Chrome and the scraping dependencies.
+
+Usage: python benchmarks/bench_driver_pool.py [--urls 20] [--workers 4]
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import io
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_Des import WebDriverPool, get_driver_path, get_job_description  # noqa: E402
+
+FIXTURE = b"""<html><head><title>Data Analyst</title></head><body>
+<h1 class="job-title">Data Analyst Intern</h1>
+<div class="job-description">
+We are looking for a data analyst to support our marketing and finance teams.
+Requirements:
+Strong knowledge of database design, data analysis and cloud security.
+Experience with machine learning and web development is a plus.
+</div></body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(FIXTURE)))
+        self.end_headers()
+        self.wfile.write(FIXTURE)
+
+    def log_message(self, *args):
+        pass
+
+
+def scrape_all(urls, workers, pool):
+    """Scrape urls with `workers` threads and return per-URL latencies."""
+    def timed(url):
+        start = time.perf_counter()
+        get_job_description(url, pool=pool)
+        return time.perf_counter() - start
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(timed, urls))
+
+
+def report(label, latencies, wall):
+    print(f"{label:<12} mean {statistics.mean(latencies):.2f}s  "
+          f"median {statistics.median(latencies):.2f}s  max {max(latencies):.2f}s  wall {wall:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebDriverPool benchmark")
+    parser.add_argument("--urls", type=int, default=20, help="Number of fixture URLs to scrape")
+    parser.add_argument("--workers", type=int, default=4, help="Parallel scraping workers")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_port}/job/{i}" for i in range(args.urls)]
+
+    # Resolve chromedriver up front so neither run pays for the download
+    get_driver_path()
+
+    start = time.perf_counter()
+    unpooled = scrape_all(urls, args.workers, pool=None)
+    report("Per-URL", unpooled, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with WebDriverPool(size=args.workers) as pool:
+        pooled = scrape_all(urls, args.workers, pool=pool)
+    report("Pooled", pooled, time.perf_counter() - start)
+
+    print(f"Browsers started with pool: {pool.started} (vs {len(urls)})")
+    print(f"Mean latency speedup: {statistics.mean(unpooled) / statistics.mean(pooled):.2f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
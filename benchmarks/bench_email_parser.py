@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compare the precompiled EmailClassifier against the per-pattern
+extract_company / extract_role / determine_status functions.
+
+Usage: python benchmarks/bench_email_parser.py [--messages 5000] [--seed 7]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from email_parser import (  # noqa: E402
+    CLASSIFIER, JOB_ROLES, KNOWN_COMPANIES, determine_status, extract_company, extract_role
+)
+
+FILLER = (
+    "Thank you for your interest in the position. Our team reviews every profile carefully "
+    "and we will get back to you with next steps as soon as possible. "
+)
+PHRASES = [
+    "We are pleased to share your offer letter", "Congratulations on clearing the round",
+    "We would like to schedule an interview", "Please complete the technical assessment",
+    "A quick phone screen is planned", "We regret to inform you", "we are not moving forward",
+    "Your application received successfully", "The hiring is on hold", "You were not selected",
+    "an opportunity at Acme Labs Pvt Ltd.", "career with Initech Inc.", "internship at Globex",
+]
+SENDERS = [
+    "Recruiting <jobs@acme.com>", "LinkedIn <jobs-noreply@linkedin.com>", "Friend <someone@gmail.com>",
+    "Unstop <noreply@unstop.news>", "HR Team", "Talent <talent@initech.io>",
+]
+SUBJECTS = [
+    "Your application for {role}", "Interview with Globex for {role}", "Fwd: {role} opportunity",
+    "Update on your job application", "Acme careers: {role}", "Thank you for applying",
+]
+
+
+def build_corpus(count, seed):
+    """Build a deterministic list of (sender, subject, body) tuples."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        role = rng.choice(JOB_ROLES + ["Research Fellow", "Analyst"])
+        subject = rng.choice(SUBJECTS).format(role=role)
+        parts = [FILLER * rng.randint(2, 12)]
+        parts.extend(rng.sample(PHRASES, rng.randint(0, 3)))
+        if rng.random() < 0.2:
+            parts.append(rng.choice(KNOWN_COMPANIES))
+        if rng.random() < 0.5:
+            parts.append(f"We are hiring a {rng.choice(JOB_ROLES)}.")
+        rng.shuffle(parts)
+        corpus.append((rng.choice(SENDERS), subject, " ".join(parts)))
+    return corpus
+
+
+def run_legacy(corpus):
+    return [
+        (extract_company(sender, subject, body), extract_role(subject, body), determine_status(body, subject))
+        for sender, subject, body in corpus
+    ]
+
+
+def run_classifier(corpus):
+    return [CLASSIFIER.classify(sender, subject, body) for sender, subject, body in corpus]
+
+
+def timed(func, corpus, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # The legacy functions print debug lines; keep them out of the timing output
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = func(corpus)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EmailClassifier benchmark")
+    parser.add_argument("--messages", type=int, default=5000, help="Number of synthetic messages")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.messages, args.seed)
+    legacy_time, legacy = timed(run_legacy, corpus, args.repeat)
+    classifier_time, compiled = timed(run_classifier, corpus, args.repeat)
+
+    mismatches = [(c, a, b) for c, a, b in zip(corpus, legacy, compiled) if a != b]
+
+    print(f"Messages:        {len(corpus)}")
+    print(f"Legacy:          {legacy_time:.3f}s ({len(corpus) / legacy_time:,.0f} msg/s)")
+    print(f"EmailClassifier: {classifier_time:.3f}s ({len(corpus) / classifier_time:,.0f} msg/s)")
+    print(f"Speedup:         {legacy_time / classifier_time:.2f}x")
+    print(f"Mismatches:      {len(mismatches)}")
+    for (sender, subject, _), expected, got in mismatches[:5]:
+        print(f"  {sender!r} / {subject!r}: expected {expected}, got {got}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ExtractionPool timeouts: a job that hangs past the timeout must not keep its
+worker busy. After the timeout, quick jobs have to succeed again, and a quick
+job that shared the pool with the hung one is retried instead of failing.
+
+Usage: python benchmarks/bench_extraction_timeout.py [--timeout 1]
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from doc_extraction import ExtractionPool, ExtractionTimeout  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ExtractionPool timeout check")
+    parser.add_argument("--timeout", type=float, default=1.0)
+    args = parser.parse_args()
+    ok = True
+
+    # One worker: a hung job, then quick jobs on the same pool
+    pool = ExtractionPool(max_workers=1, max_pending=4, timeout=args.timeout)
+    pool.run(abs, -1)  # Start the worker
+    start = time.perf_counter()
+    try:
+        pool.run(time.sleep, 60)
+        ok = False
+    except ExtractionTimeout:
+        pass
+    print(f"Hung job raised ExtractionTimeout after {time.perf_counter() - start:.1f}s")
+    results = []
+    for _ in range(3):
+        start = time.perf_counter()
+        results.append(pool.run(abs, -7))
+        print(f"  quick job afterwards: {results[-1]} in {time.perf_counter() - start:.2f}s")
+    ok &= results == [7, 7, 7]
+    pool.close()
+
+    # Two workers: a quick-but-slow job running next to a hung one survives the recycle
+    pool = ExtractionPool(max_workers=2, max_pending=4, timeout=args.timeout)
+    pool.run(abs, -1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as threads:
+        hung = threads.submit(pool.run, time.sleep, 60)
+        time.sleep(0.05)
+        neighbour = threads.submit(pool.run, time.sleep, args.timeout * 0.9)
+        ok &= isinstance(hung.exception(), ExtractionTimeout)
+        try:
+            neighbour.result()
+            print("Job sharing the pool with the hung one: retried and finished")
+        except Exception as e:
+            ok = False
+            print(f"Job sharing the pool with the hung one failed: {e!r}")
+    print(f"Stats: {pool.stats()}")
+    pool.close()
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
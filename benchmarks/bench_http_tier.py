@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+The HTTP tier of job_Des.get_job_description against fixture pages.
+
+A local server stands in for the job boards: the shared requests session is
+pointed at it as an HTTP proxy, so URLs keep their real hostnames and the
+per-domain selectors apply. Checks that:
+
+- the Selenium selectors (CSS classes and ids, nth-of-type, attribute
+  matches, By.ID, By.TAG_NAME and the raw XPath title fallback) translate to
+  lxml and pick the same elements the browser would;
+- a page whose description is under MIN_DESCRIPTION_LENGTH characters, or is
+  rendered by JavaScript, falls through to the browser tier;
+- the result's "tier" says which path served it, and a page revalidated with
+  its ETag comes back as not modified.
+
+The browser tier is a fake WebDriverPool, so no Chrome is needed.
+
+Usage: python benchmarks/bench_http_tier.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_Des  # noqa: E402
+from job_Des import By, NoSuchElementException  # noqa: E402
+
+DESCRIPTION = ("We are looking for a data analyst to support our marketing and finance teams. "
+               "You will build dashboards and own the reporting pipeline.")
+BROWSER_DESCRIPTION = "Rendered in the browser: " + DESCRIPTION
+
+PAGES = {
+    "www.linkedin.com": f"""<html><body>
+<h1 class="top-card-layout__title">Wrong title</h1>
+<h2 class="job-details-jobs-unified-top-card__job-title t-24">LinkedIn Analyst</h2>
+<div class="description"><div class="show-more-less-html__markup relative">
+<script>window.tracking = "should not appear";</script>
+<p>{DESCRIPTION}</p></div></div></body></html>""",
+    "in.indeed.com": f"""<html><body>
+<h1 class="jobsearch-JobInfoHeader-title css-1">Indeed Analyst</h1>
+<div id="jobDescriptionText"><ul><li>{DESCRIPTION}</li></ul></div></body></html>""",
+    "unstop.com": f"""<html><body><h1>Unstop Analyst</h1>
+<div id="tab-detail"><div><p>About</p><ul><li>{DESCRIPTION}</li></ul><ul><li>Second list, not this one</li></ul></div>
+<div><ul><li>Other tab, not this one either</li></ul></div></div></body></html>""",
+    "careers.example.com": f"""<html><body>
+<h1 class="posting">Open position: Example Analyst</h1>
+<div class="posting-description-body"><p>{DESCRIPTION}</p></div></body></html>""",
+    "short.example.com": """<html><body><h1 class="job-title">Short Analyst</h1>
+<div class="job-description">Apply now.</div></body></html>""",
+    "spa.example.com": """<html><body><div id="root"></div><script src="/app.js"></script></body></html>""",
+}
+
+EXPECTED = {
+    "www.linkedin.com": ("LinkedIn Analyst", "http"),
+    "in.indeed.com": ("Indeed Analyst", "http"),
+    "unstop.com": ("Unstop Analyst", "http"),
+    "careers.example.com": ("Open position: Example Analyst", "http"),
+    "short.example.com": ("Browser Analyst", "browser"),
+    "spa.example.com": ("Browser Analyst", "browser"),
+}
+
+ETAG = '"fixture-v1"'
+
+
+class BoardHandler(BaseHTTPRequestHandler):
+    """Serves PAGES by the Host of the proxied URL, with an ETag."""
+    requests_seen = 0
+
+    def do_GET(self):
+        BoardHandler.requests_seen += 1
+        page = PAGES.get(urlparse(self.path).netloc)
+        if page is None:
+            self.send_error(404)
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = page.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeElement:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeDriver:
+    """Finds only the first fallback title and description selectors, like a rendered page would."""
+    elements = {
+        (By.CSS_SELECTOR, "h1.job-title"): "Browser Analyst",
+        (By.CSS_SELECTOR, "div.job-description"): BROWSER_DESCRIPTION,
+    }
+
+    def get(self, url):
+        pass
+
+    def find_element(self, by, value):
+        if (by, value) not in self.elements:
+            raise NoSuchElementException(value)
+        return FakeElement(self.elements[(by, value)])
+
+
+class FakePool:
+    def __init__(self):
+        self.used = 0
+
+    @contextlib.contextmanager
+    def driver(self):
+        self.used += 1
+        yield FakeDriver()
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BoardHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    job_Des.get_http_session().proxies["http"] = f"http://127.0.0.1:{server.server_port}"
+    ok = True
+
+    pool = FakePool()
+    for host, (title, tier) in EXPECTED.items():
+        url = f"http://{host}/jobs/view/1"
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = job_Des.get_job_description(url, pool=pool, analyze=False)
+        elapsed = time.perf_counter() - start
+        description = result["description"] or ""
+        expected_description = BROWSER_DESCRIPTION if tier == "browser" else DESCRIPTION
+        passed = (result["tier"] == tier and result["title"] == title
+                  and description == expected_description and "should not appear" not in description)
+        ok &= passed
+        print(f"{host:<20} tier {result['tier']:<8} {elapsed * 1000:7.1f} ms  "
+              f"title {result['title']!r}  {'ok' if passed else 'WRONG'}")
+    ok &= pool.used == 2
+    print(f"Browser tier used for {pool.used} of {len(EXPECTED)} pages")
+
+    # Short descriptions are rejected by the HTTP tier itself, titles are still kept
+    page = job_Des.fetch_job_page_http("http://short.example.com/jobs/view/1")
+    ok &= page["description"] is None and page["title"] == "Short Analyst" and page["etag"] == ETAG
+
+    # Revalidation with the stored validators
+    page = job_Des.fetch_job_page_http("http://in.indeed.com/jobs/view/1", cached={"etag": ETAG})
+    ok &= page["not_modified"] and page["description"] is None
+    print(f"Conditional GET with the ETag: not_modified={page['not_modified']}")
+
+    server.shutdown()
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Background enrichment jobs in app_four against a local stub SerpAPI with
+injected latency, served by a threaded Werkzeug server:
+
+- how long POST /jobs/enrich_bookmarks takes to hand back a job id;
+- /resources_from_db latency while the job runs (dashboard responsiveness);
+- results streamed over /jobs/<id>/events;
+- a restart halfway through: the job resumes with only the unfinished titles.
+
+The SerpAPI query cache is disabled so every upstream call is counted. Runs in a
+temporary directory with its own databases.
+
+Usage: python benchmarks/bench_job_queue.py [--bookmarks 300] [--latency 0.05]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import requests  # type: ignore
+from werkzeug.serving import make_server  # type: ignore
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_serpapi_enrichment import StubSerpAPI  # noqa: E402
+
+WORDS = ["data", "software", "product", "marketing", "design", "business", "backend", "frontend", "cloud",
+         "security", "growth", "content", "research", "platform", "mobile", "quality", "sales", "finance"]
+ROLES = ["Analyst", "Engineer", "Manager", "Associate", "Designer", "Developer", "Scientist", "Intern Lead"]
+
+
+def make_titles(count, seed=7):
+    rng = random.Random(seed)
+    titles = set()
+    while len(titles) < count:
+        titles.add(" ".join(rng.sample(WORDS, 2)).title() + " " + rng.choice(ROLES))
+    return sorted(titles)
+
+
+def stream_job(base, job_id):
+    """Read a job's SSE stream to the end; returns (result count, seconds to first result, final status)."""
+    start = time.perf_counter()
+    first, results, status, event = None, 0, None, None
+    with requests.get(f"{base}/jobs/{job_id}/events", stream=True) as response:
+        for line in response.iter_lines(decode_unicode=True):
+            if line.startswith("event: "):
+                event = line[7:]
+            elif line.startswith("data: "):
+                if event == "result":
+                    results += 1
+                    first = first or time.perf_counter() - start
+                elif event == "status":
+                    status = json.loads(line[6:])
+    return results, first, status
+
+
+def wait_for(predicate, timeout=60):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Background job queue benchmark")
+    parser.add_argument("--bookmarks", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per stub SerpAPI call")
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    StubSerpAPI.latency = args.latency
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), StubSerpAPI)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    os.environ["SERPAPI_URL"] = f"http://127.0.0.1:{stub.server_port}/search"
+    os.environ.setdefault("SERP_API_KEY", "stub")
+
+    os.chdir(tempfile.mkdtemp())
+    quiet = contextlib.redirect_stdout(io.StringIO())
+    quiet.__enter__()
+    import app_four
+    from job_queue import JobQueue
+    from serp_cache import SerpQueryCache
+    app_four.SERP_CACHE = SerpQueryCache(":memory:", ttl=0, stale_ttl=0)
+    titles = make_titles(args.bookmarks)
+    conn = app_four.init_db()
+    conn.executemany("INSERT INTO bookmarks (title, url) VALUES (?, ?)",
+                     [(title, f"https://example.com/{i}") for i, title in enumerate(titles)])
+    conn.commit()
+    conn.close()
+
+    server = make_server("127.0.0.1", 0, app_four.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    requests.get(f"{base}/jobs")  # First request starts the workers
+
+    # Submit, then stream results while polling the dashboard's read endpoint
+    StubSerpAPI.hits = 0
+    start = time.perf_counter()
+    job_id = requests.post(f"{base}/jobs/enrich_bookmarks").json()["job_id"]
+    submit_time = time.perf_counter() - start
+    streamed = {}
+    reader = threading.Thread(target=lambda: streamed.update(zip(("results", "first", "status"),
+                                                                  stream_job(base, job_id))))
+    reader.start()
+    latencies = []
+    while reader.is_alive():
+        request_start = time.perf_counter()
+        requests.get(f"{base}/resources_from_db")
+        latencies.append(time.perf_counter() - request_start)
+        time.sleep(0.05)
+    job_time = time.perf_counter() - start
+
+    # Restart halfway: close the queue mid-job, reopen the same database
+    StubSerpAPI.hits = 0
+    job_id = requests.post(f"{base}/jobs/enrich_bookmarks").json()["job_id"]
+    wait_for(lambda: app_four.JOB_QUEUE.get(job_id)["completed"] >= len(titles) // 2)
+    app_four.JOB_QUEUE.close()
+    reopened = JobQueue(app_four.JOB_QUEUE_DB, app_four.JOB_WORKERS)
+    reopened.register("enrich_bookmarks", app_four.enrich_bookmarks_job)
+    app_four.JOB_QUEUE = reopened
+    done_before_restart = len(reopened.results(job_id))
+    resumed = stream_job(base, job_id)  # Served by the new queue, started by this request
+    resumed_calls = StubSerpAPI.hits
+    quiet.__exit__(None, None, None)
+
+    ok = (streamed["results"] == len(titles) and streamed["status"]["status"] == "done"
+          and resumed[2]["status"] == "done" and resumed[0] == len(titles)
+          and resumed_calls < 2 * len(titles) + 2 * app_four.SERPAPI_CONCURRENCY)
+    print(f"Bookmarks: {len(titles)} distinct titles, stub latency {args.latency * 1000:.0f} ms, "
+          f"{app_four.SERPAPI_CONCURRENCY} concurrent SerpAPI calls")
+    print(f"Submit: {submit_time * 1000:.1f} ms to return a job id")
+    print(f"Job: {job_time:.2f}s, {streamed['results']} results streamed, first after "
+          f"{streamed['first'] * 1000:.0f} ms")
+    print(f"/resources_from_db during the job: {len(latencies)} requests, "
+          f"p50 {statistics.median(latencies) * 1000:.1f} ms, max {max(latencies) * 1000:.1f} ms")
+    print(f"Restart after {done_before_restart} of {len(titles)} titles: resumed job finished with "
+          f"{resumed[0]} results after {resumed_calls} SerpAPI calls across both runs "
+          f"({2 * len(titles)} without the restart)")
+    server.shutdown()
+    stub.shutdown()
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
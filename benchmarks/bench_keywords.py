@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Keyword extraction throughput: the old per-posting path (full pipeline, the
+description and its requirements section parsed separately, spaCy sentence
+splitting for the fallback) vs. analyze_descriptions with nlp.pipe.
+
+Needs spaCy with en_core_web_sm and the NLTK stopwords.
+
+Usage: python benchmarks/bench_keywords.py [--postings 3000] [--batch-size 64] [--n-process 1]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    import job_Des  # noqa: E402
+    import nlp_resources  # noqa: E402
+
+INTROS = [
+    "We are looking for a {role} to join our {area} team.",
+    "Our {area} group is hiring a {role} for a fast growing product.",
+    "As a {role} you will support {area} and {other} projects.",
+]
+DUTIES = [
+    "Build and maintain {area} pipelines with our engineering partners.",
+    "Work closely with marketing, finance and customer support.",
+    "Own the design of {other} features from research to production.",
+    "Improve testing, automation and monitoring of cloud services.",
+]
+REQUIREMENTS = [
+    "Experience with machine learning and data analysis.",
+    "Strong knowledge of database design and web development.",
+    "Familiarity with cloud security and network administration.",
+    "Excellent writing and communication skills.",
+]
+ROLES = ["data analyst", "software engineer", "product designer", "marketing associate"]
+AREAS = ["data", "security", "mobile", "research", "finance", "content"]
+
+
+def build_postings(count, seed=7):
+    """Synthetic job postings; half have a "Requirements:" section, half mention skills inline."""
+    rng = random.Random(seed)
+    postings = []
+    for i in range(count):
+        fill = {"role": rng.choice(ROLES), "area": rng.choice(AREAS), "other": rng.choice(AREAS)}
+        lines = [rng.choice(INTROS).format(**fill)]
+        lines += [rng.choice(DUTIES).format(**fill) for _ in range(rng.randint(3, 6))]
+        requirements = rng.sample(REQUIREMENTS, rng.randint(2, 4))
+        if i % 2:
+            lines += ["", "Requirements:"] + requirements
+        else:
+            lines.append(" ".join(requirements) + " These skills are required for the role.")
+        postings.append("\n".join(lines))
+    return postings
+
+
+def legacy_keywords(text):
+    return job_Des._keywords_from_tokens(nlp_resources.get("spacy_en")(text.lower())) if text else []
+
+
+def legacy_section(text, section_keywords=job_Des.SECTION_KEYWORDS):
+    spans = job_Des._section_spans(text, section_keywords)
+    if not spans:
+        spans = job_Des._keyword_sentence_spans(nlp_resources.get("spacy_en")(text), section_keywords)
+    return " ".join(text[start:end] for start, end in spans) if spans else None
+
+
+def run_legacy(postings):
+    results = []
+    for text in postings:
+        requirements_text = legacy_section(text)
+        results.append({
+            "description_keywords": legacy_keywords(text),
+            "requirements_text": requirements_text,
+            "requirements_keywords": legacy_keywords(requirements_text),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keyword extraction benchmark")
+    parser.add_argument("--postings", type=int, default=3000, help="Number of synthetic postings")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    postings = build_postings(args.postings)
+    job_Des.warm_up()
+
+    start = time.perf_counter()
+    legacy = run_legacy(postings)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = job_Des.analyze_descriptions(postings, batch_size=args.batch_size, n_process=args.n_process)
+    batched_time = time.perf_counter() - start
+
+    same_description = sum(a["description_keywords"] == b["description_keywords"] for a, b in zip(legacy, batched))
+    same_requirements = sum(a["requirements_keywords"] == b["requirements_keywords"] for a, b in zip(legacy, batched))
+
+    print(f"Postings:  {args.postings}")
+    print(f"Per-doc:   {legacy_time:.2f}s ({args.postings / legacy_time:.0f} docs/s)")
+    print(f"nlp.pipe:  {batched_time:.2f}s ({args.postings / batched_time:.0f} docs/s, "
+          f"batch {args.batch_size}, {args.n_process} process(es))")
+    print(f"Speedup:   {legacy_time / batched_time:.2f}x")
+    print(f"Identical description keywords:  {same_description}/{args.postings}")
+    print(f"Identical requirements keywords: {same_requirements}/{args.postings}")
+
+
+if __name__ == "__main__":
+    main()
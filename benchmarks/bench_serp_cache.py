@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SerpQueryCache in front of app_four against a local stub SerpAPI with injected
+latency: a cold and a warm /resources_for_all_bookmarks sweep, a burst of
+identical concurrent /fetch_resources requests, and serving stale entries while
+they refresh in the background. Also checks SerpQueryCache on its own: hits
+don't write to the database, eviction still follows the access times held in
+memory, and close() fails lookups waiting on a refresh it dropped.
+
+Runs in a temporary directory with its own bookmarks.db and serp_cache.db.
+
+Usage: python benchmarks/bench_serp_cache.py [--bookmarks 200] [--burst 32] [--latency 0.1]
+"""
+
+import argparse
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_serpapi_enrichment import ROLES, SUFFIXES, StubSerpAPI  # noqa: E402
+from serp_cache import ACCESS_FLUSH_SIZE, SerpQueryCache, query_key  # noqa: E402
+
+
+def timed(func):
+    StubSerpAPI.hits = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return time.perf_counter() - start, StubSerpAPI.hits, result
+
+
+def check_access_times():
+    """Hits stay in memory until ACCESS_FLUSH_SIZE of them are pending; eviction sees them all the same."""
+    cache = SerpQueryCache("access.db", max_entries=3)
+    for q in ("a", "b", "c"):
+        cache.get_or_fetch({"q": q}, lambda params: {"q": params["q"]})
+    changes = cache._conn.total_changes
+    for _ in range(ACCESS_FLUSH_SIZE // 2):
+        cache.get_or_fetch({"q": "a"}, None)
+        cache.get_or_fetch({"q": "c"}, None)
+    hit_writes = cache._conn.total_changes - changes
+    cache.get_or_fetch({"q": "d"}, lambda params: {"q": params["q"]})  # Evicts b, the least recently used
+    keys = [row[0] for row in cache._conn.execute("SELECT key FROM serp_cache ORDER BY key")]
+    cache.close()
+    ok = hit_writes == 0 and keys == [query_key({"q": q}) for q in ("a", "c", "d")]
+    print(f"{ACCESS_FLUSH_SIZE} hits: {hit_writes} rows written; after one more insert the cache holds "
+          f"{', '.join(json.loads(key)['q'] for key in keys)}")
+    return ok
+
+
+def check_close_with_queued_refreshes():
+    """Lookups coalesced onto refreshes that close() drops must fail, not hang."""
+    release = threading.Event()
+
+    def slow_fetch(params):
+        release.wait()
+        return {"q": params["q"], "refreshed": True}
+    cache = SerpQueryCache("close.db", ttl=60, stale_ttl=60, refresh_workers=1)
+    for q in ("a", "b", "c"):
+        cache.get_or_fetch({"q": q}, lambda params: {"q": params["q"]})
+    cache.ttl = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for q in ("a", "b", "c"):  # a refreshes, b and c queue behind it
+            cache.get_or_fetch({"q": q}, slow_fetch)
+    cache.stale_ttl = 0  # Now too old to serve: lookups wait on the queued refreshes
+
+    outcomes = {}
+
+    def lookup(q):
+        try:
+            outcomes[q] = cache.get_or_fetch({"q": q}, slow_fetch)
+        except RuntimeError as e:
+            outcomes[q] = e
+    waiters = [threading.Thread(target=lookup, args=(q,), daemon=True) for q in ("b", "c")]
+    for waiter in waiters:
+        waiter.start()
+    while cache.coalesced < 2:
+        time.sleep(0.01)
+    threading.Timer(0.2, release.set).start()
+    cache.close()
+    for waiter in waiters:
+        waiter.join(5)
+    ok = (not any(waiter.is_alive() for waiter in waiters) and not cache._inflight
+          and all(isinstance(outcomes.get(q), RuntimeError) for q in ("b", "c")))
+    print(f"close() with 2 refreshes queued: waiters got {', '.join(type(outcomes.get(q)).__name__ for q in ('b', 'c'))}, "
+          f"{len(cache._inflight)} left in flight")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SerpAPI query cache benchmark")
+    parser.add_argument("--bookmarks", type=int, default=200)
+    parser.add_argument("--burst", type=int, default=32, help="Concurrent identical /fetch_resources requests")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per stub SerpAPI call")
+    args = parser.parse_args()
+
+    StubSerpAPI.latency = args.latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSerpAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["SERPAPI_URL"] = f"http://127.0.0.1:{server.server_port}/search"
+    os.environ.setdefault("SERP_API_KEY", "stub")
+
+    os.chdir(tempfile.mkdtemp())
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app_four
+        conn = app_four.init_db()
+    rng = random.Random(4)
+    titles = [rng.choice(ROLES) + rng.choice(SUFFIXES) for _ in range(args.bookmarks)]
+    conn.executemany("INSERT INTO bookmarks (title, url) VALUES (?, ?)",
+                     [(title, f"https://example.com/{i}") for i, title in enumerate(titles)])
+    conn.commit()
+    conn.close()
+    client = app_four.app.test_client()
+    ok = True
+
+    cold_time, cold_hits, cold = timed(lambda: client.get("/resources_for_all_bookmarks").get_json())
+    warm_time, warm_hits, warm = timed(lambda: client.get("/resources_for_all_bookmarks").get_json())
+    ok &= warm == cold and warm_hits == 0
+    print(f"Bookmark sweep ({len(titles)} bookmarks), stub latency {args.latency * 1000:.0f} ms")
+    print(f"  cold: {cold_time:.2f}s, {cold_hits} SerpAPI calls")
+    print(f"  warm: {warm_time:.3f}s, {warm_hits} SerpAPI calls, same response: {warm == cold}")
+
+    # Identical queries with different spacing/case share one cache entry and one upstream call
+    queries = [" Python ", "python", "PYTHON", "python  "]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.burst) as executor:
+        def burst():
+            return list(executor.map(
+                lambda i: client.get("/fetch_resources", query_string={"q": queries[i % len(queries)]}).get_json(),
+                range(args.burst)
+            ))
+        burst_time, burst_hits, responses = timed(burst)
+    ok &= burst_hits == 1 and all(response == responses[0] for response in responses)
+    print(f"Burst of {args.burst} concurrent /fetch_resources: {burst_time:.2f}s, {burst_hits} SerpAPI calls")
+
+    # Age every entry past the TTL: served immediately, refreshed in the background
+    app_four.SERP_CACHE.ttl = 0
+    stale_time, _, _ = timed(lambda: client.get("/fetch_resources", query_string={"q": "python"}).get_json())
+    app_four.SERP_CACHE.ttl = 24 * 60 * 60
+    deadline = time.time() + 10
+    while app_four.SERP_CACHE.stats()["in_flight"] and time.time() < deadline:
+        time.sleep(0.01)
+    refreshed = StubSerpAPI.hits
+    ok &= stale_time < args.latency and refreshed == 1
+    print(f"Stale entry: served in {stale_time * 1000:.1f} ms, {refreshed} background refresh")
+
+    # Every entry stale at once, while new queries keep missing: refreshes queue
+    # behind a few workers and all upstream calls share SERPAPI_CONCURRENCY
+    app_four.SERP_CACHE.ttl = 0
+    StubSerpAPI.peak = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.burst) as executor:
+        def stale_sweep():
+            misses = executor.map(
+                lambda i: client.get("/fetch_resources", query_string={"q": f"new query {i}"}).get_json(),
+                range(args.burst)
+            )
+            sweep = client.get("/resources_for_all_bookmarks").get_json()
+            list(misses)
+            return sweep
+        sweep_time, _, sweep = timed(stale_sweep)
+    app_four.SERP_CACHE.ttl = 24 * 60 * 60
+    queued = app_four.SERP_CACHE.stats()["in_flight"]
+    deadline = time.time() + 60
+    while app_four.SERP_CACHE.stats()["in_flight"] and time.time() < deadline:
+        time.sleep(0.01)
+    refresh_threads = sum(thread.name.startswith("serp-refresh") for thread in threading.enumerate())
+    ok &= (sweep == cold and StubSerpAPI.peak <= app_four.SERPAPI_CONCURRENCY
+           and refresh_threads <= app_four.SERP_CACHE_REFRESH_WORKERS
+           and app_four.SERP_CACHE.stats()["in_flight"] == 0)
+    print(f"All stale: sweep served in {sweep_time:.2f}s with {queued} refreshes queued on "
+          f"{app_four.SERP_CACHE_REFRESH_WORKERS} workers; peak {StubSerpAPI.peak} SerpAPI calls in flight "
+          f"(cap {app_four.SERPAPI_CONCURRENCY})")
+
+    stats = client.get("/serp_cache/stats").get_json()
+    print("Stats:", ", ".join(f"{name}={value if not isinstance(value, float) else round(value, 3)}"
+                              for name, value in stats.items()))
+    server.shutdown()
+
+    ok &= check_access_times()
+    ok &= check_close_with_queued_refreshes()
+    print("OK" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+/resources_for_all_bookmarks against a local stub SerpAPI with injected latency:
+the old serial loop (two queries and one commit per bookmark) vs. the deduplicated,
+concurrent enrichment.
+
+Runs in a temporary directory with its own bookmarks.db.
+
+Usage: python benchmarks/bench_serpapi_enrichment.py [--bookmarks 200] [--latency 0.1]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+ROLES = ["Data Analyst", "Software Engineer", "Product Manager", "Marketing Associate", "UX Designer",
+         "Business Analyst", "Backend Developer", "Frontend Developer", "Data Scientist", "DevOps Engineer"]
+SUFFIXES = ["", " - Bangalore", " - Remote", " | LinkedIn", " Internship", " at Acme Corp", " | Naukri"]
+
+
+class StubSerpAPI(BaseHTTPRequestHandler):
+    latency = 0.1
+    hits = 0
+    active = 0
+    peak = 0  # Most calls in flight at once
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with StubSerpAPI.lock:
+            StubSerpAPI.hits += 1
+            StubSerpAPI.active += 1
+            StubSerpAPI.peak = max(StubSerpAPI.peak, StubSerpAPI.active)
+        time.sleep(self.latency)
+        with StubSerpAPI.lock:
+            StubSerpAPI.active -= 1
+        query = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+        body = json.dumps({"organic_results": [
+            {"title": f"{query} result {i}", "link": f"https://leetcode.com/{i}" if i % 2 else f"https://www.theforage.com/{i}",
+             "snippet": "stub"}
+            for i in range(5)
+        ]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_serial(app_four, titles):
+    """The pre-pipeline loop: two blocking queries and a commit for every bookmark."""
+    enriched = []
+    for raw_title in titles:
+        title = app_four.clean_title(raw_title)
+        leet_forage = app_four.fetch_links_for_job(title)
+        general = app_four.fetch_learning_resources(title)
+        combined = {"leetcode": leet_forage["leetcode"], "forage": leet_forage["forage"], "General": general}
+        app_four.save_resources_to_db(raw_title, combined)
+        enriched.append({"job_title": title, "resources": combined})
+    return enriched
+
+
+def timed(func, *args):
+    StubSerpAPI.hits = 0
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return time.perf_counter() - start, StubSerpAPI.hits, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SerpAPI enrichment benchmark")
+    parser.add_argument("--bookmarks", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per stub SerpAPI call")
+    args = parser.parse_args()
+
+    StubSerpAPI.latency = args.latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSerpAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["SERPAPI_URL"] = f"http://127.0.0.1:{server.server_port}/search"
+    os.environ.setdefault("SERP_API_KEY", "stub")
+
+    os.chdir(tempfile.mkdtemp())
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app_four
+        from serp_cache import SerpQueryCache
+        conn = app_four.init_db()
+    # Measure the enrichment itself, not the query cache in front of it
+    app_four.SERP_CACHE = SerpQueryCache(":memory:", ttl=0, stale_ttl=0)
+    rng = random.Random(4)
+    titles = [rng.choice(ROLES) + rng.choice(SUFFIXES) for _ in range(args.bookmarks)]
+    conn.executemany("INSERT INTO bookmarks (title, url) VALUES (?, ?)",
+                     [(title, f"https://example.com/{i}") for i, title in enumerate(titles)])
+    conn.commit()
+    conn.close()
+
+    client = app_four.app.test_client()
+    serial_time, serial_hits, serial = timed(run_serial, app_four, titles)
+    pipeline_time, pipeline_hits, response = timed(lambda: client.get("/resources_for_all_bookmarks"))
+    same = response.get_json() == serial
+
+    print(f"Bookmarks: {len(titles)} ({len({app_four.clean_title(t) for t in titles})} distinct cleaned titles), "
+          f"stub latency {args.latency * 1000:.0f} ms")
+    print(f"Serial:    {serial_time:.2f}s, {serial_hits} SerpAPI calls")
+    print(f"Pipeline:  {pipeline_time:.2f}s, {pipeline_hits} SerpAPI calls "
+          f"({app_four.SERPAPI_CONCURRENCY} concurrent)")
+    print(f"Speedup:   {serial_time / pipeline_time:.1f}x")
+    print(f"Same response: {same}")
+    server.shutdown()
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Skill-gap scoring of one resume against many synthetic job postings: a Python
+set difference per job vs. SkillGapEngine's sparse matrix operations.
+
+Also checks that both give the same missing skills and match percentages.
+
+Usage: python benchmarks/bench_skill_gap.py [--jobs 100000] [--vocabulary 3000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from skill_gap import SkillGapEngine  # noqa: E402
+
+
+def build_jobs(count, vocabulary_size, seed=3):
+    rng = random.Random(seed)
+    vocabulary = [f"skill{i}" for i in range(vocabulary_size)]
+    # Popular skills show up far more often, as in real postings
+    weights = [1.0 / (rank + 1) for rank in range(vocabulary_size)]
+    boards = ["linkedin.com", "indeed.com", "glassdoor.com", "naukri.com", "wellfound.com"]
+    jobs = {}
+    for i in range(count):
+        url = f"https://{rng.choice(boards)}/jobs/{i}"
+        jobs[url] = set(rng.choices(vocabulary, weights, k=rng.randint(4, 15)))
+    return jobs, vocabulary
+
+
+def score_with_sets(jobs, resume_skills):
+    results = {}
+    for url, job_skills in jobs.items():
+        missing = job_skills - resume_skills
+        results[url] = (100.0 * (len(job_skills) - len(missing)) / len(job_skills), missing)
+    ranked = sorted(results, key=lambda url: -results[url][0])
+    return ranked, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill-gap engine benchmark")
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--vocabulary", type=int, default=3000)
+    parser.add_argument("--resume-skills", type=int, default=25)
+    args = parser.parse_args()
+
+    jobs, vocabulary = build_jobs(args.jobs, args.vocabulary)
+    resume_skills = set(random.Random(5).sample(vocabulary[:300], args.resume_skills))
+
+    start = time.perf_counter()
+    engine = SkillGapEngine(jobs)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, set_results = score_with_sets(jobs, resume_skills)
+    set_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ranked, percentages, missing, have = engine.analyze(resume_skills, limit=50)
+    engine_time = time.perf_counter() - start
+
+    mismatches = sum(
+        abs(percentages[row] - set_results[url][0]) > 1e-4
+        or set(engine.row_skills(missing, row)) != set_results[url][1]
+        for row, url in enumerate(engine.urls)
+    )
+    top_sorted = all(percentages[a] >= percentages[b] for a, b in zip(ranked, ranked[1:]))
+
+    print(f"Jobs: {args.jobs}, vocabulary: {args.vocabulary}, resume skills: {args.resume_skills}")
+    print(f"Engine build (once per database change): {build_time * 1000:.0f} ms")
+    print(f"Python sets:   {set_time * 1000:.0f} ms")
+    print(f"SkillGapEngine: {engine_time * 1000:.0f} ms ({set_time / engine_time:.1f}x)")
+    print(f"Jobs with different results: {mismatches}; top 50 sorted: {top_sorted}")
+    return 1 if mismatches or not top_sorted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resume skill matching: one `\\b<skill>\\b` regex per skill vs. the SkillIndex
+trie matcher, on the app_three taxonomy padded with synthetic skills.
+
+Also checks that both find the same skills on generated resumes and exits
+non-zero if they don't.
+
+Usage: python benchmarks/bench_skill_matcher.py [--sizes 0,1000,5000] [--words 1500]
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_three import SKILL_INDEX  # noqa: E402
+from skill_matcher import SkillIndex  # noqa: E402
+
+FILLER = ["team", "experience", "built", "with", "and", "led", "the", "of", "systems", "scalable",
+          "data", "project", "node", "script", "java", "c", "+", "#", "/", ".", "-"]
+
+
+def per_skill_regex(entries, text):
+    text = text.lower()
+    return [(skill, category) for skill, category in entries
+            if re.search(r"\b" + re.escape(skill) + r"\b", text, re.IGNORECASE)]
+
+
+def build_resume(skills, words, rng):
+    return " ".join(rng.choice(FILLER) if rng.random() < 0.85 else rng.choice(skills) for _ in range(words))
+
+
+def synthetic_skills(count, rng):
+    def word():
+        return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+    return [word() if rng.random() < 0.6 else f"{word()} {word()}" for _ in range(count)]
+
+
+def timed(func, *args, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill matcher benchmark")
+    parser.add_argument("--sizes", default="0,1000,5000", help="Synthetic skills added to the taxonomy")
+    parser.add_argument("--words", type=int, default=1500, help="Words per generated resume")
+    parser.add_argument("--resumes", type=int, default=500, help="Resumes for the equality check")
+    args = parser.parse_args()
+    rng = random.Random(9)
+
+    taxonomy = SKILL_INDEX.entries
+    skills = [skill for skill, _ in taxonomy]
+    mismatches = 0
+    for _ in range(args.resumes):
+        resume = build_resume(skills, rng.randint(5, 200), rng)
+        mismatches += per_skill_regex(taxonomy, resume) != SKILL_INDEX.matched_entries(resume)
+    print(f"Equality check: {args.resumes} resumes, {mismatches} mismatches")
+
+    for size in (int(size) for size in args.sizes.split(",")):
+        entries = taxonomy + [(skill, "synthetic") for skill in synthetic_skills(size, rng)]
+        build_time, index = timed(SkillIndex, entries, repeat=1)
+        resume = build_resume([skill for skill, _ in entries], args.words, rng)
+        regex_time, _ = timed(per_skill_regex, entries, resume)
+        index_time, _ = timed(index.matched_entries, resume)
+        print(f"{len(entries):>6} skills: per-skill regex {regex_time * 1000:7.1f} ms, "
+              f"SkillIndex {index_time * 1000:5.1f} ms (built in {build_time * 1000:.0f} ms)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
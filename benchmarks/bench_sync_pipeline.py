@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compare serial fetch+parse with GmailSyncPipeline against a fake Gmail client
+that serves canned messages with injected latency.
+
+Usage: python benchmarks/bench_sync_pipeline.py [--messages 400] [--latency 0.02]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_email_parser import build_corpus  # noqa: E402
+from email_parser import parse_message  # noqa: E402
+from gmail_pipeline import GmailSyncPipeline  # noqa: E402
+
+
+class FakeGmail:
+    """Serves canned messages in pages, sleeping to mimic list and get round trips."""
+
+    def __init__(self, count, latency, page_size=100):
+        self.latency = latency
+        self.page_size = page_size
+        self.messages = {}
+        for i, (sender, subject, body) in enumerate(build_corpus(count, seed=11)):
+            message_id = f"msg{i:06d}"
+            self.messages[message_id] = SimpleNamespace(
+                id=message_id, subject=subject, sender=sender, snippet=body[:100],
+                plain=body, date="2026-01-01 10:00:00+00:00",
+            )
+
+    def list_pages(self):
+        ids = sorted(self.messages)
+        for i in range(0, len(ids), self.page_size):
+            time.sleep(self.latency)
+            yield [{"id": message_id, "threadId": message_id} for message_id in ids[i:i + self.page_size]]
+
+    def fetch(self, ref):
+        time.sleep(self.latency)
+        return self.messages[ref["id"]]
+
+
+def run_serial(gmail):
+    refs = [ref for page in gmail.list_pages() for ref in page]
+    return [(message, parse_message(message)) for message in (gmail.fetch(ref) for ref in refs)]
+
+
+def run_pipeline(gmail, args):
+    pipeline = GmailSyncPipeline(
+        gmail.list_pages, gmail.fetch, fetch_workers=args.fetch_workers,
+        parse_workers=args.parse_workers, parse_queue_size=args.parse_queue_size,
+    )
+    return list(pipeline.run())
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gmail sync pipeline benchmark")
+    parser.add_argument("--messages", type=int, default=400, help="Number of canned messages")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per fake API call")
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument("--parse-workers", type=int, default=2)
+    parser.add_argument("--parse-queue-size", type=int, default=64)
+    args = parser.parse_args()
+
+    gmail = FakeGmail(args.messages, args.latency)
+    serial_time, serial = timed(run_serial, gmail)
+    pipeline_time, piped = timed(run_pipeline, gmail, args)
+
+    def summary(results):
+        return sorted((m.id, a["company"], a["role"], a["status"]) for m, a in results if a)
+
+    same = summary(serial) == summary(piped)
+    print(f"Messages:  {args.messages} (latency {args.latency * 1000:.0f} ms per call)")
+    print(f"Serial:    {serial_time:.2f}s")
+    print(f"Pipeline:  {pipeline_time:.2f}s ({args.fetch_workers} fetch threads, "
+          f"{args.parse_workers} parse processes)")
+    print(f"Speedup:   {serial_time / pipeline_time:.2f}x")
+    print(f"Same results: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Load test for /analyze_resume: concurrent PDF uploads against app_three served
+by a threaded Werkzeug server, with extraction inline on the request threads
+vs. in the ExtractionPool.
+
+Most uploads are one-page resumes; every fourth is a long, text-dense PDF. The
+result cache is disabled so every upload is parsed.
+
+Usage: python benchmarks/bench_upload_load.py [--clients 16] [--requests 160]
+"""
+
+import argparse
+import concurrent.futures
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+import requests  # type: ignore
+from werkzeug.serving import make_server  # type: ignore
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app_three  # noqa: E402
+from doc_extraction import ExtractionPool  # noqa: E402
+from resume_cache import ResumeResultCache  # noqa: E402
+
+LINE = "Python developer with AWS, Docker, Kubernetes, SQL and strong communication skills"
+
+
+def make_pdf(pages, lines_per_page=45):
+    """A minimal text PDF with `pages` pages of repeated resume lines."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_refs = []
+    for page in range(pages):
+        lines = "".join(f"({LINE} {page}.{i}) Tj 0 -14 Td " for i in range(lines_per_page))
+        stream = f"BT /F1 10 Tf 40 780 Td {lines}ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        page_refs.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(page_refs)}] /Count {pages} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def run_load(url, clients, total, small, large):
+    """Fire `total` uploads from `clients` threads; returns {kind: [latency]} and status counts."""
+    latencies = {"small": [], "large": []}
+    statuses = {}
+    lock = threading.Lock()
+
+    def upload(i):
+        kind, body = ("large", large) if i % 4 == 0 else ("small", small)
+        start = time.perf_counter()
+        response = requests.post(url, files={"file": ("resume.pdf", body, "application/pdf")})
+        elapsed = time.perf_counter() - start
+        with lock:
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                latencies[kind].append(elapsed)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=clients) as executor:
+        list(executor.map(upload, range(total)))
+    return latencies, statuses
+
+
+def percentile(values, pct):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/analyze_resume load test")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent uploading clients")
+    parser.add_argument("--requests", type=int, default=160, help="Uploads per run")
+    parser.add_argument("--large-pages", type=int, default=15, help="Pages in the large PDF")
+    parser.add_argument("--workers", type=int, default=app_three.EXTRACTION_WORKERS)
+    parser.add_argument("--queue-depth", type=int, default=app_three.EXTRACTION_QUEUE_DEPTH)
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    app_three.RESUME_CACHE = ResumeResultCache(max_entries=0)
+    small, large = make_pdf(1), make_pdf(args.large_pages)
+
+    server = make_server("127.0.0.1", 0, app_three.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/analyze_resume"
+
+    modes = [
+        ("inline", ExtractionPool(max_workers=0)),
+        (f"pool ({args.workers} workers, depth {args.queue_depth})",
+         ExtractionPool(args.workers, args.queue_depth, app_three.EXTRACTION_TIMEOUT)),
+    ]
+    for label, pool in modes:
+        app_three.EXTRACTION_POOL = pool
+        run_load(url, 2, 4, small, large)  # Warm up workers and imports
+        start = time.perf_counter()
+        latencies, statuses = run_load(url, args.clients, args.requests, small, large)
+        wall = time.perf_counter() - start
+        print(f"{label}: {wall:.1f}s wall, statuses {dict(sorted(statuses.items()))}")
+        for kind, values in latencies.items():
+            if values:
+                print(f"  {kind:<5} p50 {statistics.median(values) * 1000:7.0f} ms   "
+                      f"p99 {percentile(values, 99) * 1000:7.0f} ms")
+        pool.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
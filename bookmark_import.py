@@ -0,0 +1,115 @@
+import json
+
+MAX_BULK_BOOKMARKS = 20000  # Per request
+NDJSON_MIMETYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+IN_CHUNK_SIZE = 500  # Stay under SQLite's bound-parameter limit
+
+
+class TooManyBookmarks(ValueError):
+    """The request carries more than MAX_BULK_BOOKMARKS bookmarks."""
+
+
+def parse_bulk_request(request, limit=MAX_BULK_BOOKMARKS):
+    """
+    Bookmarks from a bulk import request: a JSON array, or NDJSON (one object per
+    line, read from the stream as it arrives). Returns a list of entries, where a
+    line that isn't valid JSON becomes a ValueError in its place.
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        entries = []
+        for line in request.stream:
+            if not line.strip():
+                continue
+            if len(entries) >= limit:
+                raise TooManyBookmarks(f"At most {limit} bookmarks per import")
+            try:
+                entries.append(json.loads(line))
+            except ValueError as e:
+                entries.append(ValueError(f"Invalid JSON: {e}"))
+        return entries
+
+    entries = request.get_json(silent=True)
+    if not isinstance(entries, list):
+        raise ValueError("Expected a JSON array of bookmarks or an NDJSON body")
+    if len(entries) > limit:
+        raise TooManyBookmarks(f"At most {limit} bookmarks per import")
+    return entries
+
+
+def _validate(entry, require_title):
+    """(title, url) for a valid entry, else raises ValueError."""
+    if isinstance(entry, ValueError):
+        raise entry
+    if not isinstance(entry, dict):
+        raise ValueError("Expected an object with title and url")
+    url, title = entry.get("url"), entry.get("title", "")
+    if not isinstance(url, str) or not url.strip():
+        raise ValueError("url is required")
+    if title is None:
+        title = ""
+    if not isinstance(title, str):
+        raise ValueError("title must be a string")
+    if require_title and not title.strip():
+        raise ValueError("title is required")
+    return title, url
+
+
+def import_bookmarks(conn, entries, require_title=True, derived_columns=None):
+    """
+    Insert parsed bookmarks in one transaction and report what happened to each.
+
+    Entries are validated in one pass. URLs already stored, or repeated within
+    the batch, are reported as duplicates; the rest go in with a single
+    executemany INSERT OR IGNORE. derived_columns maps extra column names to
+    functions of the URL (e.g. app_two's domain).
+
+    Returns (results, counts): one {"index", "url", "status"[, "error"]} per
+    entry, status being "created", "duplicate" or "invalid".
+    """
+    derived_columns = derived_columns or {}
+    results = []
+    valid = []
+    for index, entry in enumerate(entries):
+        try:
+            title, url = _validate(entry, require_title)
+        except ValueError as e:
+            url = entry.get("url") if isinstance(entry, dict) else None
+            results.append({"index": index, "url": url, "status": "invalid", "error": str(e)})
+            continue
+        results.append({"index": index, "url": url, "status": None})
+        valid.append((index, title, url))
+
+    # IMMEDIATE takes the write lock up front, so nothing can slip in between
+    # the duplicate check and the insert
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        urls = list({url for _, _, url in valid})
+        existing = set()
+        for start in range(0, len(urls), IN_CHUNK_SIZE):
+            chunk = urls[start:start + IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            existing.update(row[0] for row in conn.execute(
+                f"SELECT url FROM bookmarks WHERE url IN ({placeholders})", chunk
+            ))
+
+        rows = []
+        for index, title, url in valid:
+            if url in existing:
+                results[index]["status"] = "duplicate"
+            else:
+                existing.add(url)
+                results[index]["status"] = "created"
+                rows.append((title, url, *(derive(url) for derive in derived_columns.values())))
+
+        columns = ", ".join(["title", "url", *derived_columns])
+        placeholders = ", ".join("?" * (2 + len(derived_columns)))
+        conn.executemany(f"INSERT OR IGNORE INTO bookmarks ({columns}) VALUES ({placeholders})", rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    counts = {"created": 0, "duplicate": 0, "invalid": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    return results, counts
@@ -1,78 +1,207 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, render_template, jsonify, request, Response
 import sqlite3
 import os
 import json
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from flask_cors import CORS
+import application_stats
 app = Flask(__name__)
 CORS(app)  # Allow cross-origin requests
 
 
-# Function to get data from database
-def get_application_data():
-    db_path = "./data/job_applications.db"
-    
-    if not os.path.exists(db_path):
-        return {
-            "applications": [],
-            "status_counts": {},
-            "company_counts": {},
-            "total": 0
-        }
+DB_PATH = "./data/job_applications.db"
+
+# Columns a client may request with ?fields=, mapped to their SQL
+APPLICATION_FIELDS = {
+    "id": "id",
+    "role": "role",
+    "company": "company",
+    "status": "status",
+    "date_received": "date_received",
+    "subject": "subject",
+    "sender": "sender",
+    "last_updated": "last_updated",
+    "message_id": "message_id",
+    "gmail_link": "CASE WHEN message_id IS NOT NULL "
+                  "THEN 'https://mail.google.com/mail/u/0/#inbox/' || message_id END",
+}
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class ResponseCache:
+    """
+    In-process cache of serialized API responses.
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    Entries are keyed by path and query parameters and tagged with a generation
+    number. The generation moves whenever PRAGMA data_version on a long-lived
+    connection changes, i.e. whenever another connection (the tracker) has
+    committed to the database, so every entry goes stale at once.
+    """
+
+    def __init__(self, db_path, max_entries=256):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._data_version = None
+        self._generation = 0
+
+    def _current_generation(self):
+        if self._conn is None:
+            if not os.path.exists(self.db_path):
+                return None
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._generation += 1
+        return self._generation
+
+    def get_or_compute(self, key, compute):
+        """Return (body, etag) for key, calling compute() for the payload on a miss."""
+        with self._lock:
+            generation = self._current_generation()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], entry[2]
+            self.misses += 1
+        
+        body = json.dumps(compute())
+        etag = hashlib.sha1(body.encode()).hexdigest()
+        if generation is not None:
+            with self._lock:
+                self._entries[key] = (generation, body, etag)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return body, etag
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries)
+            }
+
+
+response_cache = ResponseCache(DB_PATH)
+
+
+def cached_json(compute):
+    """Serve compute()'s payload from the response cache, answering If-None-Match with a 304."""
+    key = (request.path, tuple(sorted(request.args.items(multi=True))))
+    body, etag = response_cache.get_or_compute(key, compute)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def encode_cursor(date_received, row_id):
+    """Opaque keyset cursor for the row a page ended on."""
+    return base64.urlsafe_b64encode(json.dumps([date_received, row_id]).encode()).decode()
+
+
+def decode_cursor(cursor):
+    date_received, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return date_received or "", int(row_id)  # A missing date sorts as ''
+
+
+def get_application_page(limit=DEFAULT_PAGE_SIZE, cursor=None, status=None, company=None,
+                         date_from=None, date_to=None, fields=None):
+    """
+    Get one page of applications, newest first.
     
-    # Get all applications
-    cursor.execute('''
-    SELECT role, company, status, date_received, subject, sender, last_updated, message_id
-    FROM job_applications
-    ORDER BY date_received DESC
-    ''')
+    Pages are keyset-paginated on (date_received, id), so every page is an
+    indexed range scan no matter how deep it is or how big the table gets.
+    Applications without a date sort as '' and so come last.
+    """
+    sort_key = application_stats.PAGE_SORT_KEY
+    fields = fields or list(APPLICATION_FIELDS)
+    if not os.path.exists(DB_PATH):
+        return {"applications": [], "next_cursor": None}
     
-    applications = []
-    for row in cursor.fetchall():
-        app_data = dict(row)
-        message_id = app_data.get("message_id")
-        if message_id:
-            # Generate Gmail link using message_id
-            app_data["gmail_link"] = f"https://mail.google.com/mail/u/0/#inbox/{message_id}"
-        else:
-            app_data["gmail_link"] = None
-        applications.append(app_data)
+    where = []
+    params = []
+    if status:
+        where.append("status = ?")
+        params.append(status)
+    if company:
+        where.append("company = ?")
+        params.append(company)
+    if date_from:
+        where.append(f"{sort_key} >= ?")
+        params.append(date_from)
+    if date_to:
+        where.append(f"{sort_key} <= ? AND date_received IS NOT NULL")
+        params.append(date_to)
+    if cursor:
+        # Same as ({sort_key}, id) < (?, ?), written so SQLite seeks on the index
+        # instead of scanning it
+        date_received, row_id = decode_cursor(cursor)
+        where.append(f"{sort_key} <= ? AND ({sort_key} < ? OR id < ?)")
+        params.extend([date_received, date_received, row_id])
     
-    # Get status counts
-    cursor.execute('''
-    SELECT status, COUNT(*) as count
+    columns = ", ".join(f"{APPLICATION_FIELDS[field]} AS {field}" for field in fields)
+    query = f'''
+    SELECT {columns}, {sort_key} AS _date_received, id AS _id
     FROM job_applications
-    GROUP BY status
-    ''')
+    {"WHERE " + " AND ".join(where) if where else ""}
+    ORDER BY {sort_key} DESC, id DESC
+    LIMIT ?
+    '''
     
-    status_counts = {row['status']: row['count'] for row in cursor.fetchall()}
+    conn = application_stats.connect(DB_PATH)
+    # Fetch one extra row to know whether another page exists
+    rows = conn.execute(query, params + [limit + 1]).fetchall()
+    conn.close()
     
-    # Get company counts
-    cursor.execute('''
-    SELECT company, COUNT(*) as count
-    FROM job_applications
-    GROUP BY company
-    ORDER BY count DESC
-    LIMIT 10
-    ''')
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["_date_received"], rows[-1]["_id"])
     
-    company_counts = {row['company']: row['count'] for row in cursor.fetchall()}
+    return {
+        "applications": [{field: row[field] for field in fields} for row in rows],
+        "next_cursor": next_cursor
+    }
+
+
+def get_application_counts():
+    """Get totals, status counts and top company counts."""
+    if not os.path.exists(DB_PATH):
+        return {
+            "status_counts": {},
+            "company_counts": {},
+            "total": 0
+        }
     
-    conn.close()
+    conn = application_stats.connect(DB_PATH)
     
-    return {
-        "applications": applications,
-        "status_counts": status_counts,
-        "company_counts": company_counts,
-        "total": len(applications)
+    # Counts are aggregated in SQLite by the shared stats API
+    counts = {
+        "status_counts": application_stats.status_counts(conn),
+        "company_counts": application_stats.company_counts(conn, limit=10),
+        "total": application_stats.total_applications(conn)
     }
+    
+    conn.close()
+    return counts
 
 @app.route('/')
 def index():
@@ -81,9 +210,48 @@ def index():
 
 @app.route('/api/applications')
 def api_applications():
-    """API endpoint to get all application data."""
-    data = get_application_data()
-    return jsonify(data)
+    """
+    API endpoint for one page of applications.
+    
+    Query parameters: limit, cursor (next_cursor from the previous page),
+    status, company, date_from, date_to and fields (comma-separated).
+    """
+    args = request.args
+    try:
+        limit = int(args.get('limit', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_SIZE}"}), 400
+    
+    fields = [field.strip() for field in args.get('fields', '').split(',') if field.strip()]
+    unknown = [field for field in fields if field not in APPLICATION_FIELDS]
+    if unknown:
+        return jsonify({"error": f"Unknown fields: {', '.join(unknown)}",
+                        "allowed_fields": list(APPLICATION_FIELDS)}), 400
+    
+    try:
+        return cached_json(lambda: get_application_page(
+            limit=limit,
+            cursor=args.get('cursor'),
+            status=args.get('status'),
+            company=args.get('company'),
+            date_from=args.get('date_from'),
+            date_to=args.get('date_to'),
+            fields=fields
+        ))
+    except (ValueError, TypeError):
+        return jsonify({"error": "Invalid cursor"}), 400
+
+@app.route('/api/applications/stats')
+def api_application_stats():
+    """API endpoint for application totals and counts."""
+    return cached_json(get_application_counts)
+
+@app.route('/api/cache/stats')
+def api_cache_stats():
+    """Hit/miss counters for the API response cache."""
+    return jsonify(response_cache.stats())
 
 if __name__ == '__main__':
     app.run(port=5004, debug=True)
\ No newline at end of file
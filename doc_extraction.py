@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Document text extraction that can run off the request thread.
+
+The extract_* functions are plain top-level functions over bytes or paths, so
+they can be shipped to worker processes. ExtractionPool runs them in a bounded
+process pool: callers block on the result with a timeout, and submissions are
+refused outright once too many jobs are pending, so a burst of large uploads
+turns into quick 503s instead of a growing queue. Workers stuck on a job past
+the timeout are killed and replaced.
+"""
+
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+import weakref
+from io import BytesIO
+
+
+class TooManyPages(ValueError):
+    """The document has more pages than the configured limit."""
+
+
+class PoolSaturated(RuntimeError):
+    """Every pool slot is taken; the caller should retry later."""
+
+
+class ExtractionTimeout(RuntimeError):
+    """The job didn't finish within the pool's timeout."""
+
+
+def _as_stream(source):
+    return BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def _check_pages(count, max_pages):
+    if max_pages is not None and count > max_pages:
+        raise TooManyPages(f"Document has {count} pages (limit {max_pages})")
+
+
+def extract_pdf_text(source, max_pages=None):
+    """Text of a PDF (bytes, path or binary stream) via PyPDF2, pages joined by spaces."""
+    import PyPDF2  # type: ignore
+    pdf_reader = PyPDF2.PdfReader(_as_stream(source))
+    _check_pages(len(pdf_reader.pages), max_pages)
+    return " ".join(page.extract_text() or "" for page in pdf_reader.pages)
+
+
+def extract_pdfplumber_text(source, max_pages=None):
+    """Text of a PDF (bytes, path or binary stream) via pdfplumber, pages joined by newlines."""
+    import pdfplumber  # type: ignore
+    with pdfplumber.open(_as_stream(source)) as pdf:
+        _check_pages(len(pdf.pages), max_pages)
+        return "\n".join(text for text in (page.extract_text() for page in pdf.pages) if text)
+
+
+def extract_docx_text(source):
+    """Text of a DOCX (bytes, path or binary stream), paragraphs joined by spaces."""
+    import docx  # type: ignore
+    doc = docx.Document(_as_stream(source))
+    return " ".join(para.text for para in doc.paragraphs)
+
+
+def extract_document_text(data, file_ext, max_pages=None):
+    """Text of an uploaded document given its bytes and extension."""
+    if file_ext == '.pdf':
+        return extract_pdf_text(data, max_pages)
+    elif file_ext in ['.doc', '.docx']:
+        return extract_docx_text(data)
+    else:
+        raise ValueError(f"Unsupported file type: {file_ext}")
+
+
+class ExtractionPool:
+    """
+    Bounded process pool for CPU-heavy extraction.
+
+    At most `max_pending` jobs (running plus queued) are accepted; run() raises
+    PoolSaturated beyond that and ExtractionTimeout if a job takes longer than
+    `timeout` seconds. A running job can't be cancelled, so on a timeout the
+    pool's worker processes are terminated and a fresh pool is started for the
+    next job; other jobs that were on the killed workers are retried once there, with
+    a fresh timeout.
+    With max_workers=0 jobs run inline on the calling thread.
+
+    Workers are started lazily with the "spawn" method, which is safe to use from
+    a multi-threaded server.
+    """
+
+    def __init__(self, max_workers=2, max_pending=8, timeout=30):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.rejected = 0
+        self.timed_out = 0
+        self.recycled = 0
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._killed = weakref.WeakSet()  # Executors recycled after a timeout
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def run(self, func, *args):
+        """Run func(*args) in the pool and return its result."""
+        if self.max_workers == 0:
+            return func(*args)
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise PoolSaturated(f"{self.max_pending} extraction jobs already pending")
+        try:
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    future = executor.submit(func, *args)
+                    return future.result(timeout=self.timeout)
+                except concurrent.futures.TimeoutError:
+                    self.timed_out += 1
+                    self._kill_executor(executor)
+                    raise ExtractionTimeout(f"Extraction took longer than {self.timeout}s")
+                except BrokenProcessPool:
+                    # A worker died: killed after another job's timeout (retry on a
+                    # fresh pool) or on its own, e.g. for memory (give up)
+                    self._discard_executor(executor)
+                    if attempt == 0 and executor in self._killed:
+                        continue
+                    raise
+                except RuntimeError:
+                    # Submitted just as another job's timeout shut this executor down
+                    if attempt == 0 and executor in self._killed:
+                        continue
+                    raise
+        finally:
+            self._slots.release()
+
+    def _kill_executor(self, executor):
+        """Terminate an executor's worker processes so a hung job stops using them."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+            if executor in self._killed:
+                return
+            self._killed.add(executor)
+            self.recycled += 1
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _discard_executor(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+    def stats(self):
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "recycled": self.recycled
+        }
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
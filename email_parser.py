@@ -4,8 +4,71 @@
 import re
 from datetime import datetime
 
-def parse_message(message):
+# Known companies to look for specifically (first match in list order wins)
+KNOWN_COMPANIES = [
+    "Agron Remedies Private Limited",
+    "Sea",
+    "Google",
+    "Goldman Sachs",
+    "SIP Check",
+    "Latracal Solutions Pvt Ltd",
+    "CBIT Open Source Community",
+    "Girl Hackathon",
+    "My Peoples Card"
+]
+
+# Job boards / mail providers that should never be reported as the company
+PLATFORM_DOMAINS = ['linkedin', 'unstop', 'naukri', 'instahyre', 'foundit', 'indeed']
+MAIL_DOMAINS = ['gmail', 'hotmail', 'yahoo', 'outlook', 'mail']
+
+# Company patterns searched in the email body (order matters)
+BODY_COMPANY_PATTERNS = [
+    r'at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
+    r'from\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
+    r'join(?:ing)?\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
+    r'opportunity\s+at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
+    r'career\s+with\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
+    # Add pattern for "internship at [Company]"
+    r'internship\s+at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
+]
+
+# Company patterns searched in the subject (order matters)
+SUBJECT_COMPANY_PATTERNS = [
+    r'from\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)',
+    r'at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)',
+    r'with\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)',
+    r'([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)\s+job',
+    r'([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)\s+application',
+    r'([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)\s+careers'
+]
+
+# List of potential job roles (you can extend this list as needed)
+JOB_ROLES = [
+    "Data Scientist", "Data Analyst", "Full Stack Developer", "Software Engineer", "Website Developer", "Developer", 
+    "Summer Analyst", "Designer", "Manager", "Consultant", "AI Researcher", 
+    "Intern", "Business Analyst", "Frontend Developer", 
+    "Backend Developer", 
+]
+
+# Define status patterns and their priority (order matters)
+STATUS_PATTERNS = [
+    (r'offer\s+letter|job\s+offer|employment\s+offer', 'Offer Received'),
+    (r'congratulations|selected|successful', 'Selected'),
+    (r'interview\s+invite|schedule\s+(?:an|your)\s+interview', 'Interview Invitation'),
+    (r'technical\s+(?:interview|assessment|challenge)', 'Technical Assessment'),
+    (r'phone\s+(?:interview|screen|call)', 'Phone Screening'),
+    (r'reject|regret|not\s+selected|not\s+moving\s+forward|unsuccessful', 'Rejected'),
+    (r'application\s+(?:received|confirmed)', 'Application Received'),
+    (r'on\s+hold|pause', 'On Hold')
+]
+
+DEFAULT_COMPANY = "Unknown Company"
+DEFAULT_ROLE = "Unknown Role"
+DEFAULT_STATUS = "Application Submitted"
+
+def parse_message(message, classifier=None):
     """Extract job application details from an email message."""
+    classifier = classifier or CLASSIFIER
     try:
         subject = message.subject
         sender = message.sender
@@ -15,14 +78,8 @@ def parse_message(message):
         
         print(f"Processing: {subject}")
         
-        # Extract company name
-        company = extract_company(sender, subject, body)
-        
-        # Extract job role
-        role = extract_role(subject, body)
-        
-        # Determine application status
-        status = determine_status(body, subject)
+        # Extract company, role and status in one pass over subject and body
+        company, role, status = classifier.classify(sender, subject, body)
         
         # Create application record
         application = {
@@ -42,50 +99,138 @@ def parse_message(message):
         print(f"Error parsing message: {e}")
         return None
 
+
+class _OrderedPatterns:
+    """
+    An ordered list of regexes where the earliest-listed pattern found anywhere
+    in the text wins, answered with one left-to-right scan.
+
+    A combined alternation finds candidate positions; at each candidate only the
+    patterns ranked above the current best are tried. Once a pattern has been
+    found, the scan continues with an alternation of the better-ranked patterns
+    only. Case-insensitive patterns written in lowercase are run over the
+    lowercased text instead of with re.IGNORECASE, which is much cheaper.
+    """
+
+    def __init__(self, patterns, ignore_case=False):
+        patterns = list(patterns)
+        self.fold = ignore_case and all(pattern == pattern.lower() for pattern in patterns)
+        flags = re.IGNORECASE if ignore_case and not self.fold else 0
+        self.patterns = [re.compile(pattern, flags) for pattern in patterns]
+        # prefixes[k] matches wherever any of the first k patterns does
+        self.prefixes = [None] + [
+            re.compile("|".join(patterns[:k]), flags) for k in range(1, len(patterns) + 1)
+        ]
+
+    def search(self, text):
+        """Return (index, match) for the earliest-listed pattern found in text, or (None, None)."""
+        if self.fold:
+            text = text.lower()
+        best, best_match = len(self.patterns), None
+        pos = 0
+        while best > 0:
+            hit = self.prefixes[best].search(text, pos)
+            if hit is None:
+                break
+            start = hit.start()
+            for index in range(best):
+                match = self.patterns[index].match(text, start)
+                if match:
+                    best, best_match = index, match
+                    break
+            pos = start + 1
+        if best_match is None:
+            return None, None
+        return best, best_match
+
+
+class EmailClassifier:
+    """
+    Precompiled classifier for company, role and status.
+
+    Each ordered pattern list is compiled once into an ``_OrderedPatterns``
+    matcher, so subject and body are scanned once per list instead of once per
+    pattern. Results are the same as ``extract_company``, ``extract_role`` and
+    ``determine_status``, including overlapping matches ("not selected" still
+    loses to "selected").
+    """
+
+    def __init__(self, status_patterns=STATUS_PATTERNS, job_roles=JOB_ROLES,
+                 known_companies=KNOWN_COMPANIES, body_company_patterns=BODY_COMPANY_PATTERNS,
+                 subject_company_patterns=SUBJECT_COMPANY_PATTERNS,
+                 ignored_domains=PLATFORM_DOMAINS + MAIL_DOMAINS):
+        self.statuses = [status for _, status in status_patterns]
+        self.job_roles = list(job_roles)
+        self.known_companies = list(known_companies)
+        self.ignored_domains = set(ignored_domains)
+
+        self._status = _OrderedPatterns([pattern for pattern, _ in status_patterns], ignore_case=True)
+        self._roles = _OrderedPatterns([re.escape(role.lower()) for role in self.job_roles])
+        self._known = _OrderedPatterns([re.escape(company.lower()) for company in self.known_companies])
+        self._body_company = _OrderedPatterns(body_company_patterns, ignore_case=True)
+        self._subject_company = _OrderedPatterns(subject_company_patterns, ignore_case=True)
+        self._sender_re = re.compile(r'@([^>]+)')
+
+    def status(self, body, subject):
+        """Determine application status based on email content."""
+        index, _ = self._status.search(body + " " + subject)
+        return DEFAULT_STATUS if index is None else self.statuses[index]
+
+    def role(self, subject, body):
+        """Extract job role from email subject and body."""
+        # A role counts if it is in either text; the NUL separator keeps a role
+        # from matching across the subject/body boundary.
+        index, _ = self._roles.search(subject.lower() + "\0" + body.lower())
+        return DEFAULT_ROLE if index is None else self.job_roles[index]
+
+    def company(self, sender, subject, body):
+        """Extract company name from email metadata and content."""
+        index, _ = self._known.search(body.lower())
+        if index is not None:
+            return self.known_companies[index]
+
+        sender_domain = self._sender_re.search(sender)
+        if sender_domain:
+            domain = sender_domain.group(1).split('.')[0].lower()
+            if domain not in self.ignored_domains:
+                return domain.title()
+
+        for matcher, text in ((self._body_company, body), (self._subject_company, subject)):
+            _, match = matcher.search(text)
+            if match:
+                return match.group(1).strip()
+
+        return DEFAULT_COMPANY
+
+    def classify(self, sender, subject, body):
+        """Return (company, role, status) for a message."""
+        return (
+            self.company(sender, subject, body),
+            self.role(subject, body),
+            self.status(body, subject),
+        )
+
+
 def extract_company(sender, subject, body):
     """Extract company name from email metadata and content, with platform filtering and debug logs."""
-    # Known companies to look for specifically
-    known_companies = [
-        "Agron Remedies Private Limited",
-        "Sea",
-        "Google",
-        "Goldman Sachs",
-        "SIP Check",
-        "Latracal Solutions Pvt Ltd",
-        "CBIT Open Source Community",
-        "Girl Hackathon",
-        "My Peoples Card"
-    ]
-    
     # First check if any known company is mentioned directly in the body
-    for company in known_companies:
+    for company in KNOWN_COMPANIES:
         if company.lower() in body.lower():
             print(f"🎯 Found exact company match: {company}")
             return company
     
-    platforms = ['linkedin', 'unstop', 'naukri', 'instahyre', 'foundit', 'indeed']
-    
     # Try sender domain first
     sender_domain = re.search(r'@([^>]+)', sender)
     if sender_domain:
         domain = sender_domain.group(1).split('.')[0].lower()
-        if domain not in platforms and domain not in ['gmail', 'hotmail', 'yahoo', 'outlook', 'mail']:
+        if domain not in PLATFORM_DOMAINS and domain not in MAIL_DOMAINS:
             print(f"🟢 Company extracted from sender domain: {domain.title()}")
             return domain.title()
         else:
             print(f"⚠️ Ignored platform domain: {domain}")
     elif "fwd" in subject.lower():
         print("🔄 Fwd detected in subject. Searching body for company name...")
-        body_patterns = [
-            r'at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-            r'from\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-            r'join(?:ing)?\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-            r'opportunity\s+at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-            r'career\s+with\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-            # Add pattern for "internship at [Company]"
-            r'internship\s+at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-        ]
-        for pattern in body_patterns:
+        for pattern in BODY_COMPANY_PATTERNS:
             match = re.search(pattern, body, re.IGNORECASE)
             if match:
                 company = match.group(1).strip()
@@ -93,16 +238,7 @@ def extract_company(sender, subject, body):
                 return company
     
     # Always check body for specific patterns regardless of subject
-    body_patterns = [
-        r'at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-        r'from\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-        r'join(?:ing)?\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-        r'opportunity\s+at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-        r'career\s+with\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-        r'internship\s+at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Pvt\s+Ltd\.|Ltd\.|Inc\.)?)',
-    ]
-    
-    for pattern in body_patterns:
+    for pattern in BODY_COMPANY_PATTERNS:
         match = re.search(pattern, body, re.IGNORECASE)
         if match:
             company = match.group(1).strip()
@@ -110,15 +246,7 @@ def extract_company(sender, subject, body):
             return company
 
     # Common patterns in subject
-    company_patterns = [
-        r'from\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)',
-        r'at\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)',
-        r'with\s+([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)',
-        r'([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)\s+job',
-        r'([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)\s+application',
-        r'([A-Za-z0-9\s&]+(?:Private\s+Limited|Ltd\.|Pvt\s+Ltd\.|Inc\.)?)\s+careers'
-    ]
-    for pattern in company_patterns:
+    for pattern in SUBJECT_COMPANY_PATTERNS:
         match = re.search(pattern, subject, re.IGNORECASE)
         if match:
             company = match.group(1).strip()
@@ -126,25 +254,17 @@ def extract_company(sender, subject, body):
             return company
             
     print("❌ Could not determine company name, defaulting to 'Unknown Company'")
-    return "Unknown Company"
+    return DEFAULT_COMPANY
 
 
 def extract_role(subject, body):
     """Extract job role from email subject and body using keyword search."""
-    # List of potential job roles (you can extend this list as needed)
-    job_roles = [
-        "Data Scientist", "Data Analyst", "Full Stack Developer", "Software Engineer", "Website Developer", "Developer", 
-        "Summer Analyst", "Designer", "Manager", "Consultant", "AI Researcher", 
-        "Intern", "Business Analyst", "Frontend Developer", 
-        "Backend Developer", 
-    ]
-    
     # Convert the subject and body to lowercase to ensure case-insensitive matching
     subject_lower = subject.lower()
     body_lower = body.lower()
 
     # Loop through each job role keyword and search in the subject
-    for role in job_roles:
+    for role in JOB_ROLES:
         # Create a regex pattern for each job role (case-insensitive search)
         pattern = re.escape(role.lower())  # escape special characters in role
         
@@ -159,29 +279,21 @@ def extract_role(subject, body):
             return role  # return role in its original case (as listed in job_roles)
 
     # Default if no match is found
-    return "Unknown Role"
+    return DEFAULT_ROLE
 
 
 def determine_status(body, subject):
     """Determine application status based on email content."""
-    # Define status patterns and their priority (order matters)
-    status_patterns = [
-        (r'offer\s+letter|job\s+offer|employment\s+offer', 'Offer Received'),
-        (r'congratulations|selected|successful', 'Selected'),
-        (r'interview\s+invite|schedule\s+(?:an|your)\s+interview', 'Interview Invitation'),
-        (r'technical\s+(?:interview|assessment|challenge)', 'Technical Assessment'),
-        (r'phone\s+(?:interview|screen|call)', 'Phone Screening'),
-        (r'reject|regret|not\s+selected|not\s+moving\s+forward|unsuccessful', 'Rejected'),
-        (r'application\s+(?:received|confirmed)', 'Application Received'),
-        (r'on\s+hold|pause', 'On Hold')
-    ]
-    
     # Check body and subject for status patterns
     text_to_check = body + " " + subject
     
-    for pattern, status in status_patterns:
+    for pattern, status in STATUS_PATTERNS:
         if re.search(pattern, text_to_check, re.IGNORECASE):
             return status
     
     # Default status
-    return "Application Submitted"
\ No newline at end of file
+    return DEFAULT_STATUS
+
+
+# Shared classifier, compiled once at import
+CLASSIFIER = EmailClassifier()
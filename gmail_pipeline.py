@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import base64
+import html
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+
+import httplib2
+from googleapiclient.discovery import build
+
+from email_parser import parse_message
+
+# Marks the end of a queue for one consumer
+_DONE = object()
+
+
+def gmail_service(creds):
+    """
+    A Gmail API client of its own for one fetch thread (googleapiclient services
+    are not thread-safe). Takes google-auth credentials, or the oauth2client ones
+    older simplegmail releases keep in Gmail.creds.
+    """
+    if hasattr(creds, "authorize"):
+        return build("gmail", "v1", http=creds.authorize(httplib2.Http()), cache_discovery=False)
+    return build("gmail", "v1", credentials=creds, cache_discovery=False)
+
+
+def message_snapshot(resource, fetch_attachment=None):
+    """
+    The fields parse_message needs, as a picklable object, from a Gmail API
+    users.messages.get(format="full") resource.
+    
+    Large text parts are stored behind an attachmentId; fetch_attachment(id) must
+    return their base64url data, otherwise they are left out.
+    """
+    payload = resource.get("payload", {})
+    headers = {header["name"].lower(): header["value"] for header in payload.get("headers", [])}
+    try:
+        date = str(parsedate_to_datetime(headers["date"]).astimezone())
+    except (KeyError, TypeError, ValueError, IndexError):
+        date = headers.get("date", "")
+    plain_parts = list(_plain_parts(payload, fetch_attachment))
+    return SimpleNamespace(
+        id=resource["id"],
+        subject=headers.get("subject", ""),
+        sender=headers.get("from", ""),
+        snippet=html.unescape(resource.get("snippet", "")),
+        plain="\n".join(plain_parts) if plain_parts else None,
+        date=date,
+    )
+
+
+def _plain_parts(part, fetch_attachment):
+    """Yield the decoded text/plain bodies of a MIME payload, skipping attachments."""
+    mime_type = part.get("mimeType", "")
+    if mime_type.startswith("multipart/"):
+        for child in part.get("parts", []):
+            yield from _plain_parts(child, fetch_attachment)
+        return
+    headers = Message()
+    for header in part.get("headers", []):
+        headers[header["name"]] = header["value"]
+    disposition = headers.get("Content-Disposition", "").lower()
+    if mime_type != "text/plain" or part.get("filename") or disposition.startswith("attachment"):
+        return
+    body = part.get("body", {})
+    data = body.get("data")
+    if data is None and body.get("attachmentId") and fetch_attachment is not None:
+        data = fetch_attachment(body["attachmentId"])
+    if data is None:
+        return
+    raw = base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+    try:
+        yield raw.decode(headers.get_content_charset() or "utf-8", errors="replace")
+    except LookupError:  # Unknown charset
+        yield raw.decode("utf-8", errors="replace")
+
+
+class GmailSyncPipeline:
+    """
+    Streaming list -> fetch -> parse pipeline for Gmail ingestion.
+
+    A producer thread walks pages of message refs into a bounded queue, a pool of
+    fetch threads downloads full messages, and a process pool runs parse_message
+    (the regex work is CPU-bound). Parsed applications are yielded as soon as they
+    complete, so the caller can hand them straight to the database writer. The
+    bounded queues keep memory flat and slow the earlier stages down when a later
+    one falls behind.
+    """
+
+    def __init__(self, list_pages, fetch_message, fetch_workers=8, parse_workers=2,
+                 ref_queue_size=500, parse_queue_size=64):
+        """
+        Args:
+            list_pages: Callable returning an iterable of pages (lists) of message refs
+            fetch_message: Callable taking a ref and returning a message (or snapshot)
+            fetch_workers: Number of threads downloading messages
+            parse_workers: Number of parser processes (0 parses in the calling thread)
+            ref_queue_size: Max refs waiting to be fetched
+            parse_queue_size: Max fetched messages waiting for, or in, the parser pool
+        """
+        self.list_pages = list_pages
+        self.fetch_message = fetch_message
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = parse_workers
+        self.ref_queue_size = ref_queue_size
+        self.parse_queue_size = max(1, parse_queue_size)
+        self.stats = {"listed": 0, "fetched": 0, "list_errors": 0, "fetch_errors": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def run(self):
+        """Yield (snapshot, application) pairs as parsing completes; application may be None."""
+        self.stats = {"listed": 0, "fetched": 0, "list_errors": 0, "fetch_errors": 0}
+        stop = threading.Event()
+        refs = queue.Queue(maxsize=self.ref_queue_size)
+        fetched = queue.Queue(maxsize=self.parse_queue_size)
+
+        threads = [threading.Thread(target=self._produce, args=(refs, stop), daemon=True)]
+        threads += [
+            threading.Thread(target=self._fetch, args=(refs, fetched, stop), daemon=True)
+            for _ in range(self.fetch_workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Parser processes are spawned, not forked: the fetch threads are already
+        # running and a fork could copy a lock one of them holds (ssl, httplib2)
+        pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn")
+        ) if self.parse_workers > 0 else None
+        try:
+            yield from self._parse(fetched, pool)
+        finally:
+            stop.set()
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            for thread in threads:
+                thread.join()
+
+    def _put(self, q, item, stop):
+        """Put onto a bounded queue without blocking past a stop request."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q, stop):
+        """Get from a queue, returning _DONE once a stop is requested."""
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _produce(self, refs, stop):
+        try:
+            for page in self.list_pages():
+                for ref in page:
+                    if not self._put(refs, ref, stop):
+                        return
+                    self._count("listed")
+        except Exception as e:
+            self._count("list_errors")
+            print(f"Error listing messages: {e}")
+        finally:
+            for _ in range(self.fetch_workers):
+                self._put(refs, _DONE, stop)
+
+    def _fetch(self, refs, fetched, stop):
+        try:
+            while True:
+                ref = self._get(refs, stop)
+                if ref is _DONE:
+                    break
+                try:
+                    message = self.fetch_message(ref)
+                except Exception as e:
+                    self._count("fetch_errors")
+                    print(f"Error fetching message {ref.get('id')}: {e}")
+                    continue
+                self._count("fetched")
+                if not self._put(fetched, message, stop):
+                    break
+        finally:
+            self._put(fetched, _DONE, stop)
+
+    def _parse(self, fetched, pool):
+        pending = {}
+        fetchers_left = self.fetch_workers
+        while fetchers_left or pending:
+            # Feed the parser pool while there is room
+            while fetchers_left and len(pending) < self.parse_queue_size:
+                try:
+                    message = fetched.get(timeout=0 if pending else 0.1)
+                except queue.Empty:
+                    break
+                if message is _DONE:
+                    fetchers_left -= 1
+                elif pool is None:
+                    yield message, parse_message(message)
+                else:
+                    pending[pool.submit(parse_message, message)] = message
+
+            if pending:
+                done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
@@ -6,24 +6,25 @@ from selenium.webdriver.support.ui import WebDriverWait # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
 from selenium.common.exceptions import TimeoutException, NoSuchElementException # type: ignore
 from webdriver_manager.chrome import ChromeDriverManager # type: ignore
+import requests # type: ignore
+from requests.adapters import HTTPAdapter # type: ignore
+from lxml import etree, html as lxml_html # type: ignore
+from cssselect import GenericTranslator # type: ignore
 import time
 from urllib.parse import urlparse
 import concurrent.futures
-import spacy # type: ignore
 from collections import Counter
-import nltk # type: ignore
-from nltk.corpus import stopwords # type: ignore
 import sqlite3
 import time
 import sys
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+import nlp_resources
 
-# Load spaCy NLP model for keyword extraction
-nlp = spacy.load("en_core_web_sm")
-# Download stopwords once
-nltk.download("stopwords")
-
-# NLTK's predefined stopwords list
-nltk_stopwords = set(stopwords.words("english"))
+# The spaCy model and NLTK stopwords are loaded on first use through nlp_resources;
+# call warm_up() to load them up front.
 
 # Enhanced custom stop words list (job-related terms and common noise)
 custom_stopwords = {
@@ -59,8 +60,15 @@ generic_tech_terms = {
     "area", "areas", "aspect", "aspects", "component", "components"
 }
 
-# Merge all stopword sets
-all_stopwords = nltk_stopwords.union(custom_stopwords).union(generic_tech_terms)
+# Merge all stopword sets (NLTK's predefined list is loaded lazily)
+nlp_resources.register(
+    "job_stopwords",
+    lambda: nlp_resources.get("nltk_stopwords").union(custom_stopwords).union(generic_tech_terms)
+)
+
+def warm_up():
+    """Load the spaCy model and stopwords now instead of on the first extraction."""
+    nlp_resources.warm_up("spacy_en", "sentencizer", "job_stopwords")
 
 # List of valid job-related categories to keep
 JOB_RELATED_CATEGORIES = {
@@ -102,20 +110,73 @@ JOB_RELATED_CATEGORIES = {
 }
 
 
+def _build_category_trie(categories):
+    """
+    Character trie over the lowercased categories. A None key marks the end of
+    a category and holds the categories that must match as written ("UI", "UX");
+    None among them means a lowercase category, which matches in any case.
+    """
+    root = {}
+    for category in categories:
+        folded = category.lower()
+        node = root
+        for char in folded:
+            node = node.setdefault(char, {})
+        node.setdefault(None, set()).add(None if category == folded else category)
+    return root
+
+_category_trie = _build_category_trie(JOB_RELATED_CATEGORIES)
+
+@lru_cache(maxsize=8192)
+def matches_category(term):
+    """
+    True if term contains a JOB_RELATED_CATEGORIES entry: lowercase entries in
+    any case, mixed-case ones like "UI" only as written, so "build" and "guide"
+    don't count as UI.
+    """
+    if None in _category_trie:  # An empty category matches everything
+        return True
+    folded = term.lower()
+    aligned = len(folded) == len(term)
+    for start in range(len(folded)):
+        node = _category_trie
+        for i in range(start, len(folded)):
+            node = node.get(folded[i])
+            if node is None:
+                break
+            ends = node.get(None)
+            if ends is None:
+                continue
+            if None in ends:
+                return True
+            if any((term[start:i + 1] if aligned else term).find(category) >= 0 for category in ends):
+                return True
+    return False
+
 def is_job_related(term):
     """Check if a term is job-related by comparing against known categories"""
-    term = term.lower()
-    return any(category in term for category in JOB_RELATED_CATEGORIES)
+    return matches_category(term.lower())
 
-def extract_section(text, section_keywords=("requirements", "skills", "qualifications", "what we're looking for", "key qualifications", "must-have", "responsibilities", "responsibility")):
-    """
-    Extracts specific sections from a job description based on section keywords.
-    """
-    lines = text.split("\n")
-    extracted_text = []
+SECTION_KEYWORDS = ("requirements", "skills", "qualifications", "what we're looking for", "key qualifications", "must-have", "responsibilities", "responsibility")
+
+# Keyword extraction reads POS tags, lemmas and the dependency tree, never entities
+KEYWORD_DISABLED_PIPES = ("ner",)
+
+def _stripped_span(text, start, end):
+    """(start, end) of text[start:end] without surrounding whitespace."""
+    chunk = text[start:end]
+    lead = len(chunk) - len(chunk.lstrip())
+    return start + lead, start + lead + len(chunk.strip())
+
+def _section_spans(text, section_keywords):
+    """Character spans of the lines following a section heading, up to the next section or blank line."""
+    spans = []
     capture = False
+    offset = 0
 
-    for line in lines:
+    for line in text.split("\n"):
+        start = offset
+        offset += len(line) + 1
         line_lower = line.lower().strip()
 
         # Check if the line contains a section heading
@@ -128,29 +189,37 @@ def extract_section(text, section_keywords=("requirements", "skills", "qualifica
             break
 
         if capture:
-            extracted_text.append(line.strip())
+            spans.append(_stripped_span(text, start, start + len(line)))
 
-    # If no section was found, try to extract relevant sentences
-    if not extracted_text:
-        sentences = [sent.text.strip() for sent in nlp(text).sents]
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in section_keywords):
-                extracted_text.append(sentence)
+    return spans
 
-    return " ".join(extracted_text) if extracted_text else None
+def _keyword_sentence_spans(doc, section_keywords):
+    """Character spans of the sentences in doc that mention a section keyword."""
+    return [
+        _stripped_span(doc.text, sent.start_char, sent.end_char)
+        for sent in doc.sents
+        if any(keyword in sent.text.lower() for keyword in section_keywords)
+    ]
 
-def extract_keywords(text):
+def extract_section(text, section_keywords=SECTION_KEYWORDS):
     """
-    Extracts job-related keywords using NLP with enhanced filtering.
+    Extracts specific sections from a job description based on section keywords.
     """
-    if not text:  # Handle None or empty input
-        return []
-    
-    doc = nlp(text.lower())  # Convert text to lowercase
-    
+    spans = _section_spans(text, section_keywords)
+
+    # If no section was found, try to extract relevant sentences
+    if not spans:
+        spans = _keyword_sentence_spans(nlp_resources.get("sentencizer")(text), section_keywords)
+
+    return " ".join(text[start:end] for start, end in spans) if spans else None
+
+def _keywords_from_tokens(tokens):
+    """Top job-related keywords among already parsed (lowercased) tokens."""
+    all_stopwords = nlp_resources.get("job_stopwords")
+
     # Extract nouns, proper nouns, and adjectives that are likely job-relevant
     keywords = []
-    for token in doc:
+    for token in tokens:
         # Skip stopwords, short words, and non-alphabetic tokens
         if (token.text in all_stopwords or 
             len(token.text) <= 2 or 
@@ -164,7 +233,7 @@ def extract_keywords(text):
             lemma = token.lemma_
             
             # Only keep terms that are job-related
-            if is_job_related(lemma) or any(cat in lemma for cat in JOB_RELATED_CATEGORIES):
+            if matches_category(lemma):
                 keywords.append(lemma)
     
     # Count occurrences and return top keywords
@@ -178,6 +247,73 @@ def extract_keywords(text):
     
     return top_keywords
 
+def extract_keywords(text):
+    """
+    Extracts job-related keywords using NLP with enhanced filtering.
+    """
+    if not text:  # Handle None or empty input
+        return []
+    
+    return _keywords_from_tokens(nlp_resources.get("spacy_en")(text.lower(), disable=KEYWORD_DISABLED_PIPES))
+
+def _analyze_doc(text, doc, section_keywords=SECTION_KEYWORDS):
+    """Description keywords, requirements text and requirements keywords from one parse of text."""
+    if len(doc.text) != len(text):
+        # Lowercasing changed the length (rare Unicode), so offsets don't line up
+        requirements_text = extract_section(text, section_keywords)
+        return {
+            "description_keywords": _keywords_from_tokens(doc),
+            "requirements_text": requirements_text,
+            "requirements_keywords": extract_keywords(requirements_text),
+        }
+
+    spans = _section_spans(text, section_keywords) or _keyword_sentence_spans(doc, section_keywords)
+    requirements_tokens = [token for token in doc if any(start <= token.idx < end for start, end in spans)]
+    return {
+        "description_keywords": _keywords_from_tokens(doc),
+        "requirements_text": " ".join(text[start:end] for start, end in spans) if spans else None,
+        "requirements_keywords": _keywords_from_tokens(requirements_tokens) if spans else [],
+    }
+
+def analyze_descriptions(descriptions, batch_size=64, n_process=1):
+    """
+    Keyword-extract many job descriptions with nlp.pipe.
+    
+    Each description is parsed once; the requirements section is cut out of that
+    same parse instead of being parsed again. Returns one dict per description with
+    description_keywords, requirements_text and requirements_keywords.
+    """
+    analyses = [
+        {"description_keywords": [], "requirements_text": None, "requirements_keywords": []}
+        for _ in descriptions
+    ]
+    indexed = [(i, text) for i, text in enumerate(descriptions) if text]
+    docs = nlp_resources.get("spacy_en").pipe(
+        (text.lower() for _, text in indexed),
+        batch_size=batch_size, n_process=n_process, disable=KEYWORD_DISABLED_PIPES
+    )
+    for (i, text), doc in zip(indexed, docs):
+        analyses[i] = _analyze_doc(text, doc)
+    return analyses
+
+def annotate_results(results, batch_size=64, n_process=1):
+    """Fill in, in place, the keyword fields of scrape results built with analyze=False."""
+    pending = [result for result in results if result["description"]]
+    analyses = analyze_descriptions([result["description"] for result in pending], batch_size, n_process)
+    for result, analysis in zip(pending, analyses):
+        result.update(analysis)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def get_driver_path():
+    """Resolve the chromedriver binary once per process (ChromeDriverManager hits the network)."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
 def setup_driver(headless=True):
     """
     Set up and return a configured Selenium WebDriver instance with optimized settings
@@ -203,166 +339,380 @@ def setup_driver(headless=True):
     chrome_options.set_capability("pageLoadStrategy", "eager")  # Don't wait for all resources
     
     # Initialize WebDriver with a shorter page load timeout
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver = webdriver.Chrome(service=Service(get_driver_path()), options=chrome_options)
     driver.set_page_load_timeout(15)  # Shorter timeout
     
     return driver
 
-# [Previous imports remain the same...]
-
-def get_job_description(job_url):
+class WebDriverPool:
     """
-    Scrapes job descriptions and extracts job titles, descriptions, and job-related keywords.
+    Pool of warm headless Chrome drivers shared by scraping workers.
+    
+    Drivers are started lazily up to `size`, reset between pages (cookies cleared,
+    about:blank loaded) and replaced after `max_pages` pages or when a page raises,
+    which is how a crashed browser shows up.
     """
-    driver = None
-    try:
-        driver = setup_driver(headless=True)
-        driver.get(job_url)
-        time.sleep(1)
-
-        domain = urlparse(job_url).netloc
-        selectors = []
-        title_selectors = []
-
-        # Define selectors for both title and description based on domain
-        if "linkedin.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".show-more-less-html__markup"))
-            title_selectors.append((By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title"))
-        elif "indeed.com" in domain:
-            selectors.append((By.ID, "jobDescriptionText"))
-            title_selectors.append((By.CSS_SELECTOR, ".jobsearch-JobInfoHeader-title"))
-        elif "glassdoor.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".jobDescriptionContent"))
-            title_selectors.append((By.CSS_SELECTOR, "[data-test='job-title']"))
-        elif "monster.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".job-description"))
-            title_selectors.append((By.CSS_SELECTOR, ".job-title h1"))
-        elif "unstop.com" in domain:
-            selectors.append((By.XPATH, '//*[@id="tab-detail"]/div[1]/ul[1]'))
-            title_selectors.append((By.TAG_NAME, "h1"))
-        elif "internshala.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".internship_details"))
-            title_selectors.append((By.CSS_SELECTOR, ".profile_on_detail_page"))
-
-        # Additional fallback selectors for description
-        selectors.extend([
-            (By.CSS_SELECTOR, "div.job-description"),
-            (By.CSS_SELECTOR, ".description-container"),
-            (By.ID, "job-description"),
-            (By.XPATH, "//div[contains(@class, 'description')]"),
-        ])
-
-        # Additional fallback selectors for title
-        title_selectors.extend([
-            (By.CSS_SELECTOR, "h1.job-title"),
-            (By.CSS_SELECTOR, ".job-title"),
-            (By.CSS_SELECTOR, "h1.title"),
-            (By.XPATH, "//h1[contains(@class, 'title')]"),
-            (By.XPATH, "//h1[contains(text(), 'job') or contains(text(), 'position')]"),
-        ])
-
-        wait = WebDriverWait(driver, 3)
-        description = None
-        job_title = None
-
-        # Try to extract job title
-        for selector_type, selector in title_selectors:
+    
+    def __init__(self, size=4, max_pages=25, headless=True):
+        self.size = size
+        self.max_pages = max_pages
+        self.headless = headless
+        self.started = 0
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._pages = {}  # id(driver) -> pages served
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def driver(self):
+        """Check out a driver for one page."""
+        with self._slots:
             try:
-                element = wait.until(EC.presence_of_element_located((selector_type, selector)))
-                text = element.text.strip()
-                if len(text) > 3:  # Minimum length for a title
-                    job_title = text
-                    break
-            except (TimeoutException, NoSuchElementException):
-                continue
-
-        # Try to extract job description
-        for selector_type, selector in selectors:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = setup_driver(headless=self.headless)
+                with self._lock:
+                    self.started += 1
+                    self._pages[id(driver)] = 0
             try:
-                element = wait.until(EC.presence_of_element_located((selector_type, selector)))
-                text = element.text.strip()
-                if len(text) > 50:
-                    description = text
-                    break
-            except (TimeoutException, NoSuchElementException):
-                continue
-
-        # Fallback: Extract main page text for description
-        if not description:
+                yield driver
+            except Exception:
+                self._discard(driver)
+                raise
+            self._release(driver)
+    
+    def _release(self, driver):
+        with self._lock:
+            self._pages[id(driver)] += 1
+            worn_out = self._pages[id(driver)] >= self.max_pages
+        if worn_out:
+            self._discard(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+    
+    def _discard(self, driver):
+        with self._lock:
+            self._pages.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit every idle driver."""
+        while True:
             try:
-                description = driver.execute_script("return document.body.innerText;").strip()
-            except:
-                description = None
-
-        if description:
-            keywords = extract_keywords(description)  # Extract general keywords
-
-            # Extract "requirements/skills" section
-            requirements_text = extract_section(description)
-            requirements_keywords = extract_keywords(requirements_text) if requirements_text else []
-
-            return {
-                "title": job_title,
-                "description": description,
-                "description_keywords": keywords,
-                "requirements_text": requirements_text,
-                "requirements_keywords": requirements_keywords
-            }
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# Descriptions shorter than this are treated as a failed extraction
+MIN_DESCRIPTION_LENGTH = 50
+
+# Per-domain (description selectors, title selectors), shared by the HTTP and browser tiers
+DOMAIN_SELECTORS = [
+    ("linkedin.com", [(By.CSS_SELECTOR, ".show-more-less-html__markup")],
+                     [(By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title")]),
+    ("indeed.com", [(By.ID, "jobDescriptionText")],
+                   [(By.CSS_SELECTOR, ".jobsearch-JobInfoHeader-title")]),
+    ("glassdoor.com", [(By.CSS_SELECTOR, ".jobDescriptionContent")],
+                      [(By.CSS_SELECTOR, "[data-test='job-title']")]),
+    ("monster.com", [(By.CSS_SELECTOR, ".job-description")],
+                    [(By.CSS_SELECTOR, ".job-title h1")]),
+    ("unstop.com", [(By.CSS_SELECTOR, "#tab-detail > div:nth-of-type(1) > ul:nth-of-type(1)")],
+                   [(By.TAG_NAME, "h1")]),
+    ("internshala.com", [(By.CSS_SELECTOR, ".internship_details")],
+                        [(By.CSS_SELECTOR, ".profile_on_detail_page")]),
+]
+
+# Additional fallback selectors for description
+FALLBACK_DESCRIPTION_SELECTORS = [
+    (By.CSS_SELECTOR, "div.job-description"),
+    (By.CSS_SELECTOR, ".description-container"),
+    (By.ID, "job-description"),
+    (By.CSS_SELECTOR, "div[class*='description']"),
+]
+
+# Additional fallback selectors for title
+FALLBACK_TITLE_SELECTORS = [
+    (By.CSS_SELECTOR, "h1.job-title"),
+    (By.CSS_SELECTOR, ".job-title"),
+    (By.CSS_SELECTOR, "h1.title"),
+    (By.CSS_SELECTOR, "h1[class*='title']"),
+    # No CSS equivalent for matching on text; lxml evaluates the XPath directly
+    (By.XPATH, "//h1[contains(text(), 'job') or contains(text(), 'position')]"),
+]
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+}
+HTTP_TIMEOUT = 10
+
+def get_selectors(job_url):
+    """Return (description selectors, title selectors) for a URL, domain-specific ones first."""
+    domain = urlparse(job_url).netloc
+    selectors = []
+    title_selectors = []
+    for site, site_selectors, site_title_selectors in DOMAIN_SELECTORS:
+        if site in domain:
+            selectors.extend(site_selectors)
+            title_selectors.extend(site_title_selectors)
+            break
+    return selectors + FALLBACK_DESCRIPTION_SELECTORS, title_selectors + FALLBACK_TITLE_SELECTORS
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """Shared requests session with a connection pool large enough for the scraping workers."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(HTTP_HEADERS)
+            _http_session = session
+        return _http_session
+
+_xpath_cache = {}
+
+def _compiled_xpath(selector_type, selector):
+    """Translate a Selenium (By, selector) pair into a compiled lxml XPath, once."""
+    key = (selector_type, selector)
+    if key not in _xpath_cache:
+        if selector_type == By.CSS_SELECTOR:
+            expression = GenericTranslator().css_to_xpath(selector)
+        elif selector_type == By.ID:
+            expression = f'//*[@id="{selector}"]'
+        elif selector_type == By.TAG_NAME:
+            expression = f"//{selector}"
         else:
-            return {
-                "title": job_title,
-                "description": None, 
-                "description_keywords": [],
-                "requirements_text": None,
-                "requirements_keywords": []
-            }
+            expression = selector
+        _xpath_cache[key] = etree.XPath(expression)
+    return _xpath_cache[key]
+
+def _element_text(element):
+    """Visible-ish text of an lxml element: scripts dropped, blank lines squeezed."""
+    for junk in element.xpath(".//script | .//style"):
+        junk.drop_tree()
+    lines = (line.strip() for line in element.text_content().splitlines())
+    return "\n".join(line for line in lines if line)
+
+def fetch_job_page_http(job_url, cached=None):
+    """
+    Fetch a job page with a plain HTTP GET and apply the selectors to the raw HTML.
+    
+    If a cached entry with validators is given the request is conditional. Returns a
+    dict with title, description, etag, last_modified and not_modified; title and
+    description may be None, e.g. when the board renders the posting with JavaScript.
+    """
+    page = {"title": None, "description": None, "etag": None, "last_modified": None, "not_modified": False}
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        response = get_http_session().get(job_url, headers=headers, timeout=HTTP_TIMEOUT)
+        if response.status_code == 304:
+            page["not_modified"] = True
+            return page
+        response.raise_for_status()
+        page["etag"] = response.headers.get("ETag")
+        page["last_modified"] = response.headers.get("Last-Modified")
+        tree = lxml_html.fromstring(response.content)
+    except (requests.RequestException, etree.ParserError, ValueError) as e:
+        print(f"HTTP fetch failed for {job_url}: {e}")
+        return page
+
+    selectors, title_selectors = get_selectors(job_url)
+
+    for selector_type, selector in title_selectors:
+        for element in _compiled_xpath(selector_type, selector)(tree):
+            text = _element_text(element)
+            if len(text) > 3:  # Minimum length for a title
+                page["title"] = text
+                break
+        if page["title"]:
+            break
+
+    for selector_type, selector in selectors:
+        for element in _compiled_xpath(selector_type, selector)(tree):
+            text = _element_text(element)
+            if len(text) > MIN_DESCRIPTION_LENGTH:
+                page["description"] = text
+                break
+        if page["description"]:
+            break
+
+    return page
 
+def get_job_description(job_url, pool=None, use_http=True, cache=None, analyze=True):
+    """
+    Scrapes job descriptions and extracts job titles, descriptions, and job-related keywords.
+    
+    A plain HTTP fetch is tried first; the page is only rendered in Chrome when that
+    finds no description of at least MIN_DESCRIPTION_LENGTH characters. With a
+    WebDriverPool the page is loaded in a pooled, warm browser; otherwise a browser
+    is started for this URL and quit afterwards. With a ScrapeCache, fresh entries
+    are served without any request and stale ones are revalidated conditionally.
+    The result's "tier" records which path served it ("cache", "http" or "browser").
+    With analyze=False keyword extraction is left to a later annotate_results batch.
+    """
+    try:
+        cached = cache.get(job_url) if cache is not None else None
+        if cached and cache.is_fresh(cached):
+            return _build_result(cached["title"], cached["description"], "cache", analyze)
+
+        page = {"title": None, "description": None, "etag": None, "last_modified": None, "not_modified": False}
+        if use_http:
+            page = fetch_job_page_http(job_url, cached)
+            if page["not_modified"] and cached:
+                cache.touch(job_url)
+                return _build_result(cached["title"], cached["description"], "cache", analyze)
+            if page["description"]:
+                if cache is not None:
+                    cache.put(job_url, page["title"], page["description"], "http",
+                              page["etag"], page["last_modified"])
+                return _build_result(page["title"], page["description"], "http", analyze)
+
+        if pool is not None:
+            with pool.driver() as driver:
+                browser_title, description = _scrape_job_page(driver, job_url)
+        else:
+            driver = setup_driver(headless=True)
+            try:
+                browser_title, description = _scrape_job_page(driver, job_url)
+            finally:
+                driver.quit()
+        job_title = browser_title or page["title"]
+        if cache is not None and description:
+            # The HTTP validators still tell us when this page changes
+            cache.put(job_url, job_title, description, "browser", page["etag"], page["last_modified"])
+        return _build_result(job_title, description, "browser", analyze)
     except Exception as e:
         print(f"⚠️ Error scraping {job_url}: {e}")
-        return {
-            "title": None,
-            "description": None, 
-            "description_keywords": [],
-            "requirements_text": None,
-            "requirements_keywords": []
-        }
-    finally:
-        if driver:
-            driver.quit()
+        return _build_result(None, None, None, analyze)
 
-def process_url(url):
+def _build_result(job_title, description, tier, analyze=True):
+    """
+    Assemble the result dict for a scraped description.
+    
+    With analyze=False the keyword fields are left empty so a batch of results can
+    be filled in later by annotate_results.
+    """
+    result = {
+        "title": job_title,
+        "description": description or None,
+        "description_keywords": [],
+        "requirements_text": None,
+        "requirements_keywords": [],
+        "tier": tier
+    }
+    if description and analyze:
+        result.update(analyze_descriptions([description])[0])
+    return result
+
+def _scrape_job_page(driver, job_url):
+    """Load job_url in driver and return (title, description)."""
+    driver.get(job_url)
+    time.sleep(1)
+
+    selectors, title_selectors = get_selectors(job_url)
+
+    wait = WebDriverWait(driver, 3)
+    description = None
+    job_title = None
+
+    # Try to extract job title
+    for selector_type, selector in title_selectors:
+        try:
+            element = wait.until(EC.presence_of_element_located((selector_type, selector)))
+            text = element.text.strip()
+            if len(text) > 3:  # Minimum length for a title
+                job_title = text
+                break
+        except (TimeoutException, NoSuchElementException):
+            continue
+
+    # Try to extract job description
+    for selector_type, selector in selectors:
+        try:
+            element = wait.until(EC.presence_of_element_located((selector_type, selector)))
+            text = element.text.strip()
+            if len(text) > MIN_DESCRIPTION_LENGTH:
+                description = text
+                break
+        except (TimeoutException, NoSuchElementException):
+            continue
+
+    # Fallback: Extract main page text for description
+    if not description:
+        try:
+            description = driver.execute_script("return document.body.innerText;").strip()
+        except:
+            description = None
+
+    return job_title, description
+
+def process_url(url, pool=None):
     """Helper function for parallel processing"""
-    result = get_job_description(url)
+    result = get_job_description(url, pool=pool)
     return url, result  # Return the URL and the full result (description and keywords)
 
-def extract_job_descriptions_parallel(job_urls, max_workers=4):
+def extract_job_descriptions_parallel(job_urls, max_workers=4, pool=None):
     """
     Extract job descriptions in parallel for much faster execution
     
     Args:
         job_urls: List of job posting URLs
         max_workers: Maximum number of parallel browser instances
+        pool: Optional WebDriverPool to reuse; one sized to max_workers is used otherwise
         
     Returns:
         dict: Dictionary mapping URLs to their results (description and keywords)
     """
     results = {}
+    owns_pool = pool is None
+    if owns_pool:
+        pool = WebDriverPool(size=max_workers)
     
-    # Use ThreadPoolExecutor for parallel processing
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all scraping tasks
-        future_to_url = {executor.submit(process_url, url): url for url in job_urls}
-        
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_url):
-            url, result = future.result()
-            results[url] = result
-            if result["description"]:
-                print(f"Scraped: {url}")
-                print(f"Description Keywords: {result['description_keywords']}")
-                print(f"Requirements Keywords: {result['requirements_keywords']}")
-            else:
-                print(f"Failed: {url}")
+    try:
+        # Use ThreadPoolExecutor for parallel processing
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit all scraping tasks
+            future_to_url = {executor.submit(process_url, url, pool): url for url in job_urls}
+            
+            # Process results as they complete
+            for future in concurrent.futures.as_completed(future_to_url):
+                url, result = future.result()
+                results[url] = result
+                if result["description"]:
+                    print(f"Scraped ({result['tier']}): {url}")
+                    print(f"Description Keywords: {result['description_keywords']}")
+                    print(f"Requirements Keywords: {result['requirements_keywords']}")
+                else:
+                    print(f"Failed: {url}")
+    finally:
+        if owns_pool:
+            pool.close()
     
     return results
 
@@ -0,0 +1,267 @@
+import json
+import sqlite3
+import threading
+import time
+import uuid
+
+FINISHED_STATUSES = ("done", "failed")
+
+
+def _sse(data, event=None, event_id=None):
+    """One Server-Sent Events message."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Job:
+    """
+    What a job handler gets: the job's params, the results stored by earlier
+    (interrupted) runs in `done`, and methods to report progress.
+    """
+
+    def __init__(self, queue, job_id, kind, params, done):
+        self.id = job_id
+        self.kind = kind
+        self.params = params
+        self.done = done
+        self._queue = queue
+
+    @property
+    def stopping(self):
+        """True once the queue is shutting down; handlers should return soon, the job resumes on restart."""
+        return self._queue._stopping.is_set()
+
+    def set_total(self, total):
+        self._queue._set_total(self.id, total)
+
+    def add_result(self, key, result):
+        """Store the result for one item of work. Items already in `done` are ignored."""
+        if key not in self.done:
+            self._queue._add_result(self.id, key, result)
+            self.done[key] = result
+
+
+class JobQueue:
+    """
+    SQLite-backed queue of long-running jobs, run by a few worker threads.
+
+    Handlers are registered per job kind and called with a Job. They report each
+    finished item with job.add_result(), which is stored immediately, so callers
+    can poll or stream partial results. Jobs still marked running when the queue
+    starts were interrupted by a restart; they are queued again and their
+    handlers see the already finished items in job.done.
+    """
+
+    def __init__(self, db_path="job_queue.db", workers=2):
+        self.workers = workers
+        self._handlers = {}
+        self._threads = []
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                params TEXT,
+                status TEXT NOT NULL,
+                total INTEGER,
+                completed INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                created_at REAL,
+                started_at REAL,
+                finished_at REAL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS job_results (
+                job_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                key TEXT NOT NULL,
+                result TEXT,
+                PRIMARY KEY (job_id, seq),
+                UNIQUE (job_id, key)
+            )
+        ''')
+        self._conn.commit()
+
+    def register(self, kind, handler):
+        """Run handler(job) for jobs of this kind."""
+        self._handlers[kind] = handler
+
+    def start(self):
+        """Requeue interrupted jobs and start the workers. Safe to call more than once."""
+        if self._threads:
+            return
+        with self._changed:
+            if self._threads:
+                return
+            resumed = self._conn.execute("UPDATE jobs SET status = 'queued' WHERE status = 'running'").rowcount
+            self._conn.commit()
+            if resumed:
+                print(f"[INFO] Resuming {resumed} interrupted jobs")
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, kind, params=None):
+        """Queue a job and return its id."""
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = uuid.uuid4().hex
+        with self._changed:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, kind, json.dumps(params or {}), time.time())
+            )
+            self._conn.commit()
+            self._changed.notify_all()
+        return job_id
+
+    def get(self, job_id):
+        """The job's status as a dict, or None if there is no such job."""
+        with self._lock:
+            return self._get(job_id)
+
+    def list_jobs(self, limit=50):
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+            return [self._job_dict(row) for row in rows]
+
+    def results(self, job_id, after=0):
+        """The job's stored results with seq > after, in the order they finished."""
+        with self._lock:
+            return self._results(job_id, after)
+
+    def events(self, job_id, after=0, keepalive=15):
+        """
+        Generator of Server-Sent Events for a job: a "result" event (with the
+        result's seq as its id) for every stored result after `after`, a "status"
+        event whenever the status or progress changes, and a comment every
+        `keepalive` seconds while nothing happens. Ends once the job is finished.
+        """
+        last_status = None
+        while True:
+            with self._changed:
+                status, items = self._get(job_id), self._results(job_id, after)
+                if status is not None and status == last_status and not items:
+                    self._changed.wait(keepalive)
+                    status, items = self._get(job_id), self._results(job_id, after)
+            if status is None:
+                yield _sse({"error": "Job not found"}, event="error")
+                return
+            for item in items:
+                after = item["seq"]
+                yield _sse(item, event="result", event_id=after)
+            if status != last_status:
+                last_status = status
+                yield _sse(status, event="status")
+                if status["status"] in FINISHED_STATUSES:
+                    return
+            elif not items:
+                yield ": keepalive\n\n"
+
+    def close(self, timeout=5):
+        """Stop the workers. Jobs they were running stay marked running and resume on the next start()."""
+        self._stopping.set()
+        with self._changed:
+            self._changed.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        with self._lock:
+            self._conn.close()
+
+    def _work(self):
+        while True:
+            job = self._claim()
+            if job is None:
+                return
+            print(f"[INFO] Running {job.kind} job {job.id} ({len(job.done)} items already done)")
+            try:
+                self._handlers[job.kind](job)
+            except (Exception, SystemExit) as e:
+                if self._stopping.is_set():
+                    return
+                print(f"[ERROR] {job.kind} job {job.id} failed: {e}")
+                self._finish(job.id, "failed", str(e))
+                continue
+            if self._stopping.is_set():
+                return  # Left running so the next start() picks it up again
+            self._finish(job.id, "done")
+            print(f"[INFO] Finished {job.kind} job {job.id}")
+
+    def _claim(self):
+        """Wait for the oldest queued job, mark it running and return it as a Job (None when stopping)."""
+        with self._changed:
+            while not self._stopping.is_set():
+                row = self._conn.execute(
+                    "SELECT id, kind, params FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', started_at = COALESCE(started_at, ?) WHERE id = ?",
+                        (time.time(), row["id"])
+                    )
+                    self._conn.commit()
+                    self._changed.notify_all()
+                    done = {
+                        result["key"]: json.loads(result["result"])
+                        for result in self._conn.execute(
+                            "SELECT key, result FROM job_results WHERE job_id = ?", (row["id"],)
+                        )
+                    }
+                    return Job(self, row["id"], row["kind"], json.loads(row["params"]), done)
+                self._changed.wait()
+            return None
+
+    def _set_total(self, job_id, total):
+        with self._changed:
+            self._conn.execute("UPDATE jobs SET total = ? WHERE id = ?", (total, job_id))
+            self._conn.commit()
+            self._changed.notify_all()
+
+    def _add_result(self, job_id, key, result):
+        with self._changed:
+            self._conn.execute('''
+                INSERT OR IGNORE INTO job_results (job_id, seq, key, result)
+                SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ? FROM job_results WHERE job_id = ?
+            ''', (job_id, key, json.dumps(result), job_id))
+            self._conn.execute(
+                "UPDATE jobs SET completed = (SELECT COUNT(*) FROM job_results WHERE job_id = ?) WHERE id = ?",
+                (job_id, job_id)
+            )
+            self._conn.commit()
+            self._changed.notify_all()
+
+    def _finish(self, job_id, status, error=None):
+        with self._changed:
+            self._conn.execute("UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                               (status, error, time.time(), job_id))
+            self._conn.commit()
+            self._changed.notify_all()
+
+    def _get(self, job_id):
+        row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job_dict(row) if row is not None else None
+
+    def _results(self, job_id, after):
+        rows = self._conn.execute(
+            "SELECT seq, key, result FROM job_results WHERE job_id = ? AND seq > ? ORDER BY seq", (job_id, after)
+        ).fetchall()
+        return [{"seq": row["seq"], "key": row["key"], "result": json.loads(row["result"])} for row in rows]
+
+    @staticmethod
+    def _job_dict(row):
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        return job
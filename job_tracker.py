@@ -4,16 +4,172 @@
 from simplegmail import Gmail
 import re
 import csv
+import gzip
 import os
 import json
 from datetime import datetime
 import sqlite3
-from email_parser import parse_message, extract_company, extract_role, determine_status
+import threading
+import time
+import application_stats
+from email_parser import extract_company, extract_role, determine_status
+from gmail_pipeline import GmailSyncPipeline, gmail_service, message_snapshot
+
+# How far before the checkpoint an incremental sync looks again (Gmail's
+# after: filter uses the received time, the checkpoint uses the Date header)
+CHECKPOINT_OVERLAP_SECONDS = 24 * 60 * 60
+
+
+def _message_timestamp(date):
+    """Return a message date as epoch seconds, or None if it can't be parsed."""
+    try:
+        return int(datetime.fromisoformat(str(date)).timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+class SyncFailed(RuntimeError):
+    """The sync could not download or store its messages; the checkpoint was not moved."""
+
+
+# Columns written by save_to_csv, in order
+CSV_FIELDNAMES = ['role', 'company', 'status', 'date_received', 'subject', 'sender', 'last_updated', 'message_link', 'message_id']
+
+INSERT_APPLICATION_SQL = '''
+INSERT OR REPLACE INTO job_applications 
+(email_id, role, company, status, date_received, subject, sender, last_updated, message_id)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+class ApplicationWriter:
+    """
+    Write-behind buffer for job_applications rows.
+    
+    Keeps one connection open in WAL mode and writes buffered rows with a single
+    executemany per transaction, either when batch_size rows are pending or
+    every flush_interval seconds. A batch is committed or rolled back as a whole.
+    
+    A failed write (e.g. "database is locked") is logged and its rows stay
+    buffered; they are retried with a later batch or interval, backing off
+    exponentially from flush_interval. Only after max_failures failed flushes
+    in a row, or with more than max_pending rows buffered, does add() give up
+    with SyncFailed.
+    """
+
+    def __init__(self, db_path, batch_size=500, flush_interval=2.0, max_failures=5, max_pending=20000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_failures = max_failures
+        self.max_pending = max_pending
+        self.rows_written = 0
+        self.failures = 0  # Failed flushes since the last successful one
+        self.last_error = None
+        self._pending = []
+        self._retry_at = 0.0  # No flush before this time.monotonic() after a failure
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only syncs at checkpoints and stays crash-consistent
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def add(self, application, message_id):
+        """Queue one application row, flushing if the batch is full."""
+        row = (
+            application['email_id'],
+            application['role'],
+            application['company'],
+            application['status'],
+            application['date_received'],
+            application['subject'],
+            application['sender'],
+            application['last_updated'],
+            message_id
+        )
+        with self._lock:
+            self._pending.append(row)
+            batch_full = len(self._pending) >= self.batch_size and time.monotonic() >= self._retry_at
+        if batch_full:
+            self._try_flush()
+        if self.failures >= self.max_failures or len(self._pending) > self.max_pending:
+            raise SyncFailed(f"Could not store applications ({self.failures} failed writes, "
+                             f"{len(self._pending)} rows buffered): {self.last_error}")
+
+    def flush(self):
+        """Write all pending rows in one transaction and return how many were written."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+            try:
+                # The connection context manager commits, or rolls back the whole batch
+                with self._conn:
+                    self._conn.executemany(INSERT_APPLICATION_SQL, rows)
+            except Exception as e:
+                self._pending = rows + self._pending
+                self.failures += 1
+                self.last_error = e
+                self._retry_at = time.monotonic() + self.flush_interval * 2 ** (self.failures - 1)
+                raise
+            self.rows_written += len(rows)
+            self.failures = 0
+            self._retry_at = 0.0
+            return len(rows)
+
+    def _try_flush(self):
+        """flush(), logging a failure instead of raising it; the rows stay buffered."""
+        try:
+            return self.flush()
+        except sqlite3.Error as e:
+            print(f"Error flushing applications (attempt {self.failures}, "
+                  f"{len(self._pending)} rows kept for retry): {e}")
+            return 0
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            if time.monotonic() >= self._retry_at:
+                self._try_flush()
+
+    def close(self):
+        """Flush remaining rows, retrying with the same backoff, and close the connection."""
+        self._closed.set()
+        self._flusher.join()
+        try:
+            # Once add() has given up, one last try is enough
+            for _ in range(max(1, self.max_failures - self.failures)):
+                time.sleep(max(0.0, self._retry_at - time.monotonic()))
+                self._try_flush()
+                if not self._pending:
+                    return
+            raise SyncFailed(f"Could not store {len(self._pending)} applications: {self.last_error}")
+        finally:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 class JobApplicationTracker:
-    def __init__(self, db_path="./data/job_applications.db", csv_path="./data/job_applications.csv"):
+    def __init__(self, db_path="./data/job_applications.db", csv_path="./data/job_applications.csv",
+                 batch_size=500, flush_interval=2.0, fetch_workers=8, parse_workers=2,
+                 ref_queue_size=500, parse_queue_size=64):
         self.db_path = db_path
         self.applications = []
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pipeline_options = {
+            "fetch_workers": fetch_workers,
+            "parse_workers": parse_workers,
+            "ref_queue_size": ref_queue_size,
+            "parse_queue_size": parse_queue_size,
+        }
+        self._local = threading.local()
         """Initialize the job tracker with paths for database and CSV storage."""
         try:
             # Make sure data directory exists
@@ -53,42 +209,176 @@ class JobApplicationTracker:
         )
         ''')
         
+        # Incremental CSV exports read rows in last_updated order
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_applications_last_updated ON job_applications (last_updated)")
+        application_stats.ensure_indexes(conn)
+        
+        # Incremental sync checkpoints, one row per Gmail query
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS sync_checkpoints (
+            query TEXT PRIMARY KEY,
+            last_message_ts INTEGER,
+            last_synced TIMESTAMP
+        )
+        ''')
+        
+        # Newest last_updated written to each CSV export path
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS export_checkpoints (
+            path TEXT PRIMARY KEY,
+            last_updated TIMESTAMP
+        )
+        ''')
+        
         conn.commit()
         conn.close()
     
-    def extract_applications(self, query="subject:(application OR job OR interview OR opportunity)"):
-        """Fetch and extract job applications from emails matching the query."""
-        print(f"Fetching messages matching query: {query}")
+    def extract_applications(self, query="subject:(application OR job OR interview OR opportunity)", incremental=True):
+        """
+        Fetch and extract job applications from emails matching the query.
+        
+        In incremental mode only mail newer than the stored checkpoint for this
+        query is listed, and messages already in the database are skipped before
+        their full bodies are downloaded. Pass incremental=False for a full resync.
+        
+        The checkpoint comes from the Date header, which the sender controls, so it
+        is never moved past the time this sync started: one future-dated email
+        would otherwise push the after: window beyond all real mail.
+        """
+        self.sync_stats = {"scanned": 0, "skipped": 0, "parsed": 0}
+        self.applications = []
         try:
-            messages = self.gmail.get_messages(query=query)
-            print(f"Found {len(messages)} matching messages.\n")
-            self.applications = []
-            for message in messages:
-                # Log the message_id for each email
-                print(f"Processing message with ID: {message.id}")
-                # Skip if we've already processed this email
-                #if self._is_email_processed(message.id):
-                    #print(f"Skipping already processed message: {message.subject}")
-                    #continue
-            
-            # Parse the message
-                application = parse_message(message)
+            sync_started = int(datetime.now().timestamp())
+            checkpoint = self._get_checkpoint(query) if incremental else None
+            if checkpoint is not None and checkpoint > sync_started:
+                # Saved from a future-dated message before checkpoints were clamped
+                print("Checkpoint is in the future; clamping it to now")
+                checkpoint = sync_started
+            search_query = query
+            if checkpoint is not None:
+                # Overlap the window so late-arriving or misdated mail is not missed;
+                # anything already stored is skipped below without being downloaded.
+                search_query = f"{query} after:{max(checkpoint - CHECKPOINT_OVERLAP_SECONDS, 0)}"
+                print(f"Incremental sync from checkpoint {datetime.fromtimestamp(checkpoint).isoformat()}")
+            print(f"Fetching messages matching query: {search_query}")
             
-                if application:
-                    application['message_id'] = message.id  # Add message_id to the application dictionary
-                    application['message_link'] = f"https://mail.google.com/mail/u/0/#inbox/{message.id}"  # Add Gmail link
+            pipeline = GmailSyncPipeline(
+                list_pages=lambda: self._iter_new_ref_pages(search_query, incremental),
+                fetch_message=self._fetch_message,
+                **self.pipeline_options
+            )
+            latest_ts = checkpoint
+            writer = ApplicationWriter(self.db_path, self.batch_size, self.flush_interval)
+            try:
+                # Applications arrive as soon as each message is fetched and parsed
+                for message, application in pipeline.run():
+                    message_ts = _message_timestamp(message.date)
+                    if message_ts is not None:
+                        message_ts = min(message_ts, sync_started)
+                    if message_ts is not None and (latest_ts is None or message_ts > latest_ts):
+                        latest_ts = message_ts
                 
-                    self.applications.append(application)
-                
-                # Save to database
-                    self._save_to_database(application, message.id)
-                    print(f"✅ Saved application from {application['company']} for {application['role']}")
+                    if application:
+                        self.sync_stats["parsed"] += 1
+                        application['message_id'] = message.id  # Add message_id to the application dictionary
+                        application['message_link'] = f"https://mail.google.com/mail/u/0/#inbox/{message.id}"  # Add Gmail link
+                    
+                        self.applications.append(application)
+                    
+                        # Buffer for the batched database write
+                        writer.add(application, message.id)
+                        print(f"✅ Parsed application from {application['company']} for {application['role']}")
+            finally:
+                # Flush before the checkpoint moves so it never runs ahead of stored rows
+                writer.close()
+            
+            failed = pipeline.stats["list_errors"] + pipeline.stats["fetch_errors"]
+            if failed and not pipeline.stats["fetched"]:
+                raise SyncFailed(f"Gmail sync failed: {pipeline.stats['fetch_errors']} fetch errors, "
+                                 f"{pipeline.stats['list_errors']} list errors and no message downloaded")
+            if failed:
+                print(f"⚠️ {pipeline.stats['fetch_errors']} messages could not be downloaded; "
+                      f"they are retried on the next sync")
+                # Retry the missed messages next run instead of skipping past them
+                latest_ts = checkpoint
+            if latest_ts is not None:
+                self._save_checkpoint(query, latest_ts)
+            print(f"Sync summary: scanned {self.sync_stats['scanned']}, "
+                  f"skipped {self.sync_stats['skipped']}, parsed {self.sync_stats['parsed']}")
         
             return self.applications
+        except SyncFailed:
+            raise
         except Exception as e:
             print(f"Error fetching messages: {e}")
             return []
 
+    def _iter_new_ref_pages(self, query, incremental):
+        """Yield pages of {'id', 'threadId'} refs matching the query, minus stored ones when incremental."""
+        request_kwargs = {"userId": "me", "q": query}
+        while True:
+            response = self.gmail.service.users().messages().list(**request_kwargs).execute()
+            refs = response.get('messages', [])
+            self.sync_stats["scanned"] += len(refs)
+            if incremental and refs:
+                processed = self._processed_email_ids([ref['id'] for ref in refs])
+                new_refs = [ref for ref in refs if ref['id'] not in processed]
+                self.sync_stats["skipped"] += len(refs) - len(new_refs)
+                refs = new_refs
+            print(f"Listed {len(refs)} new messages")
+            yield refs
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+            request_kwargs["pageToken"] = page_token
+
+    def _fetch_message(self, message_ref):
+        """Download one full message and return a picklable snapshot of it (runs on fetch threads)."""
+        service = getattr(self._local, "service", None)
+        if service is None:
+            # Google API clients are not thread-safe, so each fetch thread builds its
+            # own from the credentials simplegmail loaded
+            service = self._local.service = gmail_service(self.gmail.creds)
+        messages = service.users().messages()
+        resource = messages.get(userId="me", id=message_ref["id"], format="full").execute()
+        return message_snapshot(resource, lambda attachment_id: messages.attachments().get(
+            userId="me", messageId=message_ref["id"], id=attachment_id
+        ).execute()["data"])
+
+    def _processed_email_ids(self, email_ids):
+        """Return the subset of email_ids that are already stored."""
+        processed = set()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(email_ids), 500):
+            chunk = email_ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT email_id FROM job_applications WHERE email_id IN ({placeholders})", chunk)
+            processed.update(row[0] for row in cursor.fetchall())
+        conn.close()
+        return processed
+
+    def _get_checkpoint(self, query):
+        """Return the newest message timestamp (epoch seconds) synced for this query, or None."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute("SELECT last_message_ts FROM sync_checkpoints WHERE query = ?", (query,))
+        row = cursor.fetchone()
+        conn.close()
+        return row[0] if row else None
+
+    def _save_checkpoint(self, query, last_message_ts):
+        """Persist the sync checkpoint for this query."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+        INSERT OR REPLACE INTO sync_checkpoints (query, last_message_ts, last_synced)
+        VALUES (?, ?, ?)
+        ''', (query, int(last_message_ts), datetime.now().isoformat()))
+        conn.commit()
+        conn.close()
+
     
     def _is_email_processed(self, email_id):
         """Check if email has already been processed."""
@@ -99,90 +389,82 @@ class JobApplicationTracker:
         conn.close()
         return result is not None
     
-    def _save_to_database(self, application, message_id):
-        """Save application data to SQLite database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-        INSERT OR REPLACE INTO job_applications 
-        (email_id, role, company, status, date_received, subject, sender, last_updated, message_id)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            application['email_id'],
-            application['role'],
-            application['company'],
-            application['status'],
-            application['date_received'],
-            application['subject'],
-            application['sender'],
-            application['last_updated'],
-            message_id
-        ))
+    def save_to_csv(self, incremental=False, compress=False, chunk_size=5000):
+        """
+        Stream applications from the database to the CSV file.
         
-        conn.commit()
-        conn.close()
-    
-    def save_to_csv(self):
-        """Export applications to CSV file."""
-        if not self.applications and os.path.exists(self.db_path):
-            # Load from database if applications list is empty
-            print("Loading applications from database for CSV export...")
-            self._load_from_database()
-        if not self.applications:
+        Rows are read in chunks and written straight to csv.writer, so memory stays
+        flat however large the table is. With incremental=True only rows updated
+        since the previous export to this path are appended (a file with no
+        checkpoint yet is rewritten in full). With compress=True the output is
+        gzipped (appends add a new gzip member, which readers handle).
+        """
+        if not os.path.exists(self.db_path):
             print("No applications to save.")
             return
-    
-        # Include 'message_link' in the fieldnames
-        fieldnames = ['role', 'company', 'status', 'date_received', 'subject', 'sender', 'last_updated', 'message_link','message_id']
+        
+        csv_path = self.csv_path
+        if compress and not csv_path.endswith('.gz'):
+            csv_path += '.gz'
         
         try:
             # Make sure directory exists
-            os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
+            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
             
-            with open(self.csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for app in self.applications:
-                    app['message_id'] = app.get('message_id', 'N/A') 
-                    # Only include the fields we want, including 'message_link'
-                    filtered_app = {k: v for k, v in app.items() if k in fieldnames}
-                    writer.writerow(filtered_app)
-                    
-            print(f"Saved {len(self.applications)} applications to {self.csv_path}")
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            since = None
+            if incremental and os.path.exists(csv_path):
+                cursor.execute("SELECT last_updated FROM export_checkpoints WHERE path = ?", (csv_path,))
+                row = cursor.fetchone()
+                since = row[0] if row else None
+            
+            # An incremental export appends to a file this tracker exported before. A
+            # file with no checkpoint (e.g. one written before checkpoints existed) is
+            # rewritten in full, since appending every row to it would duplicate them.
+            append = since is not None
+            mode = 'at' if append else 'wt'
+            opener = gzip.open if compress else open
+            
+            cursor.execute('''
+            SELECT role, company, status, date_received, subject, sender, last_updated,
+                   'https://mail.google.com/mail/u/0/#inbox/' || message_id, message_id
+            FROM job_applications
+            WHERE ? IS NULL OR last_updated > ?
+            ORDER BY last_updated
+            ''', (since, since))
+            
+            count = 0
+            last_updated = since
+            with opener(csv_path, mode, newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                if not append:
+                    writer.writerow(CSV_FIELDNAMES)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    writer.writerows(rows)
+                    count += len(rows)
+                    last_updated = rows[-1][6]
+            
+            if last_updated is not None:
+                cursor.execute("INSERT OR REPLACE INTO export_checkpoints (path, last_updated) VALUES (?, ?)",
+                               (csv_path, last_updated))
+                conn.commit()
+            conn.close()
+            
+            if append:
+                print(f"Appended {count} updated applications to {csv_path}")
+            else:
+                print(f"Saved {count} applications to {csv_path}")
         except Exception as e:
             print(f"Error saving to CSV: {e}")
 
     
-    def _load_from_database(self):
-        """Load applications from the database."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # This enables column access by name
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-        SELECT email_id, role, company, status, date_received, subject, sender, last_updated, message_id
-        FROM job_applications
-        ''')
-        
-        rows = cursor.fetchall()
-        self.applications = []
-        
-        for row in rows:
-            app = dict(row)
-            app['message_link'] = f"https://mail.google.com/mail/u/0/#inbox/{row['message_id']}"  # Add Gmail link
-            self.applications.append(app)
-            
-        conn.close()
-        print(f"Loaded {len(self.applications)} applications from database.")
-    
     def get_application_stats(self):
         """Get statistics about job applications."""
-        if not self.applications and os.path.exists(self.db_path):
-            self._load_from_database()
-            
-        if not self.applications:
+        if not os.path.exists(self.db_path):
             return {
                 "status_counts": {},
                 "top_companies": {},
@@ -190,32 +472,8 @@ class JobApplicationTracker:
                 "total_applications": 0
             }
         
-        # Count statuses
-        status_counts = {}
-        for app in self.applications:
-            status = app.get('status', 'Unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Count companies
-        company_counts = {}
-        for app in self.applications:
-            company = app.get('company', 'Unknown')
-            company_counts[company] = company_counts.get(company, 0) + 1
-        
-        # Sort by count and get top 5
-        sorted_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)
-        top_companies = dict(sorted_companies[:5])
-        
-        # Get latest applications (by date)
-        sorted_apps = sorted(self.applications, key=lambda x: x.get('date_received', ''), reverse=True)
-        latest_apps = sorted_apps[:10]
-        
-        return {
-            "status_counts": status_counts,
-            "top_companies": top_companies,
-            "latest_applications": latest_apps,
-            "total_applications": len(self.applications)
-        }
+        # Counting, grouping and the latest-10 sort all run in SQLite
+        return application_stats.get_application_stats(self.db_path, top_companies=5, latest=10)
 
     def print_stats(self):
         """Print application statistics in a readable format."""
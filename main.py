@@ -2,8 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import argparse
-from job_tracker import JobApplicationTracker
+from job_tracker import JobApplicationTracker, SyncFailed
 from check_credentials import setup_credentials
 
 def main():
@@ -12,6 +13,16 @@ def main():
     parser.add_argument('--query', type=str, default="subject:(application OR job OR interview OR opportunity)",
                       help='Gmail search query to find job application emails')
     parser.add_argument('--dashboard', action='store_true', help='Run the dashboard after processing')
+    parser.add_argument('--full-resync', action='store_true',
+                      help='Ignore the sync checkpoint and reparse every matching email')
+    parser.add_argument('--append-csv', action='store_true',
+                      help='Only append applications updated since the last CSV export')
+    parser.add_argument('--gzip-csv', action='store_true', help='Write the CSV export gzip-compressed')
+    parser.add_argument('--fetch-workers', type=int, default=8, help='Threads downloading messages from Gmail')
+    parser.add_argument('--parse-workers', type=int, default=2,
+                      help='Processes parsing messages (0 parses in the main process)')
+    parser.add_argument('--fetch-queue-size', type=int, default=500, help='Max message IDs waiting to be downloaded')
+    parser.add_argument('--parse-queue-size', type=int, default=64, help='Max downloaded messages waiting to be parsed')
     
     args = parser.parse_args()
     
@@ -24,15 +35,21 @@ def main():
         return
     
     # Create tracker instance
-    tracker = JobApplicationTracker(db_path="data/job_applications.db", csv_path="data/job_applications.csv")
+    tracker = JobApplicationTracker(db_path="data/job_applications.db", csv_path="data/job_applications.csv",
+                                    fetch_workers=args.fetch_workers, parse_workers=args.parse_workers,
+                                    ref_queue_size=args.fetch_queue_size, parse_queue_size=args.parse_queue_size)
     
     # Extract applications with provided query
     print("Extracting job applications from Gmail...")
-    applications = tracker.extract_applications(query=args.query)
+    try:
+        applications = tracker.extract_applications(query=args.query, incremental=not args.full_resync)
+    except SyncFailed as e:
+        print(f"\n❌ {e}")
+        sys.exit(1)
     
     # Save to CSV
     print("\nSaving to CSV file...")
-    tracker.save_to_csv()
+    tracker.save_to_csv(incremental=args.append_csv, compress=args.gzip_csv)
     
     # Print stats
     tracker.print_stats()
@@ -1,7 +1,11 @@
+import argparse
+import asyncio
 import sqlite3
 import time
 import sys
-from job_Des import extract_job_descriptions_parallel  # Import your function
+from scrape_cache import ScrapeCache
+from job_Des import annotate_results
+from scrape_engine import AsyncScrapeEngine, scrape_job_descriptions  # Import your function
 
 def fetch_job_urls():
     """Fetch job URLs from the SQLite database."""
@@ -49,7 +53,67 @@ def save_extracted_skills(job_url, skills):
     conn.commit()
     conn.close()
 
+def scrape_bookmarks_job(job, batch_size=16):
+    """
+    Background-job version of this script (run by app_four's job queue).
+
+    Scrapes every bookmarked URL the job hasn't finished yet, in batches of
+    batch_size: each batch is keyword-annotated, its skills saved and its
+    results reported with job.add_result, so progress survives a restart.
+    Accepts the same cache settings as the CLI in job.params.
+    """
+    ensure_skills_column()
+    job_urls = list(dict.fromkeys(fetch_job_urls()))
+    job.set_total(len(job_urls))
+    pending = [url for url in job_urls if url not in job.done]
+
+    no_cache = job.params.get("no_cache", False)
+    cache = None if no_cache else ScrapeCache("scrape_cache.db", ttl=job.params.get("cache_ttl", 7 * 24) * 3600,
+                                              max_entries=job.params.get("cache_max_entries", 5000))
+    engine = AsyncScrapeEngine(max_concurrency=16, per_domain_concurrency=2, browser_workers=4,
+                               cache=cache, analyze=False)
+
+    def store(batch):
+        annotate_results([result for _, result in batch])
+        for url, result in batch:
+            skills = sorted(set(result["description_keywords"]) | set(result["requirements_keywords"]))
+            if result["description"]:
+                save_extracted_skills(url, skills)
+            job.add_result(url, {
+                "url": url,
+                "title": result["title"],
+                "tier": result["tier"],
+                "skills": skills,
+                "error": result.get("error")
+            })
+
+    async def run():
+        batch = []
+        async for url, result in engine.scrape(pending):
+            batch.append((url, result))
+            if len(batch) >= batch_size:
+                store(batch)
+                batch = []
+            if job.stopping:
+                return
+        if batch:
+            store(batch)
+
+    try:
+        asyncio.run(run())
+    finally:
+        if cache is not None:
+            cache.close()
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape bookmarked job pages and store their skills")
+    parser.add_argument("--cache-ttl", type=float, default=7 * 24,
+                        help="Hours a cached page is served without revalidating (default: 168)")
+    parser.add_argument("--cache-max-entries", type=int, default=5000,
+                        help="Maximum cached pages; least recently used are evicted (default: 5000)")
+    parser.add_argument("--no-cache", action="store_true", help="Scrape every page without the cache")
+    args = parser.parse_args()
+
     ensure_skills_column()  # Make sure the 'skills' column exists
 
     job_urls = fetch_job_urls()
@@ -58,9 +122,16 @@ if __name__ == "__main__":
         print("No job URLs found in the database.")
         sys.exit(1)
 
-    # Fast parallel extraction
+    # Concurrent extraction, polite per job board
+    cache = None if args.no_cache else ScrapeCache("scrape_cache.db", ttl=args.cache_ttl * 3600,
+                                                   max_entries=args.cache_max_entries)
     start_time = time.time()
-    results = extract_job_descriptions_parallel(job_urls, max_workers=4)
+    try:
+        results = scrape_job_descriptions(job_urls, max_concurrency=16, per_domain_concurrency=2,
+                                          browser_workers=4, cache=cache)
+    finally:
+        if cache is not None:
+            cache.close()
     end_time = time.time()
 
     # Final summary
@@ -71,6 +142,7 @@ if __name__ == "__main__":
         if result["description"]:
             print(f"\nJob Title: {result['title']}")
             print(f"URL: {url}")
+            print(f"Served by: {result['tier']}")
             print(f"Description Keywords: {result['description_keywords']}")
             print(f"Requirements Keywords: {result['requirements_keywords']}")
 
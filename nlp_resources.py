@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lazily loaded NLP models and corpora, shared by everything in the process.
+
+Nothing is imported, loaded or downloaded when this module is imported. A
+resource is built by its loader the first time get() asks for it and cached
+from then on. NLTK data is only downloaded if it is missing at that point.
+Servers can call warm_up() at boot to pay the cost before the first request.
+"""
+
+import threading
+
+_loaders = {}
+_resources = {}
+_lock = threading.RLock()
+
+
+def register(name, loader):
+    """Register a zero-argument loader for `name`; it runs on the first get(name)."""
+    _loaders[name] = loader
+
+
+def get(name):
+    """The resource called `name`, loading it on first use."""
+    try:
+        return _resources[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _resources:
+            _resources[name] = _loaders[name]()
+        return _resources[name]
+
+
+def is_loaded(name):
+    return name in _resources
+
+
+def warm_up(*names):
+    """Load the named resources (all registered ones if none are given) now."""
+    for name in names or list(_loaders):
+        get(name)
+
+
+def _nltk_data(path, package):
+    """Make sure an NLTK data package is available, downloading it only if missing."""
+    import nltk  # type: ignore
+    try:
+        nltk.data.find(path)
+    except LookupError:
+        nltk.download(package, quiet=True)
+
+
+def _load_spacy_model():
+    import spacy  # type: ignore
+    return spacy.load("en_core_web_sm")
+
+
+def _load_sentencizer():
+    # Rule-based sentence splitter; far cheaper than a full parse
+    import spacy  # type: ignore
+    sentencizer = spacy.blank("en")
+    sentencizer.add_pipe("sentencizer")
+    return sentencizer
+
+
+def _load_stopwords():
+    _nltk_data("corpora/stopwords", "stopwords")
+    from nltk.corpus import stopwords  # type: ignore
+    return frozenset(stopwords.words("english"))
+
+
+def _load_word_tokenize():
+    _nltk_data("tokenizers/punkt_tab", "punkt_tab")
+    from nltk.tokenize import word_tokenize  # type: ignore
+    return word_tokenize
+
+
+register("spacy_en", _load_spacy_model)
+register("sentencizer", _load_sentencizer)
+register("nltk_stopwords", _load_stopwords)
+register("word_tokenize", _load_word_tokenize)
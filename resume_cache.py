@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def upload_key(data, taxonomy_version):
+    """Cache key for an upload: SHA-256 of its bytes plus the taxonomy version it was analyzed with."""
+    return f"{hashlib.sha256(data).hexdigest()}:{taxonomy_version}"
+
+
+class ResumeResultCache:
+    """
+    Two-tier cache of resume analysis results keyed by upload_key().
+
+    The first tier is an in-process LRU of up to `max_entries` results. If
+    `db_path` is given, results are also written to SQLite (LRU-trimmed to
+    `max_disk_entries`) so they survive restarts and are shared between workers.
+    Keys embed the taxonomy version, so a taxonomy change simply stops hitting
+    old entries and they age out.
+    """
+
+    def __init__(self, max_entries=256, db_path=None, max_disk_entries=10000):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS resume_results (
+                    key TEXT PRIMARY KEY,
+                    result TEXT,
+                    created_at REAL,
+                    last_accessed REAL
+                )
+            ''')
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_resume_results_last_accessed ON resume_results (last_accessed)")
+            self._conn.commit()
+
+    def get(self, key):
+        """The cached result for key, or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            if self._conn is not None:
+                row = self._conn.execute("SELECT result FROM resume_results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE resume_results SET last_accessed = ? WHERE key = ?", (time.time(), key))
+                    self._conn.commit()
+                    result = json.loads(row[0])
+                    self._remember(key, result)
+                    self.disk_hits += 1
+                    return result
+            self.misses += 1
+            return None
+
+    def put(self, key, result):
+        with self._lock:
+            self._remember(key, result)
+            if self._conn is not None:
+                now = time.time()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO resume_results (key, result, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(result), now, now)
+                )
+                excess = self._conn.execute("SELECT COUNT(*) FROM resume_results").fetchone()[0] - self.max_disk_entries
+                if excess > 0:
+                    self._conn.execute('''
+                        DELETE FROM resume_results WHERE key IN (
+                            SELECT key FROM resume_results ORDER BY last_accessed LIMIT ?
+                        )
+                    ''', (excess,))
+                self._conn.commit()
+
+    def _remember(self, key, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / total if total else 0.0,
+                "entries": len(self._entries)
+            }
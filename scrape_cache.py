@@ -0,0 +1,83 @@
+import sqlite3
+import threading
+import time
+
+
+class ScrapeCache:
+    """
+    On-disk cache of scraped job pages, keyed by URL.
+
+    Stores the raw title and description plus the HTTP validators (ETag /
+    Last-Modified) and fetch time. Entries younger than `ttl` seconds are served
+    as-is; older ones are revalidated with a conditional request. The least
+    recently used entries are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, db_path="scrape_cache.db", ttl=7 * 24 * 60 * 60, max_entries=5000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_cache (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                description TEXT,
+                tier TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                last_accessed REAL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_scrape_cache_last_accessed ON scrape_cache (last_accessed)")
+        self._conn.commit()
+
+    def get(self, url):
+        """Return the cached entry for url as a dict (marking it recently used), or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM scrape_cache WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE scrape_cache SET last_accessed = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+            return dict(row)
+
+    def is_fresh(self, entry):
+        """True if an entry is within the TTL and can be served without revalidating."""
+        return entry is not None and time.time() - entry["fetched_at"] < self.ttl
+
+    def put(self, url, title, description, tier, etag=None, last_modified=None):
+        """Store a freshly scraped page."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO scrape_cache
+                (url, title, description, tier, etag, last_modified, fetched_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (url, title, description, tier, etag, last_modified, now, now))
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url):
+        """Restart an entry's TTL after the server confirmed it is unchanged (304)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE scrape_cache SET fetched_at = ?, last_accessed = ? WHERE url = ?",
+                               (now, now, url))
+            self._conn.commit()
+
+    def _evict(self):
+        excess = self._conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute('''
+                DELETE FROM scrape_cache WHERE url IN (
+                    SELECT url FROM scrape_cache ORDER BY last_accessed LIMIT ?
+                )
+            ''', (excess,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,156 @@
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+
+from job_Des import WebDriverPool, _build_result, annotate_results, get_job_description
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts of up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def domain_of(url):
+    """Politeness key for a URL: its host without a leading www."""
+    domain = urlparse(url).netloc.lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+def failed_result(error):
+    return {
+        "title": None,
+        "description": None,
+        "description_keywords": [],
+        "requirements_text": None,
+        "requirements_keywords": [],
+        "tier": None,
+        "error": error
+    }
+
+
+class AsyncScrapeEngine:
+    """
+    Asyncio scraping engine with a global concurrency cap and per-domain politeness.
+
+    Every domain gets its own semaphore and token bucket, so adding URLs from many
+    boards raises throughput while no single board sees more than
+    per_domain_concurrency requests in flight or more than per_domain_rate per
+    second. The scrape itself (HTTP tier, then Chrome) is blocking and runs on a
+    thread pool; Chrome work is further limited by the WebDriverPool size. With a
+    ScrapeCache, fresh entries are answered before any limit is taken. With
+    analyze=False results carry no keywords yet (see annotate_results).
+    """
+
+    def __init__(self, max_concurrency=16, per_domain_concurrency=2, per_domain_rate=1.0,
+                 per_domain_burst=2, timeout=60, browser_workers=4, cache=None, analyze=True):
+        self.max_concurrency = max_concurrency
+        self.per_domain_concurrency = per_domain_concurrency
+        self.per_domain_rate = per_domain_rate
+        self.per_domain_burst = per_domain_burst
+        self.timeout = timeout
+        self.browser_workers = browser_workers
+        self.cache = cache
+        self.analyze = analyze
+
+    async def scrape(self, job_urls):
+        """Async iterator of (url, result) pairs, in completion order."""
+        loop = asyncio.get_running_loop()
+        global_slots = asyncio.Semaphore(self.max_concurrency)
+        domain_slots = defaultdict(lambda: asyncio.Semaphore(self.per_domain_concurrency))
+        domain_buckets = defaultdict(lambda: TokenBucket(self.per_domain_rate, self.per_domain_burst))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency)
+        pool = WebDriverPool(size=self.browser_workers)
+        scrape = functools.partial(get_job_description, pool=pool, cache=self.cache, analyze=self.analyze)
+
+        async def scrape_one(url):
+            if self.cache is not None:
+                cached = self.cache.get(url)
+                if self.cache.is_fresh(cached):
+                    return url, _build_result(cached["title"], cached["description"], "cache", self.analyze)
+            domain = domain_of(url)
+            # Take the domain's slot and rate token before a global slot, so URLs
+            # waiting on a busy domain never hold capacity other domains could use.
+            domain_slot = domain_slots[domain]
+            await domain_slot.acquire()
+            try:
+                await domain_buckets[domain].acquire()
+                await global_slots.acquire()
+            except BaseException:
+                domain_slot.release()
+                raise
+            future = loop.run_in_executor(executor, scrape, url)
+            # A timed-out scrape keeps running on its thread (and maybe a browser), so
+            # the slots are only given back once it has actually finished
+            future.add_done_callback(lambda _: (global_slots.release(), domain_slot.release()))
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                print(f"⚠️ Timed out scraping {url} after {self.timeout}s")
+                result = failed_result("timeout")
+            return url, result
+
+        tasks = [asyncio.ensure_future(scrape_one(url)) for url in dict.fromkeys(job_urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Timed-out scrapes may still be running; don't block on them, but only
+            # close the pool once they are done so their drivers don't go back into it
+            executor.shutdown(wait=False, cancel_futures=True)
+            threading.Thread(target=self._close_when_finished, args=(executor, pool),
+                             name="scrape-engine-close").start()
+
+    @staticmethod
+    def _close_when_finished(executor, pool):
+        executor.shutdown(wait=True)
+        pool.close()
+
+
+def scrape_job_descriptions(job_urls, batch_size=64, n_process=1, **engine_options):
+    """
+    Synchronous wrapper around AsyncScrapeEngine.
+
+    Keywords are extracted after scraping, in one nlp.pipe batch over all
+    descriptions (see job_Des.analyze_descriptions), instead of per URL.
+
+    Returns:
+        dict: Dictionary mapping URLs to their results (description and keywords)
+    """
+    engine = AsyncScrapeEngine(analyze=False, **engine_options)
+
+    async def collect():
+        results = {}
+        async for url, result in engine.scrape(job_urls):
+            results[url] = result
+            if result["description"]:
+                print(f"Scraped ({result['tier']}): {url}")
+            else:
+                print(f"Failed: {url}")
+        return results
+
+    results = asyncio.run(collect())
+    annotate_results(results.values(), batch_size, n_process)
+    return results
@@ -0,0 +1,187 @@
+import concurrent.futures
+import json
+import sqlite3
+import threading
+import time
+
+# Hits update last_accessed in memory; the times are written once this many are
+# pending or this many seconds have passed, and before every insert and eviction
+ACCESS_FLUSH_SIZE = 500
+ACCESS_FLUSH_INTERVAL = 60
+
+
+def query_key(params):
+    """
+    Cache key for a set of SerpAPI params: the query text lowercased with
+    whitespace collapsed, every other param as given, sorted and without api_key.
+    """
+    normalized = {name: value for name, value in params.items() if name != "api_key"}
+    if "q" in normalized:
+        normalized["q"] = " ".join(str(normalized["q"]).lower().split())
+    return json.dumps(normalized, sort_keys=True)
+
+
+class SerpQueryCache:
+    """
+    On-disk cache of SerpAPI responses keyed by query_key().
+
+    Responses younger than `ttl` seconds are served as-is. For a further
+    `stale_ttl` seconds they are still served immediately, but a background
+    refresh is queued; at most `refresh_workers` refreshes run at once. Anything
+    older is fetched again. Concurrent lookups of
+    the same key share a single upstream call. The least recently used entries
+    are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, db_path="serp_cache.db", ttl=24 * 60 * 60, stale_ttl=7 * 24 * 60 * 60, max_entries=5000,
+                 refresh_workers=2):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+        self._inflight = {}
+        self._queued = set()  # Keys whose refresh is submitted but hasn't started
+        self._accessed = {}
+        self._accessed_flushed_at = time.time()
+        self._lock = threading.Lock()
+        # Each stale key is queued once (see _inflight), so the backlog is bounded by the cache size
+        self._refresher = concurrent.futures.ThreadPoolExecutor(max_workers=refresh_workers,
+                                                                thread_name_prefix="serp-refresh")
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS serp_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT,
+                fetched_at REAL,
+                last_accessed REAL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_serp_cache_last_accessed ON serp_cache (last_accessed)")
+        self._conn.commit()
+
+    def get_or_fetch(self, params, fetch):
+        """
+        The response for params, calling fetch(params) only when the cache can't
+        answer. Errors from fetch are raised to every caller waiting on it and
+        are not cached.
+        """
+        key = query_key(params)
+        with self._lock:
+            row = self._conn.execute("SELECT response, fetched_at FROM serp_cache WHERE key = ?", (key,)).fetchone()
+            age = time.time() - row[1] if row is not None else None
+            if age is not None and age < self.ttl + self.stale_ttl:
+                now = self._accessed[key] = time.time()
+                if len(self._accessed) >= ACCESS_FLUSH_SIZE or now - self._accessed_flushed_at >= ACCESS_FLUSH_INTERVAL:
+                    self._flush_access_times()
+                    self._conn.commit()
+                if age < self.ttl:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    if key not in self._inflight:
+                        self._refresher.submit(self._refresh, key, params, fetch)
+                        self._inflight[key] = concurrent.futures.Future()
+                        self._queued.add(key)
+                return json.loads(row[0])
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                future = self._inflight[key] = concurrent.futures.Future()
+                leader = True
+
+        if leader:
+            self._fetch(key, params, fetch, future)
+        return future.result()
+
+    def _fetch(self, key, params, fetch, future):
+        """Call upstream for key and publish the outcome to everyone waiting on future."""
+        try:
+            response = fetch(params)
+        except Exception as e:
+            with self._lock:
+                self.upstream_calls += 1
+                self.upstream_errors += 1
+                del self._inflight[key]
+            future.set_exception(e)
+            return
+        with self._lock:
+            self.upstream_calls += 1
+            now = time.time()
+            self._accessed.pop(key, None)
+            self._flush_access_times()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO serp_cache (key, response, fetched_at, last_accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(response), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+            del self._inflight[key]
+        future.set_result(response)
+
+    def _refresh(self, key, params, fetch):
+        with self._lock:
+            self._queued.discard(key)
+            future = self._inflight[key]
+        self._fetch(key, params, fetch, future)
+        if future.exception() is not None:
+            # The stale entry keeps being served until a refresh succeeds or it expires
+            print(f"[WARNING] Background refresh failed for {key}: {future.exception()}")
+
+    def _flush_access_times(self):
+        """Write the access times recorded since the last flush; the caller commits."""
+        if self._accessed:
+            self._conn.executemany("UPDATE serp_cache SET last_accessed = ? WHERE key = ?",
+                                   [(accessed, key) for key, accessed in self._accessed.items()])
+            self._accessed.clear()
+        self._accessed_flushed_at = time.time()
+
+    def _evict(self):
+        excess = self._conn.execute("SELECT COUNT(*) FROM serp_cache").fetchone()[0] - self.max_entries
+        if excess > 0:
+            self._conn.execute('''
+                DELETE FROM serp_cache WHERE key IN (
+                    SELECT key FROM serp_cache ORDER BY last_accessed LIMIT ?
+                )
+            ''', (excess,))
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+            entries = self._conn.execute("SELECT COUNT(*) FROM serp_cache").fetchone()[0]
+            return {
+                "lookups": lookups,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "upstream_calls": self.upstream_calls,
+                "upstream_errors": self.upstream_errors,
+                "quota_saved": lookups - self.upstream_calls,
+                "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+                "entries": entries,
+                "in_flight": len(self._inflight)
+            }
+
+    def close(self):
+        """
+        Drop queued refreshes, wait for running ones, then close the database.
+        Lookups waiting on a dropped refresh get a RuntimeError.
+        """
+        self._refresher.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for key in self._queued:
+                self._inflight.pop(key).set_exception(RuntimeError(f"SERP cache closed before refreshing {key}"))
+            self._queued.clear()
+            self._flush_access_times()
+            self._conn.commit()
+            self._conn.close()
@@ -1,45 +1,140 @@
 import sqlite3
-import pdfplumber
-import re
 import os
+from urllib.parse import urlparse
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from doc_extraction import extract_pdfplumber_text
+from skill_matcher import SkillIndex
 
-def fetch_extracted_job_skills():
-    """Fetch job skills per URL from 'bookmarks.db' (Forces database refresh)."""
-    conn = sqlite3.connect("bookmarks.db")
-    conn.row_factory = sqlite3.Row  # Ensures row data is fetched fresh
-    cursor = conn.cursor()
+MAX_RESUME_PAGES = 20
 
-    cursor.execute("SELECT url, skills FROM bookmarks")
+class SkillGapEngine:
+    """
+    Scores one resume against every job at once.
     
-    job_skills_per_url = {}
-    
-    for row in cursor.fetchall():
-        url, skills = row
-        if skills:  
-            skills_list = skills.split(",")  
-            job_skills_per_url[url] = set(skill.strip().lower() for skill in skills_list)
-
-    conn.close()
-    return job_skills_per_url  
-
-def extract_skills_from_resume(resume_path):
-    """Extract all skills present in the resume."""
-    with pdfplumber.open(resume_path) as pdf:
-        text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
-    
-    return set(re.findall(r"\b\w+\b", text.lower()))  # Extract all words as possible skills
+    Each job's skills become a row of a sparse binary matrix over the vocabulary
+    of all job skills, and a resume becomes a binary vector over the same
+    vocabulary. Matches per job are one sparse matrix-vector product; missing
+    skills are the job matrix with the resume's columns zeroed out.
+    """
+
+    def __init__(self, job_skills_per_url, titles=None):
+        self.urls = list(job_skills_per_url)
+        self.titles = titles or {}
+        self.vocabulary = sorted(set().union(*job_skills_per_url.values()))
+        self.columns = {skill: i for i, skill in enumerate(self.vocabulary)}
+
+        indptr = [0]
+        indices = []
+        for url in self.urls:
+            indices.extend(sorted(self.columns[skill] for skill in job_skills_per_url[url]))
+            indptr.append(len(indices))
+        self.jobs = csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(self.urls), len(self.vocabulary))
+        )
+        self.job_sizes = np.diff(indptr)
+        # Job board of each job, as ids into self.source_names
+        self.source_names, self.source_ids = np.unique(
+            [urlparse(url).netloc or "other" for url in self.urls], return_inverse=True
+        )
+        self._skill_names = np.array(self.vocabulary, dtype=object)
+        self._skill_index = None
+
+    @classmethod
+    def from_database(cls, db_path="bookmarks.db"):
+        """Build the engine from the skills column written by main_script.save_extracted_skills."""
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute("SELECT url, title, skills FROM bookmarks WHERE skills IS NOT NULL AND skills != ''").fetchall()
+        finally:
+            conn.close()
+        job_skills_per_url = {}
+        titles = {}
+        for url, title, skills in rows:
+            skill_set = set(skill.strip().lower() for skill in skills.split(",")) - {""}
+            if skill_set:
+                job_skills_per_url[url] = skill_set
+                titles[url] = title
+        return cls(job_skills_per_url, titles)
+
+    def resume_vector(self, resume_skills):
+        """Binary vector of the resume's skills; skills no job asks for are dropped."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        columns = [self.columns[skill] for skill in (s.strip().lower() for s in resume_skills) if skill in self.columns]
+        vector[columns] = 1
+        return vector
+
+    def skills_in_text(self, text):
+        """Job-vocabulary skills mentioned in free text (e.g. a resume), matched on word boundaries."""
+        if self._skill_index is None:
+            self._skill_index = SkillIndex([(skill, "job") for skill in self.vocabulary])
+        return {match.skill for match in self._skill_index.find_all(text)}
+
+    def analyze(self, resume_skills, limit=None):
+        """
+        Match the resume against every job.
+        
+        Returns (ranked, percentages, missing, have): the row numbers of the best
+        `limit` jobs (all if None), highest match percentage first and then most
+        matched skills; every job's match percentage; and sparse job x skill
+        matrices of the required skills the resume lacks and has.
+        """
+        vector = self.resume_vector(resume_skills)
+        matched = self.jobs @ vector
+        percentages = 100.0 * matched / self.job_sizes
+        ranked = np.lexsort((np.arange(len(self.urls)), -matched, -percentages))
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        have = (self.jobs @ diags(vector)).tocsr()
+        missing = (self.jobs @ diags(1 - vector)).tocsr()
+        for matrix in (have, missing):
+            matrix.eliminate_zeros()
+            matrix.sort_indices()
+        return ranked, percentages, missing, have
+
+    def source_of(self, row):
+        return str(self.source_names[self.source_ids[row]])
+
+    def source_stats(self, percentages, threshold):
+        """{source: (jobs, jobs matching at least `threshold` percent)} over all jobs."""
+        totals = np.bincount(self.source_ids, minlength=len(self.source_names))
+        matched = np.bincount(self.source_ids, weights=percentages >= threshold, minlength=len(self.source_names))
+        return {str(name): (int(total), int(hits)) for name, total, hits in zip(self.source_names, totals, matched)}
+
+    def row_skills(self, matrix, row):
+        """Skill names in one row of a job x skill matrix."""
+        return self._skill_names[matrix.indices[matrix.indptr[row]:matrix.indptr[row + 1]]].tolist()
+
+    def common_missing(self, missing, rows, count=5):
+        """The `count` skills missing from the most of the given jobs, with how many jobs miss each."""
+        totals = np.asarray(missing[rows].sum(axis=0)).ravel()
+        top = np.argsort(-totals, kind="stable")[:count]
+        return [(self.vocabulary[i], int(totals[i])) for i in top if totals[i] > 0]
+
+_engine_cache = {}
+
+def load_engine(db_path="bookmarks.db"):
+    """SkillGapEngine for db_path, rebuilt only when the database file has changed."""
+    stat = os.stat(db_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _engine_cache.get(db_path)
+    if cached is None or cached[0] != version:
+        cached = (version, SkillGapEngine.from_database(db_path))
+        _engine_cache[db_path] = cached
+    return cached[1]
 
 def skill_gap_analysis(resume_path):
     """Compare resume skills against each job URL."""
-    job_skills_per_url = fetch_extracted_job_skills()  # Get skills per job link
-    print(job_skills_per_url)
-    resume_skills = extract_skills_from_resume(resume_path)  # Extract resume skills
+    engine = load_engine()
+    text = extract_pdfplumber_text(resume_path, MAX_RESUME_PAGES)
+    resume_skills = engine.skills_in_text(text)  # Job skills the resume mentions
 
+    ranked, _, missing, _ = engine.analyze(resume_skills)
     missing_skills_per_url = {}
-
-    for url, job_skills in job_skills_per_url.items():
-        missing_skills = job_skills - resume_skills  # Skills required but not in resume
-        missing_skills_per_url[url] = missing_skills  # Store even if empty
+    for row in ranked:
+        missing_skills_per_url[engine.urls[row]] = set(engine.row_skills(missing, row))  # Store even if empty
 
     return missing_skills_per_url
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import re
+from collections import namedtuple
+
+SkillMatch = namedtuple("SkillMatch", ["skill", "category", "start", "end"])
+
+_word_boundary = re.compile(r"\b")
+
+
+def _trie_pattern(node):
+    """
+    Regex for a character trie. Longer continuations are tried before ending, and
+    a skill may only end at a word boundary, so the pattern matches the longest
+    skill that is followed by a boundary.
+    """
+    alternatives = [re.escape(char) + _trie_pattern(node[char]) for char in sorted(key for key in node if key is not None)]
+    if None in node:
+        alternatives.append(r"\b")
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+class SkillIndex:
+    """
+    Boundary-aware multi-pattern matcher over a skill taxonomy.
+
+    All skills are compiled into a single regex shaped like a trie, so a scan costs
+    the same however many skills there are. A skill matches where `\\b<skill>\\b`
+    would, case-insensitively.
+
+    `entries` is an ordered list of (skill, category) pairs. `version` is a hash
+    of them, so results derived from one taxonomy can be told apart from another's.
+    """
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.version = hashlib.sha256(json.dumps(self.entries).encode()).hexdigest()[:16]
+        self._categories = {}
+        trie = {}
+        for skill, category in self.entries:
+            skill = skill.lower()
+            self._categories.setdefault(skill, []).append(category)
+            node = trie
+            for char in skill:
+                node = node.setdefault(char, {})
+            node[None] = skill
+
+        # A scan reports the longest skill at each position; shorter skills that
+        # are prefixes of it may match there too and are checked separately.
+        self._prefixes = {}
+        for skill in self._categories:
+            node = trie
+            prefixes = []
+            for char in skill[:-1]:
+                node = node[char]
+                if None in node:
+                    prefixes.append(node[None])
+            self._prefixes[skill] = prefixes[::-1]
+        self._pattern = re.compile(r"(?=\b(" + _trie_pattern(trie) + "))") if trie else None
+
+    def find_all(self, text):
+        """Every skill occurrence in text as SkillMatch tuples, in text order. Offsets index text.lower()."""
+        if self._pattern is None:
+            return []
+        text = text.lower()
+        matches = []
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            longest = match.group(1)
+            for skill in [longest] + self._prefixes[longest]:
+                end = start + len(skill)
+                if _word_boundary.match(text, end):
+                    for category in self._categories[skill]:
+                        matches.append(SkillMatch(skill, category, start, end))
+        return matches
+
+    def matched_entries(self, text):
+        """The (skill, category) entries found in text, in taxonomy order."""
+        found = {(match.skill, match.category) for match in self.find_all(text)}
+        return [(skill, category) for skill, category in self.entries if (skill.lower(), category) in found]
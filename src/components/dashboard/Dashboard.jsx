@@ -125,6 +125,9 @@ const Dashboard = () => {
   const [resourcesLoading, setResourcesLoading] = useState(true);
   const [selectedRole, setSelectedRole] = useState('data analyst');
   const [jobsFromGmail, setJobsFromGmail] = useState([]);
+  const [gmailCursor, setGmailCursor] = useState(null);
+  const [gmailLoadingMore, setGmailLoadingMore] = useState(false);
+  const [gmailStats, setGmailStats] = useState({ total: 0, status_counts: {} });
   const [apiResources, setApiResources] = useState({});
   const [isLoadingResources, setIsLoadingResources] = useState(false);
   
@@ -272,19 +275,48 @@ const getSkillResources = useCallback(async (skillOrRole, isRole = false) => {
     }
   }, [resumeFile]);
 
+  // One page of Gmail applications; pass the previous page's next_cursor for the next one
+  const fetchGmailPage = async (cursor) => {
+    const params = new URLSearchParams({ limit: "100" });
+    if (cursor) params.set("cursor", cursor);
+    const response = await fetch(`http://localhost:5004/api/applications?${params}`);
+    if (!response.ok) throw new Error("Failed to fetch Gmail applications");
+    return response.json();
+  };
+
   const fetchGmailApplications = useCallback(async () => {
     try {
-      const response = await fetch("http://localhost:5004/api/applications");
-      if (!response.ok) throw new Error("Failed to fetch Gmail applications");
-  
-      const data = await response.json();
-      console.log("Gmail Applications:", data); // for debugging
-      setJobsFromGmail(data.applications || []);
+      // Counts come from the stats endpoint; only the first page of rows is loaded up front
+      const [statsResponse, page] = await Promise.all([
+        fetch("http://localhost:5004/api/applications/stats"),
+        fetchGmailPage(null)
+      ]);
+      if (!statsResponse.ok) throw new Error("Failed to fetch Gmail application stats");
+      const stats = await statsResponse.json();
+
+      console.log("Gmail Applications:", page.applications); // for debugging
+      setGmailStats({ total: stats.total || 0, status_counts: stats.status_counts || {} });
+      setJobsFromGmail(page.applications || []);
+      setGmailCursor(page.next_cursor);
     } catch (error) {
       console.error("Error fetching Gmail applications:", error);
       toast.error("Could not load Gmail job applications.");
     }
   }, []);
+
+  const loadMoreGmailApplications = async () => {
+    setGmailLoadingMore(true);
+    try {
+      const page = await fetchGmailPage(gmailCursor);
+      setJobsFromGmail(prev => [...prev, ...(page.applications || [])]);
+      setGmailCursor(page.next_cursor);
+    } catch (error) {
+      console.error("Error fetching Gmail applications:", error);
+      toast.error("Could not load more Gmail job applications.");
+    } finally {
+      setGmailLoadingMore(false);
+    }
+  };
   
   // Perform skill gap analysis with improved matching
   const performSkillGapAnalysis = useCallback(async () => {
@@ -556,10 +588,39 @@ const getSkillResources = useCallback(async (skillOrRole, isRole = false) => {
     setResourcesLoading(true);
     
     if (forceRefresh) {
-      const response = await fetch("http://127.0.0.1:5003/resources_for_all_bookmarks");
-      if (!response.ok) {
-        throw new Error(`Failed to refresh resources: ${response.statusText}`);
+      // Enrichment runs as a background job; results stream in as each title finishes
+      const submit = await fetch("http://127.0.0.1:5003/jobs/enrich_bookmarks", { method: "POST" });
+      if (!submit.ok) {
+        throw new Error(`Failed to refresh resources: ${submit.statusText}`);
       }
+      const { job_id } = await submit.json();
+      await new Promise((resolve, reject) => {
+        const events = new EventSource(`http://127.0.0.1:5003/jobs/${job_id}/events`);
+        events.addEventListener("result", (event) => {
+          const { result } = JSON.parse(event.data);
+          setResourcesData((previous) => [
+            ...previous.filter((item) => !result.titles.includes(item.title)),
+            ...result.titles.map((title) => ({ title, resources: result.resources }))
+          ]);
+        });
+        events.addEventListener("status", (event) => {
+          const job = JSON.parse(event.data);
+          if (job.status === "done") {
+            events.close();
+            resolve();
+          } else if (job.status === "failed") {
+            events.close();
+            reject(new Error(job.error));
+          }
+        });
+        events.addEventListener("error", (event) => {
+          // Network errors reconnect on their own (resuming via Last-Event-ID); only give up on closed streams
+          if (event.data || events.readyState === EventSource.CLOSED) {
+            events.close();
+            reject(new Error(event.data ? JSON.parse(event.data).error : "Lost connection to job"));
+          }
+        });
+      });
       toast.success("Resources updated successfully!");
     }
 
@@ -715,11 +776,13 @@ const getSkillResources = useCallback(async (skillOrRole, isRole = false) => {
   };
 
   // Job Statistics
-  const combinedJobs = [...jobs, ...jobsFromGmail];
-  const totalApplications = combinedJobs.length;
-  const interviewScheduled = combinedJobs.filter(job => job.status === "Interview Scheduled").length;
-  const offersReceived = combinedJobs.filter(job => job.status === "Offer Received").length;
-  const rejectedApplications = combinedJobs.filter(job => job.status === "Rejected").length;
+  // Gmail applications are loaded a page at a time, so their counts come from the stats endpoint
+  const countStatus = (status) =>
+    jobs.filter(job => job.status === status).length + (gmailStats.status_counts[status] || 0);
+  const totalApplications = jobs.length + gmailStats.total;
+  const interviewScheduled = countStatus("Interview Scheduled");
+  const offersReceived = countStatus("Offer Received");
+  const rejectedApplications = countStatus("Rejected");
 
   
   return (
@@ -1277,11 +1340,22 @@ const getSkillResources = useCallback(async (skillOrRole, isRole = false) => {
               </div>
             ))}
           </div>
+          {gmailCursor && (
+            <div className="text-center mt-4">
+              <button
+                onClick={loadMoreGmailApplications}
+                disabled={gmailLoadingMore}
+                className="px-4 py-2 rounded bg-blue-500 text-white hover:bg-blue-600 disabled:opacity-50"
+              >
+                {gmailLoadingMore ? "Loading..." : "Load more"}
+              </button>
+            </div>
+          )}
         </>
       )}
 
       {activeTab === 'stats' && (
-        <JobStatsChart jobs={combinedJobs} />
+        <JobStatsChart jobs={jobs} extraCounts={gmailStats} />
       )}
 
       {/* Chatbot */}
@@ -1,7 +1,8 @@
 import { useState, useEffect } from 'react';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
 
-const JobStatsChart = ({ jobs }) => {
+// extraCounts: { total, status_counts } for applications that are counted but not in `jobs`
+const JobStatsChart = ({ jobs, extraCounts = { total: 0, status_counts: {} } }) => {
   const [activeView, setActiveView] = useState('bar');
   const [statsData, setStatsData] = useState([]);
   
@@ -14,14 +15,16 @@ const JobStatsChart = ({ jobs }) => {
   };
   
   useEffect(() => {
-    if (!jobs || !jobs.length) return;
+    if ((!jobs || !jobs.length) && !extraCounts.total) return;
     
     // Calculate statistics
+    const countStatus = (status) =>
+      (jobs || []).filter(job => job.status === status).length + (extraCounts.status_counts[status] || 0);
 
-    const totalApplications = jobs.length;
-    const interviewScheduled = jobs.filter(job => job.status === "Interview Scheduled").length;
-    const offersReceived = jobs.filter(job => job.status === "Offer Received").length;
-    const rejectedApplications = jobs.filter(job => job.status === "Rejected").length;
+    const totalApplications = (jobs || []).length + extraCounts.total;
+    const interviewScheduled = countStatus("Interview Scheduled");
+    const offersReceived = countStatus("Offer Received");
+    const rejectedApplications = countStatus("Rejected");
     const applied = totalApplications - interviewScheduled - offersReceived - rejectedApplications;
     
     // Format data for charts
@@ -33,7 +36,7 @@ const JobStatsChart = ({ jobs }) => {
     ];
     
     setStatsData(data);
-  }, [jobs]);
+  }, [jobs, extraCounts]);
   
   // Custom tooltip for bar chart
   const CustomTooltip = ({ active, payload }) => {